@@ -18,6 +18,22 @@ Styling:
     hover_style_name - CSS class name for hover elements
     render_all_styles() - Generate CSS for hover effects
 
+Templates:
+    ChartTemplate - Layout rendered once, with the series of many datasets stamped into it
+
+Layouts:
+    ChartGrid - Small multiples in one svg, optionally faceted with a shared scale and frame
+    render_page() - Many charts and grids as one html or svg document with one stylesheet
+
+Instrumentation:
+    instrument() - Context manager reporting the duration and size of each phase and component
+    InstrumentationEvent - One reported phase or component
+
+Batch Rendering:
+    ChartSpec - Picklable description of a chart to construct and render
+    render_many() - Render many chart specs across a pool of worker processes
+    render_many_async() - Render many chart specs from an event loop with bounded concurrency
+
 Quick Start:
     >>> import pysvgchart as psc
     >>> chart = psc.DonutChart([25, 30, 20, 25], labels=['Q1', 'Q2', 'Q3', 'Q4'])
@@ -36,6 +52,11 @@ __author__ = "Alex Rowley"
 __email__ = ""
 __version__ = "0.8.1"
 
+from .batch import (
+    ChartSpec,
+    render_many,
+    render_many_async,
+)
 from .charts import (
     BarChart,
     CartesianChart,
@@ -48,11 +69,20 @@ from .charts import (
     SimpleLineChart,
     VerticalChart,
 )
+from .instrumentation import (
+    InstrumentationEvent,
+    instrument,
+)
+from .layouts import (
+    ChartGrid,
+    render_page,
+)
 from .shapes import (
     Circle,
     Line,
     Text,
 )
+from .templates import ChartTemplate
 from .styles import (
     hover_style_name,
     render_all_styles,
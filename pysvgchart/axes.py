@@ -16,6 +16,7 @@ Key responsibilities:
     - Axis title rendering
 
 The get_positions() method converts data values to pixel coordinates using the axis scale.
+Numpy arrays are positioned with a single vectorized transform when numpy is installed.
 """
 from __future__ import annotations
 from abc import abstractmethod
@@ -24,7 +25,24 @@ from typing import Any, Callable
 from .helpers import collapse_element_list
 from .scales import make_linear_scale
 from .shapes import Shape, Text, Line
-from .shared import number, style_def
+from .shared import is_array, number, style_def
+
+
+def array_positions(
+    proportions,
+    start: number,
+    length: number,
+    include_lower: bool = True,
+    include_upper: bool = True,
+) -> list[int | float | None]:
+    """
+    vectorized conversion of a numpy array of proportions to pixel positions, None if out of range
+    """
+    in_range = (proportions >= 0.0) if include_lower else (proportions > 0.0)
+    in_range &= (proportions <= 1.0) if include_upper else (proportions < 1.0)
+    positions = (start + proportions * length).astype(object)
+    positions[~in_range] = None
+    return positions.tolist()
 
 
 class Axis(Shape):
@@ -168,7 +186,9 @@ class XAxis(Axis):
             )
 
     def get_positions(self, values, include_axis=True) -> list[int | float | None]:
-        proportions_of_range = [self.scale.value_to_fraction(value) for value in values]
+        proportions_of_range = self.scale.value_to_fractions(values)
+        if is_array(proportions_of_range):
+            return array_positions(proportions_of_range, self.position.x, self.length, include_lower=include_axis)
         in_range = (
             (lambda prop: 0.0 <= prop <= 1.0) if include_axis else (lambda prop: 0.0 < prop <= 1.0)
         )
@@ -276,7 +296,10 @@ class YAxis(Axis):
             )
 
     def get_positions(self, values, include_axis=True) -> list[int | float | None]:
-        proportions_of_range = [1 - self.scale.value_to_fraction(value) for value in values]
+        fractions = self.scale.value_to_fractions(values)
+        if is_array(fractions):
+            return array_positions(1 - fractions, self.position.y, self.length, include_upper=include_axis)
+        proportions_of_range = [1 - fraction for fraction in fractions]
         in_range = (
             (lambda prop: 0.0 <= prop <= 1.0) if include_axis else (lambda prop: 0.0 <= prop < 1.0)
         )
@@ -295,7 +318,9 @@ class CategoryYAxis(YAxis):
 
     def get_positions(self, values, include_axis=True) -> list[int | float | None]:
         # Don't invert for categories - we want first category at top (y=0)
-        proportions_of_range = [self.scale.value_to_fraction(value) for value in values]
+        proportions_of_range = self.scale.value_to_fractions(values)
+        if is_array(proportions_of_range):
+            return array_positions(proportions_of_range, self.position.y, self.length, include_upper=include_axis)
         in_range = (
             (lambda prop: 0.0 <= prop <= 1.0) if include_axis else (lambda prop: 0.0 <= prop < 1.0)
         )
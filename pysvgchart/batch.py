@@ -0,0 +1,254 @@
+"""
+Batch rendering of many charts across worker processes or from an event loop.
+
+Charts are described by picklable specifications rather than built in the calling
+process, so that construction and rendering both happen in the workers.
+
+Classes:
+    ChartSpec: chart class (or its name), constructor kwargs, calls to make after
+               construction and render kwargs
+
+Functions:
+    parallel_map(function, items, workers, chunksize, ordered): Apply a function to items in a process pool
+    render_many(specs, workers, chunksize, ordered): Render specs in a process pool
+    render_many_async(specs, executor, concurrency): Render specs in an executor with bounded concurrency
+
+Example:
+    specs = [
+        psc.ChartSpec(
+            "SimpleLineChart",
+            {"x_values": [1, 2, 3], "y_values": [[10, 20, 15]]},
+            calls=[("add_legend", {}), ("add_grids", {"minor_y_ticks": 4})],
+        )
+        for _ in range(1000)
+    ]
+    for svg in psc.render_many(specs, workers=8):
+        ...
+"""
+import asyncio
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from inspect import isabstract
+from itertools import islice
+from typing import Any
+
+from . import charts
+from .charts import Chart
+
+
+def get_chart_type(chart_type: type[Chart] | str) -> type[Chart]:
+    """
+    chart class given itself or its name, e.g. "LineChart"
+    """
+    if isinstance(chart_type, str):
+        found = getattr(charts, chart_type, None)
+        if not (isinstance(found, type) and issubclass(found, Chart)) or isabstract(found):
+            raise ValueError(f"unknown chart type {chart_type!r}")
+        return found
+    return chart_type
+
+
+# methods configuring a chart that specs may call, specs coming from untrusted files too
+chart_calls = frozenset(
+    {
+        "add_custom_element",
+        "add_grids",
+        "add_hover_modifier",
+        "add_legend",
+        "add_x_grid",
+        "add_y_grid",
+        "modify_series",
+        "set_palette",
+        "set_single_path",
+    }
+)
+
+
+def normalise_call(call: str | tuple | list) -> tuple[str, tuple, dict]:
+    """
+    a post-construction call as (method name, args, kwargs), given as a name, (name, kwargs) or (name, args, kwargs)
+    """
+    if isinstance(call, str):
+        name, args, kwargs = call, (), {}
+    elif len(call) == 2:
+        name, args, kwargs = call[0], (), dict(call[1])
+    elif len(call) == 3:
+        name, args, kwargs = call[0], tuple(call[1]), dict(call[2])
+    else:
+        raise ValueError(f"cannot interpret chart call {call!r}")
+    if not isinstance(name, str) or name not in chart_calls:
+        raise ValueError(f"chart call {name!r} is not allowed, use any of {', '.join(sorted(chart_calls))}")
+    return name, args, kwargs
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    picklable description of a chart: what to construct, what to call on it and how to render it
+    """
+
+    chart_type: type[Chart] | str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    calls: Iterable[str | tuple | list] = ()
+    render_kwargs: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, spec: dict[str, Any]) -> "ChartSpec":
+        """
+        spec from a plain dict with keys "chart", "kwargs", "calls" and "render", e.g. parsed from JSON
+        """
+        unknown = set(spec) - {"chart", "kwargs", "calls", "render"}
+        if unknown:
+            raise ValueError(f"unknown chart spec keys {', '.join(sorted(map(repr, unknown)))}")
+        return cls(
+            chart_type=spec["chart"],
+            kwargs=spec.get("kwargs", {}),
+            calls=spec.get("calls", ()),
+            render_kwargs=spec.get("render", {}),
+        )
+
+    def build(self) -> Chart:
+        chart = get_chart_type(self.chart_type)(**self.kwargs)
+        for call in self.calls:
+            name, args, kwargs = normalise_call(call)
+            getattr(chart, name)(*args, **kwargs)
+        return chart
+
+    def render(self) -> str:
+        return self.build().render(**self.render_kwargs)
+
+
+def as_chart_spec(spec: ChartSpec | dict[str, Any]) -> ChartSpec:
+    return spec if isinstance(spec, ChartSpec) else ChartSpec.from_dict(spec)
+
+
+def render_spec(spec: ChartSpec | dict[str, Any]) -> str:
+    return as_chart_spec(spec).render()
+
+
+def map_chunk(function: Callable[[Any], Any], items: list) -> list:
+    return [function(item) for item in items]
+
+
+def parallel_map(
+    function: Callable[[Any], Any],
+    items: Iterable,
+    workers: int | None = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+) -> Iterator:
+    """
+    apply a function to many items in a pool of worker processes, reading the items and yielding
+    the results as it goes, with at most two chunks per worker in flight
+    :param function: picklable (module level) function of one item
+    :param items: picklable items, e.g. a generator
+    :param workers: number of worker processes, defaults to the number of CPUs; 1 maps in this process
+    :param chunksize: number of items sent to a worker at a time, to amortize the cost of passing them around
+    :param ordered: yield the results in the order of the items, otherwise yield (index, result) as they complete
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunksize < 1:
+        raise ValueError("workers and chunksize must be at least 1")
+    if workers == 1:
+        mapped = map(function, items)
+        return mapped if ordered else enumerate(mapped)
+    return iter_parallel_map(function, items, workers, chunksize, ordered)
+
+
+def iter_chunks(items: Iterable, chunksize: int) -> Iterator[tuple[int, list]]:
+    """
+    index of the first item and the items of each chunk
+    """
+    iterator = iter(items)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def iter_parallel_map(
+    function: Callable[[Any], Any],
+    items: Iterable,
+    workers: int,
+    chunksize: int,
+    ordered: bool,
+    window: int | None = None,
+) -> Iterator:
+    """
+    map chunks of items in a process pool, keeping a window of chunks in flight that is refilled as results are yielded
+    :param window: maximum number of chunks in flight, defaults to two per worker
+    """
+    chunks = iter_chunks(items, chunksize)
+    window = 2 * workers if window is None else window
+    in_flight: dict[Future, int] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def fill() -> None:
+            for start, chunk in islice(chunks, window - len(in_flight)):
+                in_flight[executor.submit(map_chunk, function, chunk)] = start
+
+        try:
+            fill()
+            while in_flight:
+                if ordered:
+                    # futures are in submission order, so the oldest one is next
+                    done = [next(iter(in_flight))]
+                else:
+                    done = list(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                for future in done:
+                    start = in_flight.pop(future)
+                    results = future.result()
+                    fill()
+                    if ordered:
+                        yield from results
+                    else:
+                        yield from enumerate(results, start)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def render_many(
+    specs: Iterable[ChartSpec | dict[str, Any]],
+    workers: int | None = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+) -> Iterator[str] | Iterator[tuple[int, str]]:
+    """
+    render many charts in a pool of worker processes
+    :param specs: ChartSpec objects or dicts accepted by ChartSpec.from_dict
+    :param workers: number of worker processes, defaults to the number of CPUs; 1 renders in this process
+    :param chunksize: number of charts sent to a worker at a time, to amortize the cost of passing them around
+    :param ordered: yield the svgs in the order of the specs, otherwise yield (index, svg) as they complete
+    """
+    return parallel_map(render_spec, specs, workers, chunksize, ordered)
+
+
+async def render_many_async(
+    specs: Iterable[ChartSpec | dict[str, Any]],
+    executor: Executor | None = None,
+    concurrency: int | asyncio.Semaphore | None = None,
+) -> list[str]:
+    """
+    build and render many charts in an executor without blocking the event loop, in the order of the specs
+    :param specs: ChartSpec objects or dicts accepted by ChartSpec.from_dict
+    :param executor: thread or process executor to render in, defaults to the loop's default executor
+    :param concurrency: maximum number of charts in the executor at once, defaults to the number of CPUs;
+        pass a semaphore to share the limit between calls, e.g. across the requests of a web service
+    """
+    if concurrency is None:
+        concurrency = os.cpu_count() or 1
+    if isinstance(concurrency, int):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        concurrency = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def render_one(spec: ChartSpec | dict[str, Any]) -> str:
+        async with concurrency:
+            return await loop.run_in_executor(executor, render_spec, spec)
+
+    return list(await asyncio.gather(*(render_one(spec) for spec in specs)))
@@ -0,0 +1,355 @@
+"""
+Benchmarks of every chart type at several scales.
+
+Times each phase of making a chart (construction, add_legend, add_grids,
+add_hover_modifier and render) and records the size of the rendered svg, for
+each chart type at 10**2 up to 10**7 data points. Phases a chart type does not
+support are skipped.
+
+Usage:
+    python -m pysvgchart.bench
+    python -m pysvgchart.bench --max-exponent 7 --charts SimpleLineChart ScatterChart --json bench.json
+
+NOTE the largest scales take minutes and several GB of memory, mostly for the hover elements.
+
+The memory mode traces allocations with tracemalloc instead, recording the peak memory and
+the net retained blocks (the change in the number of allocated blocks, not a count of the
+allocations made) of each phase (scale creation, chart construction, series construction,
+hover markers, render) of representative workloads,
+and can compare them with stored baselines, failing when a peak grows beyond a threshold:
+    python -m pysvgchart.bench --memory --baseline tests/test__bench/memory_baselines.json
+    python -m pysvgchart.bench --memory --baseline tests/test__bench/memory_baselines.json --update-baseline
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from . import charts
+from .shapes import Text
+
+phases = ("construct", "add_legend", "add_grids", "add_hover_modifier", "render")
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    chart: str
+    points: int
+    phase: str
+    seconds: float
+    bytes: int | None = None
+
+
+def random_walk(points: int, rng: random.Random) -> list[float]:
+    values = [1000.0]
+    for _ in range(points - 1):
+        values.append(values[-1] + rng.uniform(-10, 10))
+    return values
+
+
+def make_simple_line_chart(points: int, rng: random.Random) -> charts.Chart:
+    return charts.SimpleLineChart(x_values=list(range(points)), y_values=[random_walk(points, rng)], y_names=["walk"])
+
+
+def make_bar_chart(points: int, rng: random.Random) -> charts.Chart:
+    return charts.BarChart(
+        x_values=list(range(points)),
+        y_values=[[rng.randint(1, 100) for _ in range(points)]],
+        y_names=["bars"],
+    )
+
+
+def make_horizontal_bar_chart(points: int, rng: random.Random) -> charts.Chart:
+    return charts.HorizontalBarChart(
+        x_values=[[rng.randint(1, 100) for _ in range(points)]],
+        y_values=list(range(points)),
+        x_names=["bars"],
+    )
+
+
+def make_normalised_bar_chart(points: int, rng: random.Random) -> charts.Chart:
+    half = max(1, points // 2)
+    return charts.NormalisedBarChart(
+        x_values=list(range(half)),
+        y_values=[[rng.randint(1, 100) for _ in range(half)] for _ in range(2)],
+        y_names=["first", "second"],
+    )
+
+
+def make_scatter_chart(points: int, rng: random.Random) -> charts.Chart:
+    return charts.ScatterChart(
+        x_values=[rng.uniform(0, 100) for _ in range(points)],
+        y_values=[[rng.uniform(0, 100) for _ in range(points)]],
+        y_names=["scatter"],
+    )
+
+
+def make_donut_chart(points: int, rng: random.Random) -> charts.Chart:
+    return charts.DonutChart(values=[rng.randint(1, 100) for _ in range(points)])
+
+
+chart_makers: dict[str, Callable[[int, random.Random], charts.Chart]] = {
+    "SimpleLineChart": make_simple_line_chart,
+    "BarChart": make_bar_chart,
+    "HorizontalBarChart": make_horizontal_bar_chart,
+    "NormalisedBarChart": make_normalised_bar_chart,
+    "ScatterChart": make_scatter_chart,
+    "DonutChart": make_donut_chart,
+}
+
+
+def cartesian_hover(position, x_value, y_value, series_name, styles):
+    return [Text(x=position.x, y=position.y - 10, content=str(y_value), classes=["psc-hover-data"])]
+
+
+def donut_hover(position, name, value, chart_total):
+    return [Text(x=position.x, y=position.y, content=f"{value / chart_total:.0%}", classes=["psc-hover-data"])]
+
+
+def run_phase(chart: charts.Chart, phase: str) -> tuple[bool, int | None]:
+    """
+    run a phase on a chart, returning whether the chart supports it and the svg size for the render
+    """
+    if phase == "render":
+        return True, len(chart.render().encode())
+    if not hasattr(chart, phase):
+        return False, None
+    if phase == "add_hover_modifier":
+        if isinstance(chart, charts.DonutChart):
+            chart.add_hover_modifier(donut_hover)
+        else:
+            chart.add_hover_modifier(cartesian_hover, radius=3)
+    else:
+        getattr(chart, phase)()
+    return True, None
+
+
+def benchmark_chart(chart_name: str, points: int, repeat: int = 1, seed: int = 42) -> list[BenchmarkResult]:
+    """
+    time each phase of a chart with a number of data points, keeping the fastest of the repeats
+    """
+    best: dict[str, BenchmarkResult] = {}
+    for _ in range(repeat):
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        chart = chart_makers[chart_name](points, rng)
+        timings = [BenchmarkResult(chart_name, points, "construct", time.perf_counter() - start)]
+        for phase in phases[1:]:
+            start = time.perf_counter()
+            supported, size = run_phase(chart, phase)
+            if supported:
+                timings.append(BenchmarkResult(chart_name, points, phase, time.perf_counter() - start, size))
+        for result in timings:
+            if result.phase not in best or result.seconds < best[result.phase].seconds:
+                best[result.phase] = result
+    return list(best.values())
+
+
+def run_benchmarks(
+    chart_names: list[str] | None = None,
+    min_exponent: int = 2,
+    max_exponent: int = 5,
+    repeat: int = 1,
+    report: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """
+    benchmark chart types at 10**min_exponent up to 10**max_exponent data points
+    :param chart_names: chart types to benchmark, defaults to all of them
+    :param min_exponent: exponent of the smallest number of points
+    :param max_exponent: exponent of the largest number of points
+    :param repeat: number of runs of each benchmark, of which the fastest is kept
+    :param report: optional function called with each result as soon as it is known
+    """
+    chart_names = list(chart_makers) if chart_names is None else chart_names
+    unknown = [name for name in chart_names if name not in chart_makers]
+    if unknown:
+        raise ValueError(f"no benchmark for {', '.join(unknown)}, use any of {', '.join(chart_makers)}")
+    results = []
+    for exponent in range(min_exponent, max_exponent + 1):
+        for chart_name in chart_names:
+            for result in benchmark_chart(chart_name, 10**exponent, repeat):
+                results.append(result)
+                if report is not None:
+                    report(result)
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    size = "" if result.bytes is None else f"{result.bytes:>14,} B"
+    return f"{result.chart:<20} {result.points:>10,} {result.phase:<20} {result.seconds * 1000:>12.2f} ms{size}"
+
+
+memory_phases = ("scales", "construct", "series", "hover", "render")
+memory_workloads = (("SimpleLineChart", 10_000), ("BarChart", 10_000), ("ScatterChart", 10_000))
+default_memory_threshold = 0.1
+
+
+@dataclass(frozen=True)
+class MemoryResult:
+    chart: str
+    points: int
+    phase: str
+    peak: int
+    retained_blocks: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.chart}/{self.points}/{self.phase}"
+
+
+def trace_phase(function: Callable[[], Any]) -> tuple[Any, int, int]:
+    """
+    call a function while tracing, returning its result, the peak memory it allocated on top of what
+    was allocated before and its net retained blocks: the change in the number of allocated blocks
+    across the call, including its result
+    NOTE blocks allocated and freed within the call cancel out, so this is not the number of allocations it made
+    """
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1] - current
+    gc.collect()
+    return result, peak, sys.getallocatedblocks() - blocks
+
+
+def profile_memory(chart_name: str, points: int, seed: int = 42) -> list[MemoryResult]:
+    """
+    trace the memory of each phase of a vertical chart with a number of data points
+    """
+    chart_type = getattr(charts, chart_name)
+    rng = random.Random(seed)
+    x_values = [rng.uniform(0, 100) for _ in range(points)] if chart_name == "ScatterChart" else list(range(points))
+    y_values = [random_walk(points, rng)]
+    phase_calls: list[tuple[str, Callable[[], Any]]] = [
+        ("scales", lambda: (
+            chart_type.x_axis_scale_maker(chart_type.x_range_constructor(x_values), max_ticks=12),
+            chart_type.y_axis_scale_maker(chart_type.y_range_constructor(y_values), max_ticks=12),
+        )),
+        ("construct", lambda: chart_type(x_values=x_values, y_values=y_values, y_names=["walk"])),
+        ("series", lambda: chart.series_constructor(
+            x_values, y_values, chart.x_axis, chart.y_axis, ["walk"], chart.bar_width, chart.bar_gap,
+        )),
+        ("hover", lambda: chart.add_hover_modifier(cartesian_hover, radius=3)),
+        ("render", lambda: chart.render()),
+    ]
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        results = []
+        chart = None
+        for phase, call in phase_calls:
+            result, peak, retained_blocks = trace_phase(call)
+            if phase == "construct":
+                chart = result
+            results.append(MemoryResult(chart_name, points, phase, peak, retained_blocks))
+            del result
+        return results
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def run_memory_benchmarks(workloads: tuple[tuple[str, int], ...] = memory_workloads) -> list[MemoryResult]:
+    return [result for chart_name, points in workloads for result in profile_memory(chart_name, points)]
+
+
+def make_memory_baseline(results: list[MemoryResult]) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "results": {result.key: {"peak": result.peak, "retained_blocks": result.retained_blocks} for result in results},
+    }
+
+
+def find_memory_regressions(
+    results: list[MemoryResult],
+    baseline: dict[str, Any],
+    threshold: float = default_memory_threshold,
+) -> list[str]:
+    """
+    descriptions of the phases whose peak memory grew by more than a fraction of their baseline
+    """
+    regressions = []
+    for result in results:
+        expected = baseline["results"].get(result.key)
+        if expected is not None and result.peak > expected["peak"] * (1 + threshold):
+            regressions.append(
+                f"{result.key}: peak {result.peak:,} B exceeds baseline {expected['peak']:,} B by more than {threshold:.0%}"
+            )
+    return regressions
+
+
+def format_memory_result(result: MemoryResult) -> str:
+    return f"{result.chart:<20} {result.points:>10,} {result.phase:<20} {result.peak:>15,} B {result.retained_blocks:>16,}"
+
+
+def run_memory_mode(baseline_path: str | None, update_baseline: bool, threshold: float) -> int:
+    print(f"{'chart':<20} {'points':>10} {'phase':<20} {'peak':>17} {'retained blocks':>16}")
+    results = run_memory_benchmarks()
+    for result in results:
+        print(format_memory_result(result))
+    if baseline_path is None:
+        return 0
+    if update_baseline:
+        with open(baseline_path, "w") as file:
+            json.dump(make_memory_baseline(results), file, indent=2)
+            file.write("\n")
+        return 0
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    regressions = find_memory_regressions(results, baseline, threshold)
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pysvgchart.bench",
+        description="Benchmark chart construction and rendering.",
+    )
+    parser.add_argument(
+        "--charts", nargs="+", choices=list(chart_makers), help="chart types to benchmark, defaults to all",
+    )
+    parser.add_argument("--min-exponent", type=int, default=2, help="smallest scale, as a power of ten of data points")
+    parser.add_argument(
+        "--max-exponent", type=int, default=5, help="largest scale, as a power of ten of data points (up to 7)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs of each benchmark, of which the fastest is kept")
+    parser.add_argument("--json", help="file to write the results to, as a list of objects")
+    parser.add_argument(
+        "--memory", action="store_true", help="trace the memory of each phase of representative workloads instead",
+    )
+    parser.add_argument("--baseline", help="memory baseline file to compare with (or write with --update-baseline)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the memory results to the baseline file")
+    parser.add_argument(
+        "--threshold", type=float, default=default_memory_threshold, help="fraction a peak may exceed its baseline by",
+    )
+    args = parser.parse_args(argv)
+    if args.memory:
+        return run_memory_mode(args.baseline, args.update_baseline, args.threshold)
+    print(f"{'chart':<20} {'points':>10} {'phase':<20} {'time':>15} {'svg size':>16}")
+    results = run_benchmarks(
+        args.charts,
+        args.min_exponent,
+        args.max_exponent,
+        args.repeat,
+        report=lambda result: print(format_result(result), flush=True),
+    )
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
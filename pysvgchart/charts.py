@@ -34,19 +34,87 @@ Series constructors (internal):
     - normalised_bar_series_constructor: Creates 100% stacked bars
     - scatter_series_constructor: Creates ScatterSeries
 """
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from itertools import zip_longest, cycle
-from typing import Any
+from array import array
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from contextvars import Context, copy_context
+from functools import partial
+from itertools import chain, zip_longest, cycle
+from time import perf_counter
+from typing import IO, Any
+from weakref import WeakKeyDictionary
 
 from .axes import Axis, XAxis, YAxis, CategoryYAxis
-from .helpers import collapse_element_list, default_format
+from .helpers import active_coordinate_precision, default_format, iter_element_list, iter_in_context
+from .instrumentation import (
+    HOVER,
+    RENDER,
+    SERIES,
+    InstrumentationEvent,
+    active_hooks,
+    emit,
+    instrumented,
+    iter_instrumented_components,
+)
 from .legends import BarLegend, Legend, LineLegend, ScatterLegend, DonutLegend
+from .paths import active_path_encoding, validate_path_encoding
+from .reduction import (
+    bin_positions,
+    default_reduction_threshold,
+    get_line_reducer,
+    reduce_positions,
+    scatter_reduction_cell_sizes,
+    snap_to_grid,
+)
 from .scales import make_categories_scale, make_logarithmic_scale, make_linear_scale
-from .series import BarSeries, DonutSegment, LineSeries, ScatterSeries, Series
-from .shapes import Circle, Group, Line, Point
-from .shared import named_styles, number, numbers_sequence, style_def
-from .styles import render_all_styles
+from .series import BarSeries, DensitySeries, DonutSegment, LineSeries, ScatterSeries, Series
+from .shapes import Circle, Group, Line, Point, PointColumns, position_column
+from .shared import is_array, named_styles, number, numbers_sequence, style_def
+from .styles import StyleInterner, active_style_interner, render_all_styles
+from .summary import SeriesColumns
+
+
+# x pixel column of each axis, shared by the series of every constructor call positioned on it (primary and secondary)
+axis_position_columns: WeakKeyDictionary[Axis, tuple[Any, array]] = WeakKeyDictionary()
+
+
+def get_shared_position_column(axis: Axis, values) -> array:
+    """
+    pixel column of values on an axis, computed once per axis and shared by every series positioned on it
+    """
+    shared = axis_position_columns.get(axis)
+    if shared is None or shared[0] is not values:
+        shared = values, position_column(axis.get_positions(values))
+        axis_position_columns[axis] = shared
+    return shared[1]
+
+
+def series_point_columns(
+        x_axis: Axis,
+        x_values,
+        y_axis: Axis,
+        y_values,
+        x_offset: number = 0,
+) -> PointColumns:
+    """
+    pixel positions of the points of a series as columns, the x column shared unless it is offset
+    """
+    xs = get_shared_position_column(x_axis, x_values)
+    if x_offset:
+        xs = array("d", [x + x_offset for x in xs])
+    return PointColumns(xs, position_column(y_axis.get_positions(y_values)))
+
+
+def bar_heights(y_axis: Axis, y_values) -> list[number]:
+    """
+    pixel heights of the bars of a series, from the bottom of the axis
+    """
+    return [
+        y_axis.position.y + y_axis.length - y if y is not None else 0
+        for y in y_axis.get_positions(y_values)
+    ]
 
 
 def no_series_constructor(
@@ -66,6 +134,7 @@ def no_series_constructor(
     return {name: Series(x_values[0], y_value[0]) for name, y_value in zip(series_names, y_values)}
 
 
+@instrumented(SERIES, count=len)
 def line_series_constructor(
         x_values: list | tuple,
         y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
@@ -74,18 +143,40 @@ def line_series_constructor(
         series_names: list[str],
         bar_width: number,
         bar_gap: number,
+        downsample: str | Callable | None = None,
+        downsample_points: int | None = None,
+        downsample_keep_full: bool = False,
+        lazy: bool = False,
 ) -> dict[str, Series]:
+    """
+    :param downsample: optional reducer (name or function) applied to each series before it is constructed
+    :param downsample_points: point budget per series, defaults to a multiple of the x-axis length
+    :param downsample_keep_full: whether hover markers should still use every point
+    :param lazy: whether to compute the points on first access instead of now, not used when downsampling
+    """
     _ignore = bar_width, bar_gap
     if len(y_values) != len(series_names):
         raise ValueError("y_values and series_names must have the same length")
     if not all(len(y_value) == len(x_values) for y_value in y_values):
         raise ValueError("y_values must all have the same length as x_values")
+    if downsample is not None:
+        return downsampled_line_series_constructor(
+            x_values,
+            y_values,
+            x_axis,
+            y_axis,
+            series_names,
+            get_line_reducer(downsample),
+            downsample_points or default_reduction_threshold(downsample, x_axis.length),
+            downsample_keep_full,
+        )
     return {
         name: LineSeries(
-            points=[
-                Point(x=x, y=y)  # type: ignore[arg-type]
-                for x, y in zip(x_axis.get_positions(x_values), y_axis.get_positions(y_value))
-            ],
+            points=(
+                partial(series_point_columns, x_axis, x_values, y_axis, y_value)
+                if lazy
+                else series_point_columns(x_axis, x_values, y_axis, y_value)
+            ),
             x_values=x_values,
             y_values=y_value,  # type: ignore[arg-type]
         )
@@ -93,6 +184,37 @@ def line_series_constructor(
     }
 
 
+def downsampled_line_series_constructor(
+        x_values: list | tuple,
+        y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
+        x_axis: Axis,
+        y_axis: Axis,
+        series_names: list[str],
+        reducer: Callable,
+        threshold: int,
+        keep_full: bool,
+) -> dict[str, Series]:
+    x_positions = x_axis.get_positions(x_values)
+    rtn: dict[str, Series] = {}
+    for name, y_value in zip(series_names, y_values):
+        y_positions = y_axis.get_positions(y_value)
+        kept = reduce_positions(reducer, x_positions, y_positions, threshold)
+        if keep_full:
+            full_points = [Point(x=x, y=y) for x, y in zip(x_positions, y_positions)]  # type: ignore[arg-type]
+            points = [full_points[index] for index in kept]
+        else:
+            # only the kept points, the full series can be orders of magnitude longer
+            points = [Point(x=x_positions[index], y=y_positions[index]) for index in kept]  # type: ignore[arg-type]
+        rtn[name] = LineSeries(
+            points=points,
+            x_values=[x_values[index] for index in kept],
+            y_values=[y_value[index] for index in kept],
+            hover_data=(full_points, x_values, y_value) if keep_full else None,
+        )
+    return rtn
+
+
+@instrumented(SERIES, count=len)
 def bar_series_constructor(
         x_values: list | tuple,
         y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
@@ -101,7 +223,11 @@ def bar_series_constructor(
         series_names: list[str],
         bar_width: number,
         bar_gap: number,
+        lazy: bool = False,
 ) -> dict[str, Series]:
+    """
+    :param lazy: whether to compute the bars on first access instead of now
+    """
     if len(y_values) != len(series_names):
         raise ValueError("y_values and series_names must have the same length")
     if not all(len(y_value) == len(x_values) for y_value in y_values):
@@ -111,22 +237,21 @@ def bar_series_constructor(
     bar_shift = bar_span * (no_series - 1) / 2
     return {
         name: BarSeries(
-            points=[
-                Point(x=x + bar_nr * bar_span - bar_shift, y=y)  # type: ignore[arg-type, operator]
-                for x, y in zip(x_axis.get_positions(x_values), y_axis.get_positions(y_value))
-            ],
+            points=(
+                partial(series_point_columns, x_axis, x_values, y_axis, y_value, bar_nr * bar_span - bar_shift)
+                if lazy
+                else series_point_columns(x_axis, x_values, y_axis, y_value, bar_nr * bar_span - bar_shift)
+            ),
             x_values=x_values,
             y_values=y_value,  # type: ignore[arg-type]
-            bar_heights=[
-                y_axis.position.y + y_axis.length - y if y is not None else 0
-                for y in y_axis.get_positions(y_value)
-            ],
+            bar_heights=partial(bar_heights, y_axis, y_value) if lazy else bar_heights(y_axis, y_value),
             bar_width=bar_width,
         )
         for bar_nr, name, y_value in zip(range(no_series), series_names, y_values)
     }
 
 
+@instrumented(SERIES, count=len)
 def normalised_bar_series_constructor(
         x_values: list | tuple,
         y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
@@ -135,8 +260,12 @@ def normalised_bar_series_constructor(
         series_names: list[str],
         bar_width: number,
         bar_gap: number,
+        lazy: bool = False,
 ) -> dict[str, Series]:
-    _ignore = bar_gap
+    """
+    :param lazy: accepted for symmetry, normalised bars stack on each other and are always computed now
+    """
+    _ignore = bar_gap, lazy
     if len(y_values) < 1:
         raise ValueError("y_values should not be empty")
     if len(y_values) != len(series_names):
@@ -165,6 +294,7 @@ def normalised_bar_series_constructor(
     return rtn
 
 
+@instrumented(SERIES, count=len)
 def scatter_series_constructor(
         x_values: list | tuple,
         y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
@@ -173,18 +303,44 @@ def scatter_series_constructor(
         series_names: list[str],
         bar_width: number,
         bar_gap: number,
+        reduction: str | None = None,
+        cell_size: number | None = None,
+        bin_shape: str = "rect",
+        lazy: bool = False,
 ) -> dict[str, Series]:
+    """
+    :param reduction: optional "grid" (drop points sharing a grid cell) or "density" (binned cells)
+    :param cell_size: optional size of the grid cells/bins in pixels
+    :param bin_shape: shape of the density bins, "rect" or "hex"
+    :param lazy: whether to compute the points on first access instead of now, not used when reducing
+    """
     _ignore = bar_width, bar_gap
     if len(y_values) != len(series_names):
         raise ValueError("y_values and series_names must have the same length")
     if not all(len(y_value) == len(x_values) for y_value in y_values):
         raise ValueError("y_values must all have the same length as x_values")
+    if reduction is not None:
+        if reduction not in scatter_reduction_cell_sizes:
+            raise ValueError(
+                f"unknown scatter reduction {reduction!r}, use one of {', '.join(scatter_reduction_cell_sizes)}"
+            )
+        return reduced_scatter_series_constructor(
+            x_values,
+            y_values,
+            x_axis,
+            y_axis,
+            series_names,
+            reduction,
+            cell_size or scatter_reduction_cell_sizes[reduction],
+            bin_shape,
+        )
     return {
         name: ScatterSeries(
-            points=[
-                Point(x=x, y=y)  # type: ignore[arg-type]
-                for x, y in zip(x_axis.get_positions(x_values), y_axis.get_positions(y_value))
-            ],
+            points=(
+                partial(series_point_columns, x_axis, x_values, y_axis, y_value)
+                if lazy
+                else series_point_columns(x_axis, x_values, y_axis, y_value)
+            ),
             x_values=x_values,
             y_values=y_value,  # type: ignore[arg-type]
         )
@@ -192,6 +348,44 @@ def scatter_series_constructor(
     }
 
 
+def reduced_scatter_series_constructor(
+        x_values: list | tuple,
+        y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
+        x_axis: Axis,
+        y_axis: Axis,
+        series_names: list[str],
+        reduction: str,
+        cell_size: number,
+        bin_shape: str,
+) -> dict[str, Series]:
+    x_positions = x_axis.get_positions(x_values)
+    rtn: dict[str, Series] = {}
+    for name, y_value in zip(series_names, y_values):
+        y_positions = y_axis.get_positions(y_value)
+        if reduction == "density":
+            counts = bin_positions(x_positions, y_positions, cell_size, bin_shape)
+            rtn[name] = DensitySeries(
+                cells=[(Point(x=x, y=y), count) for (x, y), count in counts.items()],
+                cell_size=cell_size,
+                bin_shape=bin_shape,
+            )
+            continue
+        kept = snap_to_grid(x_positions, y_positions, cell_size)
+        rtn[name] = ScatterSeries(
+            points=[
+                Point(
+                    x=round(x_positions[index] / cell_size) * cell_size,  # type: ignore[operator]
+                    y=round(y_positions[index] / cell_size) * cell_size,  # type: ignore[operator]
+                )
+                for index in kept
+            ],
+            x_values=[x_values[index] for index in kept],
+            y_values=[y_value[index] for index in kept],
+        )
+    return rtn
+
+
+@instrumented(SERIES, count=len)
 def horizontal_bar_series_constructor(
         y_values: list | tuple,
         x_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
@@ -219,32 +413,53 @@ def horizontal_bar_series_constructor(
     zero_fraction = x_axis.scale.value_to_fraction(0)
     zero_x = x_axis.position.x + max(0.0, min(1.0, zero_fraction)) * x_axis.length
     from .series import HorizontalBarSeries
-    return {
-        name: HorizontalBarSeries(
+    # category positions are shared by all series, value positions by the bars and their lengths
+    y_positions = y_axis.get_positions(y_values)
+    rtn: dict[str, Series] = {}
+    for bar_nr, name, x_value in zip(range(no_series), series_names, x_values):
+        x_positions = x_axis.get_positions(x_value)
+        rtn[name] = HorizontalBarSeries(
             points=[
                 Point(x=x if x is not None else zero_x, y=y + bar_nr * bar_span - bar_shift)  # type: ignore[arg-type, operator]
-                for x, y in zip(x_axis.get_positions(x_value), y_axis.get_positions(y_values))
+                for x, y in zip(x_positions, y_positions)
             ],
             x_values=y_values,
             y_values=x_value,  # type: ignore[arg-type]
-            bar_heights=[
-                x - zero_x if x is not None else 0
-                for x in x_axis.get_positions(x_value)
-            ],
+            bar_heights=[x - zero_x if x is not None else 0 for x in x_positions],
             bar_width=bar_width,
         )
-        for bar_nr, name, x_value in zip(range(no_series), series_names, x_values)
-    }
+    return rtn
+
+
+def as_list(values) -> list:
+    """
+    copy values to a list, converting numpy arrays to native python values
+    """
+    return values.tolist() if is_array(values) else [v for v in values]
+
+
+def as_series_list(values):
+    """
+    allow a flat list or 1-d array for a single series and a 2-d array for many series
+    """
+    if is_array(values):
+        return [values] if values.ndim == 1 else list(values)
+    if values and not isinstance(values[0], (list, tuple)) and not is_array(values[0]):
+        return [values]
+    return values
 
 
 def default_x_range_constructor(x_values: list | tuple) -> list:
-    return [v for v in x_values]
+    return as_list(x_values)
 
 
 def default_y_range_constructor(
         y_values: list[list] | list[tuple] | tuple[list, ...] | tuple[tuple, ...],
-) -> list:
-    return [v for series in y_values for v in series]
+) -> SeriesColumns:
+    """
+    all values of the series, summarized per series so that they are never concatenated
+    """
+    return SeriesColumns(y_values)
 
 
 class Chart(ABC):
@@ -258,15 +473,34 @@ class Chart(ABC):
     width: number
     custom_elements: list[str]
     series: dict[str, Any]
+    coordinate_precision: int | None
+    path_encoding: str
 
-    def __init__(self, height: number, width: number) -> None:
+    def __init__(
+            self,
+            height: number,
+            width: number,
+            coordinate_precision: int | None = None,
+            path_encoding: str = "absolute",
+    ) -> None:
         self.height = height
         self.width = width
+        self.coordinate_precision = coordinate_precision
+        self.path_encoding = validate_path_encoding(path_encoding)
         self.custom_elements = []
         self.series = {}
 
     @abstractmethod
-    def get_element_list(self) -> list[str]: ...
+    def iter_components(self) -> Iterator[tuple[str, Iterator[str]]]:
+        """
+        names and svg fragments of the components of the chart (axes, legend, each series, custom elements)
+        """
+
+    def iter_element_list(self) -> Iterator[str]:
+        return chain.from_iterable(fragments for _, fragments in self.iter_components())
+
+    def get_element_list(self) -> list[str]:
+        return list(self.iter_element_list())
 
     def add_custom_element(self, custom_element) -> None:
         self.custom_elements.append(custom_element)
@@ -277,31 +511,115 @@ class Chart(ABC):
     def __str__(self) -> str:
         return self.render()
 
+    def iter_render(
+            self,
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+    ) -> Iterator[str]:
+        """
+        render the chart as a sequence of svg fragments, one element at a time
+        :param styles: optional named styles to include in the style block
+        :param include_default: whether to include the default styles
+        :param intern_styles: whether to replace repeated inline styles with generated css classes,
+            emitted in a style block after the elements so that the chart still streams
+        """
+        interner = StyleInterner() if intern_styles else None
+        context = self.get_render_context(interner)
+        yield from self.iter_render_begin(styles, include_default)
+        hooks = active_hooks.get()
+        elements = self.iter_element_list() if not hooks else iter_instrumented_components(hooks, self.iter_components())
+        yield from iter_in_context(context, elements)
+        yield from self.iter_render_end(interner)
+
+    def get_render_context(self, interner: StyleInterner | None = None) -> Context:
+        """
+        context to render elements in, with the style interner, coordinate precision and path encoding of the render
+        """
+        context = copy_context()
+        context.run(active_style_interner.set, interner)
+        context.run(active_coordinate_precision.set, self.coordinate_precision)
+        context.run(active_path_encoding.set, validate_path_encoding(self.path_encoding))
+        return context
+
+    def iter_render_begin(self, styles: named_styles | None = None, include_default: bool = True) -> Iterator[str]:
+        yield self.svg_begin_template.format(height=self.height, width=self.width)
+        if styles is not None or include_default:
+            yield "<style>"
+            yield render_all_styles(styles, include_default)
+            yield "</style>"
+
+    @staticmethod
+    def iter_render_end(interner: StyleInterner | None = None) -> Iterator[str]:
+        if interner is not None and interner.styles:
+            yield "<style>"
+            yield render_all_styles(interner.styles, include_default=False)
+            yield "</style>"
+        yield "</svg>"
+
     def render(
             self,
             styles: named_styles | None = None,
             include_default: bool = True,
+            intern_styles: bool = False,
     ) -> str:
-        style_block = []
-        if styles is not None or include_default:
-            style_block = ["<style>", render_all_styles(styles, include_default), "</style>"]
-        return "\n".join(
-            [
-                self.svg_begin_template.format(height=self.height, width=self.width),
-                *style_block,
-                *self.get_element_list(),
-                "</svg>",
-            ]
-        )
+        hooks = active_hooks.get()
+        if not hooks:
+            return "\n".join(self.iter_render(styles, include_default, intern_styles))
+        fragments = list(self.iter_render(styles, include_default, intern_styles))
+        start = perf_counter()
+        svg = "\n".join(fragments)
+        emit(hooks, InstrumentationEvent(RENDER, "join", perf_counter() - start, len(fragments), len(svg.encode())))
+        return svg
+
+    async def render_async(
+            self,
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+            executor: Executor | None = None,
+    ) -> str:
+        """
+        render the chart in an executor, so that large charts do not block the event loop
+        :param styles: optional named styles to include in the style block
+        :param include_default: whether to include the default styles
+        :param intern_styles: whether to replace repeated inline styles with generated css classes
+        :param executor: thread or process executor to render in, defaults to the loop's default executor
+            NOTE a process executor pickles the chart, so a custom downsample reducer must be picklable,
+            e.g. a module level function rather than a lambda
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(self.render, styles, include_default, intern_styles))
+
+    def write_to(
+            self,
+            fp: IO[str],
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+    ) -> None:
+        """
+        write the rendered chart to a file-like object without building the whole document in memory
+        :param fp: text file-like object to write to
+        :param styles: optional named styles to include in the style block
+        :param include_default: whether to include the default styles
+        :param intern_styles: whether to replace repeated inline styles with generated css classes
+        """
+        separator = ""
+        for fragment in self.iter_render(styles, include_default, intern_styles):
+            fp.write(separator)
+            fp.write(fragment)
+            separator = "\n"
 
     def save(
             self,
             file_path: str,
             styles: named_styles | None = None,
             include_default: bool = True,
+            intern_styles: bool = False,
     ) -> None:
         with open(file_path, "w+") as file:
-            file.write(self.render(styles, include_default))
+            self.write_to(file, styles, include_default, intern_styles)
 
     @staticmethod
     def generate_series_names(
@@ -349,6 +667,14 @@ class CartesianChart(Chart):
         for series, colour in zip(self.series, cycle(colours)):
             self.series[series].styles[self.colour_property] = colour
 
+    def set_single_path(self, single_path: bool = True) -> None:
+        """
+        render each series supporting it (bars, scatter markers) as a single path element
+        """
+        for series in self.series.values():
+            if hasattr(series, "single_path"):
+                series.single_path = single_path
+
 
 class VerticalChart(CartesianChart):
     """
@@ -404,12 +730,14 @@ class VerticalChart(CartesianChart):
             bar_width: number = 40,
             bar_gap: number = 2,
             colours: list[str] | tuple[str, ...] | None = None,
+            coordinate_precision: int | None = None,
+            path_encoding: str = "absolute",
     ):
         """
         create a simple line chart
-        :param x_values: the list of x values shared by all lines
-        :param y_values: a list line values for the primary y-axis, each a list itself
-        :param sec_y_values:  a list line values for the secondary y-axis, each a list itself
+        :param x_values: the list (or numpy array) of x values shared by all lines
+        :param y_values: a list line values for the primary y-axis, each a list (or numpy array) itself
+        :param sec_y_values:  a list line values for the secondary y-axis, each a list (or numpy array) itself
         :param y_names: optional list of names of the lines of the primary y-axis
         :param sec_y_names: optional list of names of the lines of the secondary y-axis
         :param x_min: optional minimum x value, only used in numeric axis
@@ -436,14 +764,17 @@ class VerticalChart(CartesianChart):
         :param height: optional height of the graph
         :param width: optional width of the graph
         :param colours: optional list of colours for the series
+        :param coordinate_precision: optional number of decimals of the rendered coordinates
+        :param path_encoding: "absolute" or "relative" (shorter) commands for line and donut paths
         """
         # Allow flat list for single-series: [1,2,3] → [[1,2,3]]
-        if y_values and not isinstance(y_values[0], (list, tuple)):
-            y_values = [y_values]
-        if sec_y_values is not None and sec_y_values and not isinstance(sec_y_values[0], (list, tuple)):
-            sec_y_values = [sec_y_values]
+        y_values = as_series_list(y_values)
+        if sec_y_values is not None:
+            sec_y_values = as_series_list(sec_y_values)
 
-        super().__init__(height, width)
+        super().__init__(height, width, coordinate_precision, path_encoding)
+        self.bar_width = bar_width
+        self.bar_gap = bar_gap
         self.x_axis = self.x_axis_type(  # type: ignore[abstract]
             x_position=left_margin,
             y_position=height - y_margin,
@@ -621,6 +952,7 @@ class VerticalChart(CartesianChart):
                     )
                 )
 
+    @instrumented(HOVER)
     def add_hover_modifier(
             self,
             modifier: Callable,
@@ -649,15 +981,16 @@ class VerticalChart(CartesianChart):
                 ]
                 self.series[s].add_custom_elements(hover_markers)
 
-    def get_element_list(self) -> list[str]:
-        return collapse_element_list(
-            [self.x_axis],
-            [self.y_axis],
-            [self.legend],
-            [self.sec_y_axis],
-            [self.series[s] for s in self.series],
-            self.custom_elements,
-        )
+    def iter_components(self) -> Iterator[tuple[str, Iterator[str]]]:
+        yield "x_axis", iter_element_list([self.x_axis])
+        yield "y_axis", iter_element_list([self.y_axis])
+        if self.legend is not None:
+            yield "legend", iter_element_list([self.legend])
+        if self.sec_y_axis is not None:
+            yield "sec_y_axis", iter_element_list([self.sec_y_axis])
+        for name, series in self.series.items():
+            yield f"series {name}", iter_element_list([series])
+        yield "custom_elements", iter_element_list(self.custom_elements)
 
 
 class HorizontalChart(CartesianChart):
@@ -713,18 +1046,19 @@ class HorizontalChart(CartesianChart):
             bar_width: number = 40,
             bar_gap: number = 2,
             colours: list[str] | tuple[str, ...] | None = None,
+            coordinate_precision: int | None = None,
+            path_encoding: str = "absolute",
     ):
         """
         Create a horizontal chart where categories are on Y-axis (vertical) and values on X-axis (horizontal).
         Parameters match the physical axes: x_values are horizontal (values), y_values are vertical (categories).
         """
         # Allow flat list for single-series: [1,2,3] → [[1,2,3]]
-        if x_values and not isinstance(x_values[0], (list, tuple)):
-            x_values = [x_values]
-        if sec_x_values is not None and sec_x_values and not isinstance(sec_x_values[0], (list, tuple)):
-            sec_x_values = [sec_x_values]
+        x_values = as_series_list(x_values)
+        if sec_x_values is not None:
+            sec_x_values = as_series_list(sec_x_values)
 
-        super().__init__(height, width)
+        super().__init__(height, width, coordinate_precision, path_encoding)
 
         # In horizontal charts:
         # - Y-axis is vertical and shows categories (y_values)
@@ -814,34 +1148,56 @@ class HorizontalChart(CartesianChart):
         self.legend: Legend | None = None
         self.set_palette(colours if colours else self.__colour_defaults__)
 
-    def get_element_list(self) -> list[str]:
-        return collapse_element_list(
-            [self.x_axis],
-            [self.y_axis],
-            [self.legend],
-            [self.sec_x_axis],
-            [self.series[s] for s in self.series],
-            self.custom_elements,
-        )
+    def iter_components(self) -> Iterator[tuple[str, Iterator[str]]]:
+        yield "x_axis", iter_element_list([self.x_axis])
+        yield "y_axis", iter_element_list([self.y_axis])
+        if self.legend is not None:
+            yield "legend", iter_element_list([self.legend])
+        if self.sec_x_axis is not None:
+            yield "sec_x_axis", iter_element_list([self.sec_x_axis])
+        for name, series in self.series.items():
+            yield f"series {name}", iter_element_list([series])
+        yield "custom_elements", iter_element_list(self.custom_elements)
 
 
 class LineChart(VerticalChart):
     x_axis_type = XAxis  # type: ignore[assignment]
     y_axis_type = YAxis  # type: ignore[assignment]
     series_constructor = staticmethod(line_series_constructor)
+    supports_downsampling = True
 
     def __init__(self, *args, **kwargs):
         """
-        intercept init to handle optional logarithmic scale
+        intercept init to handle optional logarithmic scale, downsampling and lazy series
         :param x_log: optionally enable logarithmic scale
         :param y_log: optionally enable logarithmic scale
+        :param downsample: optionally reduce dense series before rendering - "lttb", "m4" or a reducer function
+        :param downsample_points: optional point budget per series, defaults to 2 ("lttb") or 4 ("m4") per pixel
+        :param downsample_keep_full: optionally keep every point for hover markers
+        :param lazy: optionally compute the positions of each series when first needed, e.g. when rendering
         """
         x_log = kwargs.pop("x_log", False)
         y_log = kwargs.pop("y_log", False)
+        downsample = kwargs.pop("downsample", None)
+        downsample_points = kwargs.pop("downsample_points", None)
+        downsample_keep_full = kwargs.pop("downsample_keep_full", False)
+        lazy = kwargs.pop("lazy", False)
+        if not self.supports_downsampling and (downsample, downsample_points, downsample_keep_full) != (None, None, False):
+            raise ValueError(f"{type(self).__name__} does not support downsampling, only line charts do")
         if x_log:
-            self.x_axis_scale_maker = staticmethod(make_logarithmic_scale)
+            self.x_axis_scale_maker = make_logarithmic_scale
         if y_log:
-            self.y_axis_scale_maker = staticmethod(make_logarithmic_scale)
+            self.y_axis_scale_maker = make_logarithmic_scale
+        # plain functions and partials on the instance are not bound to it, and unlike staticmethod objects they pickle
+        if downsample is not None:
+            self.series_constructor = partial(
+                self.series_constructor,
+                downsample=downsample,
+                downsample_points=downsample_points,
+                downsample_keep_full=downsample_keep_full,
+            )
+        if lazy:
+            self.series_constructor = partial(self.series_constructor, lazy=True)
         super().__init__(*args, **kwargs)
 
 
@@ -858,6 +1214,16 @@ class BarChart(LineChart):
     y_axis_scale_maker = staticmethod(make_linear_scale)
     series_constructor = staticmethod(bar_series_constructor)
     colour_property = "fill"
+    supports_downsampling = False
+
+    def __init__(self, *args, **kwargs):
+        """
+        intercept init to handle optional single path rendering
+        :param single_path: optionally render all bars of each series as a single path
+        """
+        single_path = kwargs.pop("single_path", False)
+        super().__init__(*args, **kwargs)
+        self.set_single_path(single_path)
 
     def add_legend(  # type: ignore[override]
             self,
@@ -895,7 +1261,13 @@ class HorizontalBarChart(HorizontalChart):
     colour_property = "fill"
 
     def __init__(self, *args, **kwargs):
+        """
+        intercept init to handle optional single path rendering
+        :param single_path: optionally render all bars of each series as a single path
+        """
+        single_path = kwargs.pop("single_path", False)
         super().__init__(*args, **kwargs)
+        self.set_single_path(single_path)
         # Move the y-axis line to the zero position on the x-axis
         zero_fraction = self.x_axis.scale.value_to_fraction(0)
         zero_x = self.x_axis.position.x + max(0.0, min(1.0, zero_fraction)) * self.x_axis.length
@@ -938,6 +1310,16 @@ class NormalisedBarChart(LineChart):
     series_constructor = staticmethod(normalised_bar_series_constructor)
     y_range_constructor = staticmethod(lambda y_values: [0, 1])
     colour_property = "fill"
+    supports_downsampling = False
+
+    def __init__(self, *args, **kwargs):
+        """
+        intercept init to handle optional single path rendering
+        :param single_path: optionally render all bars of each series as a single path
+        """
+        single_path = kwargs.pop("single_path", False)
+        super().__init__(*args, **kwargs)
+        self.set_single_path(single_path)
 
     def add_legend(  # type: ignore[override]
             self,
@@ -967,6 +1349,29 @@ class ScatterChart(LineChart):
     y_axis_type = YAxis
     series_constructor = staticmethod(scatter_series_constructor)
     colour_property = "fill"
+    supports_downsampling = False
+
+    def __init__(self, *args, **kwargs):
+        """
+        intercept init to handle optional point reduction
+        :param reduction: optionally reduce dense series - "grid" drops points sharing a grid cell, "density" bins them
+        :param cell_size: optional size of grid cells/bins in pixels, defaults to 1 ("grid") or 10 ("density")
+        :param bin_shape: optional shape of density bins - "rect" or "hex"
+        :param single_path: optionally render the markers of each series as a single compact path
+        """
+        reduction = kwargs.pop("reduction", None)
+        cell_size = kwargs.pop("cell_size", None)
+        bin_shape = kwargs.pop("bin_shape", "rect")
+        single_path = kwargs.pop("single_path", False)
+        if reduction is not None:
+            self.series_constructor = partial(
+                self.series_constructor,
+                reduction=reduction,
+                cell_size=cell_size,
+                bin_shape=bin_shape,
+            )
+        super().__init__(*args, **kwargs)
+        self.set_single_path(single_path)
 
     def add_legend(  # type: ignore[override]
             self,
@@ -1006,6 +1411,8 @@ class DonutChart(Chart):
             radius_inner: number = 55,
             radius_outer: number = 150,
             rotation: number = 70,
+            coordinate_precision: int | None = None,
+            path_encoding: str = "absolute",
     ):
         """
         create a donut chart
@@ -1018,8 +1425,10 @@ class DonutChart(Chart):
         :param radius_inner: inner radius of donut (blank area)
         :param radius_outer: outer radius of donut (other area)
         :param rotation: rotation offset
+        :param coordinate_precision: optional number of decimals of the rendered coordinates
+        :param path_encoding: "absolute" or "relative" (shorter) commands for line and donut paths
         """
-        super().__init__(height, width)
+        super().__init__(height, width, coordinate_precision, path_encoding)
         self.values = values
         series_names = self.generate_series_names("Series", len(values), labels)
         # compute start and end angles for the value segments
@@ -1051,6 +1460,7 @@ class DonutChart(Chart):
                 centre_y,
             )
 
+    @instrumented(HOVER)
     def add_hover_modifier(self, modifier: Callable):
         names = list(self.series)
         segments = [self.series[name] for name in names]
@@ -1086,5 +1496,9 @@ class DonutChart(Chart):
             circle_text_gap,
         )
 
-    def get_element_list(self) -> list[str]:
-        return collapse_element_list([self.series[s] for s in self.series], self.custom_elements, [self.legend])
+    def iter_components(self) -> Iterator[tuple[str, Iterator[str]]]:
+        for name, series in self.series.items():
+            yield f"series {name}", iter_element_list([series])
+        yield "custom_elements", iter_element_list(self.custom_elements)
+        if self.legend is not None:
+            yield "legend", iter_element_list([self.legend])
@@ -0,0 +1,230 @@
+"""
+Command line batch renderer.
+
+Reads chart specs from JSON Lines or CSV files and renders each to an svg file (optionally
+gzip-compressed) in a pool of worker processes, which write the files themselves so that
+no svg is passed back to the parent process. Each file is written under a temporary name and
+moved into place once its chart has rendered. Reports throughput and per-chart timings.
+
+Output names cannot contain path separators and must be unique, charts without one are
+named chart-<index>.
+
+A JSON Lines spec is a ChartSpec dict with an optional output name:
+    {"name": "sales", "chart": "LineChart", "kwargs": {"x_values": [1, 2], "y_values": [[3, 4]]}, "calls": ["add_legend"]}
+
+A CSV spec is a row with "name" and "chart" columns, "calls" and "render" columns and a column
+per chart argument; cells are read as JSON where they parse as it, otherwise as text, and empty
+cells are skipped:
+    name,chart,x_values,y_values,calls
+    sales,LineChart,"[1, 2]","[[3, 4]]","[""add_legend""]"
+
+Usage:
+    pysvgchart specs.jsonl more-specs.csv --output-dir charts --workers 8 --gzip
+"""
+import argparse
+import csv
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .batch import ChartSpec, parallel_map
+
+spec_formats = ("jsonl", "csv")
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """
+    a chart to render and the file to write it to
+    """
+
+    name: str
+    spec: ChartSpec
+    path: str
+    compress: bool = False
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    name: str
+    path: str
+    seconds: float
+    size: int = 0
+    error: str | None = None
+
+
+def get_spec_format(file_path: str, spec_format: str | None = None) -> str:
+    """
+    format of a spec file, given or from its extension
+    """
+    if spec_format is None:
+        spec_format = "csv" if file_path.lower().endswith(".csv") else "jsonl"
+    if spec_format not in spec_formats:
+        raise ValueError(f"unknown spec format {spec_format!r}, use one of {', '.join(spec_formats)}")
+    return spec_format
+
+
+def parse_csv_value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def read_jsonl_specs(file_path: str) -> Iterator[dict[str, Any]]:
+    with open(file_path) as file:
+        for line_number, line in enumerate(file, 1):
+            if line.strip():
+                spec = json.loads(line)
+                if not isinstance(spec, dict):
+                    raise ValueError(f"{file_path}:{line_number}: chart spec must be a JSON object, not {type(spec).__name__}")
+                yield spec
+
+
+def read_csv_specs(file_path: str) -> Iterator[dict[str, Any]]:
+    with open(file_path, newline="") as file:
+        for row in csv.DictReader(file):
+            values = {column: parse_csv_value(text) for column, text in row.items() if text}
+            yield {
+                key: values.pop(key)
+                for key in ("name", "chart", "calls", "render")
+                if key in values
+            } | {"kwargs": values}
+
+
+def read_specs(file_paths: list[str], spec_format: str | None = None) -> Iterator[tuple[str | None, ChartSpec]]:
+    """
+    output name (if given) and spec of each chart in the spec files
+    """
+    for file_path in file_paths:
+        if get_spec_format(file_path, spec_format) == "csv":
+            specs = read_csv_specs(file_path)
+        else:
+            specs = read_jsonl_specs(file_path)
+        for spec in specs:
+            name = spec.pop("name", None)
+            yield None if name is None else str(name), ChartSpec.from_dict(spec)
+
+
+def check_name(name: str) -> str:
+    """
+    an output name, rejecting any that would write outside the output directory
+    """
+    separators = [os.sep, os.altsep, "/"]
+    if (
+        name in ("", ".", "..")
+        or any(separator and separator in name for separator in separators)
+        or os.path.splitdrive(name)[0]
+    ):
+        raise ValueError(f"invalid chart name {name!r}, names cannot be empty or contain path separators")
+    return name
+
+
+def make_jobs(
+    specs: Iterator[tuple[str | None, ChartSpec]],
+    output_dir: str,
+    compress: bool = False,
+) -> list[RenderJob]:
+    suffix = ".svg.gz" if compress else ".svg"
+    jobs = []
+    names: set[str] = set()
+    for index, (name, spec) in enumerate(specs):
+        name = f"chart-{index:06d}" if name is None else check_name(name)
+        if name in names:
+            raise ValueError(f"duplicate chart name {name!r}")
+        names.add(name)
+        jobs.append(RenderJob(name, spec, os.path.join(output_dir, name + suffix), compress))
+    return jobs
+
+
+def run_job(job: RenderJob) -> RenderResult:
+    """
+    render a chart to a temporary file, moved into place only once the chart has rendered,
+    reporting a failure rather than raising it
+    """
+    start = time.perf_counter()
+    directory, file_name = os.path.split(job.path)
+    # hidden, next to the file so that moving it into place is atomic, and unique to this process
+    temporary_path = os.path.join(directory, f".{file_name}.{os.getpid()}.tmp")
+    try:
+        chart = job.spec.build()
+        os.makedirs(directory or ".", exist_ok=True)
+        opener = gzip.open if job.compress else open
+        with opener(temporary_path, "wt", encoding="utf-8") as file:
+            chart.write_to(file, **job.spec.render_kwargs)
+        os.replace(temporary_path, job.path)
+    except Exception as error:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return RenderResult(job.name, job.path, time.perf_counter() - start, error=f"{type(error).__name__}: {error}")
+    return RenderResult(job.name, job.path, time.perf_counter() - start, os.path.getsize(job.path))
+
+
+def summarize_results(results: list[RenderResult], elapsed: float) -> str:
+    """
+    throughput and per-chart timings of a run
+    """
+    rendered = [result for result in results if result.error is None]
+    lines = [
+        f"rendered {len(rendered)} of {len(results)} charts in {elapsed:.2f}s "
+        f"({len(rendered) / elapsed if elapsed > 0 else 0:.1f} charts/s, {sum(r.size for r in rendered):,} bytes)"
+    ]
+    if rendered:
+        seconds = sorted(result.seconds for result in rendered)
+        slowest = max(rendered, key=lambda result: result.seconds)
+        lines.append(
+            f"per chart: mean {statistics.fmean(seconds) * 1000:.1f}ms, "
+            f"median {statistics.median(seconds) * 1000:.1f}ms, "
+            f"p95 {seconds[int(0.95 * (len(seconds) - 1))] * 1000:.1f}ms, "
+            f"max {slowest.seconds * 1000:.1f}ms ({slowest.name})"
+        )
+    return "\n".join(lines)
+
+
+def write_timings(file_path: str, results: list[RenderResult]) -> None:
+    with open(file_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "path", "seconds", "bytes", "error"])
+        for result in results:
+            writer.writerow([result.name, result.path, f"{result.seconds:.6f}", result.size, result.error or ""])
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pysvgchart", description="Render charts from JSON Lines or CSV specs to svg files.")
+    parser.add_argument("specs", nargs="+", help="spec files, .csv files are read as CSV and any other as JSON Lines")
+    parser.add_argument("-o", "--output-dir", default=".", help="directory to write the svg files to")
+    parser.add_argument("-f", "--format", choices=spec_formats, help="format of all spec files, instead of by extension")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="number of worker processes, defaults to the number of CPUs",
+    )
+    parser.add_argument("--chunksize", type=int, default=16, help="number of charts sent to a worker at a time")
+    parser.add_argument("-z", "--gzip", action="store_true", help="write gzip-compressed .svg.gz files")
+    parser.add_argument("--timings", help="csv file to write the time and size of each chart to")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only report failures")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = make_parser().parse_args(argv)
+    start = time.perf_counter()
+    try:
+        jobs = make_jobs(read_specs(args.specs, args.format), args.output_dir, args.gzip)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        print(f"pysvgchart: cannot read specs: {error}", file=sys.stderr)
+        return 2
+    results = list(parallel_map(run_job, jobs, args.workers, args.chunksize))
+    elapsed = time.perf_counter() - start
+    for result in results:
+        if result.error is not None:
+            print(f"pysvgchart: {result.name}: {result.error}", file=sys.stderr)
+    if args.timings:
+        write_timings(args.timings, results)
+    if not args.quiet:
+        print(summarize_results(results, elapsed), file=sys.stderr)
+    return 1 if any(result.error is not None for result in results) else 0
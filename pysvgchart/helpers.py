@@ -4,6 +4,9 @@ Utility functions for chart rendering.
 Functions:
     default_format(value): Format numbers with thousand separators
     collapse_element_list(*lists): Flatten nested element lists to SVG strings
+    iter_element_list(*lists): Lazily flatten nested element lists to SVG strings
+    iter_in_context(context, iterator): Advance an iterator inside a contextvars context
+    get_coordinate_formatter(): Formatter for svg coordinates at the precision of the render
     get_numeric_ticks(values, max_ticks, ...): Calculate nice tick values for numeric axes
     get_logarithmic_ticks(values, max_ticks, ...): Calculate tick values for log scales
     get_date_or_time_ticks(dates, max_ticks, ...): Calculate ticks for date/datetime ranges
@@ -13,7 +16,9 @@ tick intervals (e.g., 1, 2, 5, 10 rather than 3, 7, 11).
 """
 import math
 import datetime as dt
-
+from collections.abc import Callable, Iterator
+from contextvars import Context, ContextVar
+from functools import lru_cache
 
 from .shared import (
     dates_sequence,
@@ -21,6 +26,7 @@ from .shared import (
     number,
     numbers_sequence,
 )
+from .summary import DataSummary, summarize
 
 
 def noop(*args, **kwargs) -> None:
@@ -42,18 +48,61 @@ def safe_get_element_list(elements):
         yield from elements.get_element_list()
 
 
+def iter_element_list(*list_of_list_of_elements) -> Iterator[str]:
+    """
+    lazily flatten any number of lists of elements, one element at a time
+    """
+    for list_of_elements in list_of_list_of_elements:
+        if isinstance(list_of_elements, (list, tuple, set)):
+            for elements in list_of_elements:
+                yield from safe_get_element_list(elements)
+
+
+def iter_in_context(context: Context, iterator: Iterator) -> Iterator:
+    """
+    advance an iterator inside a context, so context variables set there never leak to the caller
+    """
+    sentinel = object()
+    while (item := context.run(next, iterator, sentinel)) is not sentinel:
+        yield item
+
+
+# number of decimals of the coordinates of the render in progress, None to keep full precision
+active_coordinate_precision: ContextVar[int | None] = ContextVar("active_coordinate_precision", default=None)
+
+
+@lru_cache(maxsize=None)
+def make_coordinate_formatter(precision: int | None) -> Callable[[number | None], str]:
+    """
+    formatter rounding coordinates to a number of decimals, in shortest form without trailing zeros
+    """
+    if precision is None:
+        return str
+    spec = f"%.{precision}f"
+
+    def format_coordinate(value: number | None) -> str:
+        if value is None:  # e.g. shifted out of the visible range, rendered as without a precision
+            return str(value)
+        text = spec % value
+        if precision > 0:
+            text = text.rstrip("0").rstrip(".")
+        return "0" if text == "-0" else text
+
+    return format_coordinate
+
+
+def get_coordinate_formatter() -> Callable[[number | None], str]:
+    """
+    coordinate formatter of the render in progress
+    """
+    return make_coordinate_formatter(active_coordinate_precision.get())
+
+
 def collapse_element_list(*list_of_list_of_elements) -> list[str]:
     """
     flatten any number of lists of elements to a list of elements
     """
-    return [
-        element
-        for list_of_elements in list_of_list_of_elements
-        for elements in (
-            list_of_elements if isinstance(list_of_elements, (list, tuple, set)) else []
-        )
-        for element in safe_get_element_list(elements)
-    ]
+    return list(iter_element_list(*list_of_list_of_elements))
 
 
 def get_numeric_ticks(
@@ -62,6 +111,7 @@ def get_numeric_ticks(
     min_value: number | None = None,
     max_value: number | None = None,
     include_zero: bool = False,
+    summary: DataSummary | None = None,
 ) -> numbers_sequence:
     """
     compute ticks for a series of numbers
@@ -70,8 +120,13 @@ def get_numeric_ticks(
     :param min_value: optional minimum value to include in ticks
     :param max_value: optional maximum value to include in ticks
     :param include_zero: whether to include zero in ticks
+    :param summary: optional summary of the values, so they need not be scanned again
     """
-    value_min, value_max = min(values), max(values)
+    if summary is None:
+        summary = summarize(values)
+    if summary.count == 0:
+        raise ValueError("No values to compute ticks for.")
+    value_min, value_max = summary.minimum, summary.maximum
     if min_value is not None:
         value_min = min(value_min, min_value)
     if max_value is not None:
@@ -81,9 +136,9 @@ def get_numeric_ticks(
     if not include_zero:
         data_range = abs(value_max - value_min)
         if data_range > 0:
-            if all(v >= 0 for v in values) and value_min - 2 * data_range < 0:
+            if summary.non_negative and value_min - 2 * data_range < 0:
                 include_zero = True
-            elif all(v <= 0 for v in values) and max(values) + 2 * data_range > 0:
+            elif summary.non_positive and summary.maximum + 2 * data_range > 0:
                 include_zero = True
 
     if include_zero:
@@ -116,7 +171,7 @@ def get_numeric_ticks(
 
     pad = nice * magnitude
     # For integer data, enforce integer ticks (minimum step of 1, int type)
-    if all(isinstance(v, int) for v in values):
+    if summary.all_int:
         pad = max(1, int(pad))
     start = math.floor(value_min / pad)
     end = math.ceil(value_max / pad)
@@ -129,6 +184,7 @@ def get_logarithmic_ticks(
     min_value: number | None = None,
     max_value: number | None = None,
     include_zero: bool = False,
+    summary: DataSummary | None = None,
 ) -> numbers_sequence:
     """
     compute logarithmic ticks for a series of numbers
@@ -137,8 +193,13 @@ def get_logarithmic_ticks(
     :param min_value: optional minimum value to include in ticks
     :param max_value: optional maximum value to include in ticks
     :param include_zero: whether to include zero in ticks
+    :param summary: optional summary of the values, so they need not be scanned again
     """
-    value_min, value_max = min(values), max(values)
+    if summary is None:
+        summary = summarize(values)
+    if summary.count == 0:
+        raise ValueError("No values to compute ticks for.")
+    value_min, value_max = summary.minimum, summary.maximum
     if min_value is not None:
         value_min = min(value_min, min_value)
     if max_value is not None:
@@ -175,6 +236,7 @@ def get_date_or_time_ticks(
     max_ticks: int = 10,
     min_value: dt.date | dt.datetime | None = None,
     max_value: dt.date | dt.datetime | None = None,
+    summary: DataSummary | None = None,
 ) -> dates_sequence | datetimes_sequence:
     """
     compute ticks for a series of dates/datetimes
@@ -182,8 +244,9 @@ def get_date_or_time_ticks(
     :param max_ticks: maximum number of ticks
     :param min_value: optional minimum value to include in ticks
     :param max_value: optional maximum value to include in ticks
+    :param summary: optional summary of the dates, so they need not be scanned again
     """
-    date_min, date_max = min(dates), max(dates)
+    date_min, date_max = (min(dates), max(dates)) if summary is None else (summary.minimum, summary.maximum)
     if date_min >= date_max:
         raise ValueError("Dates must have a positive range.")
 
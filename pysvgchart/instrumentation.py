@@ -0,0 +1,124 @@
+"""
+Instrumentation of chart construction and rendering.
+
+Hooks installed with the instrument() context manager receive an event for each
+scale made, each set of series constructed, each hover modifier added and each
+component (axes, legend, each series, custom elements) rendered, with its duration
+and, where it applies, its element and byte counts. Without hooks the instrumented
+functions only check whether any are installed.
+
+Classes:
+    InstrumentationEvent: phase, name, duration and counts of one instrumented step
+
+Functions:
+    instrument(hook): Context manager installing a hook and collecting the events
+    instrumented(phase, count): Decorator reporting the calls of a function as events
+
+Example:
+    with psc.instrument() as events:
+        chart = psc.SimpleLineChart(x_values=x, y_values=[y])
+        chart.render()
+    for event in sorted(events, key=lambda event: -event.seconds):
+        print(event.phase, event.name, event.seconds, event.elements, event.bytes)
+"""
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+from typing import Any
+
+# phases of making a chart
+SCALE = "scale"
+SERIES = "series"
+HOVER = "hover"
+RENDER = "render"
+
+
+@dataclass(frozen=True)
+class InstrumentationEvent:
+    """
+    an instrumented step: its phase, what ran (function or component name), how long it took,
+    and the number of elements (ticks, series, svg fragments) and bytes it produced where they apply
+    """
+
+    phase: str
+    name: str
+    seconds: float
+    elements: int | None = None
+    bytes: int | None = None
+
+
+Hook = Callable[[InstrumentationEvent], None]
+
+# hooks of the current context, empty when nothing is instrumented
+active_hooks: ContextVar[tuple[Hook, ...]] = ContextVar("active_hooks", default=())
+
+
+def emit(hooks: tuple[Hook, ...], event: InstrumentationEvent) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+@contextmanager
+def instrument(hook: Hook | None = None) -> Iterator[list[InstrumentationEvent]]:
+    """
+    report the events of the code run in the block to a hook, on top of any hooks already installed
+    :param hook: optional function called with each event as it happens
+    :return: the list the events are collected in
+    """
+    events: list[InstrumentationEvent] = []
+
+    def collect(event: InstrumentationEvent) -> None:
+        events.append(event)
+        if hook is not None:
+            hook(event)
+
+    token = active_hooks.set((*active_hooks.get(), collect))
+    try:
+        yield events
+    finally:
+        active_hooks.reset(token)
+
+
+def instrumented(phase: str, count: Callable[[Any], int] | None = None) -> Callable:
+    """
+    decorator reporting each call of a function as an event of a phase
+    :param phase: phase the function belongs to
+    :param count: optional function counting the elements of the result
+    """
+
+    def decorate(function: Callable) -> Callable:
+        name = function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            hooks = active_hooks.get()
+            if not hooks:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            result = function(*args, **kwargs)
+            seconds = perf_counter() - start
+            emit(hooks, InstrumentationEvent(phase, name, seconds, None if count is None else count(result)))
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def iter_instrumented_components(
+        hooks: tuple[Hook, ...],
+        components: Iterable[tuple[str, Iterator[str]]],
+) -> Iterator[str]:
+    """
+    render named components one at a time, reporting the duration, fragments and bytes of each
+    """
+    for name, fragments in components:
+        start = perf_counter()
+        rendered = list(fragments)
+        seconds = perf_counter() - start
+        size = sum(len(fragment.encode()) for fragment in rendered)
+        emit(hooks, InstrumentationEvent(RENDER, name, seconds, len(rendered), size))
+        yield from rendered
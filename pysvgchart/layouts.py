@@ -0,0 +1,328 @@
+"""
+Layouts of several charts in one svg document.
+
+Placing charts side by side as separate svgs repeats the style block in each of them.
+A grid renders them as panels of a single svg, each placed with a transform, sharing
+one style block and, with style interning, one set of style classes. Faceted grids
+go further: the panels share one scale, computed once across all datasets, and one
+set of axes, grids and legend, rendered once and referenced by every panel.
+
+A page renders many charts and grids as one html document of inline svgs or as one
+svg, with a single style block, styles interned across all of them and each distinct
+frame of the grids rendered once.
+
+Classes:
+    ChartGrid: charts laid out in rows and columns of a single svg
+
+Functions:
+    render_page(charts, layout, columns, ...): Render charts and grids as one html or svg document
+
+Example:
+    grid = psc.ChartGrid.facet(
+        psc.SimpleLineChart,
+        x_values=days,
+        datasets=[[sales] for sales in sales_per_store],
+        columns=8,
+        width=200,
+        height=100,
+        left_margin=20,
+        right_margin=20,
+        y_margin=20,
+    )
+    svg = grid.render(intern_styles=True)
+"""
+import html
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .batch import ChartSpec
+from .charts import Chart, VerticalChart, as_series_list
+from .helpers import iter_element_list, iter_in_context
+from .shared import named_styles, number
+from .styles import StyleInterner, render_all_styles
+from .summary import SeriesColumns, summarize
+from .templates import ChartTemplate
+
+
+class ChartGrid:
+    """
+    charts laid out in rows and columns of a single svg, in cells the size of the largest chart
+    """
+
+    panel_template = '<g transform="translate({x},{y})">'
+    frame_template = '<use href="#{frame_id}"/>'
+
+    def __init__(
+            self,
+            charts: list[Chart],
+            columns: int,
+            gap: number = 0,
+            frame: VerticalChart | None = None,
+            frame_id: str = "psc-frame",
+    ) -> None:
+        """
+        :param charts: the charts, laid out row by row
+        :param columns: number of charts in a row
+        :param gap: space between the cells
+        :param frame: optional chart whose axes and legend all the charts share, rendered once and referenced by each panel
+        :param frame_id: id of the rendered frame, unique within the document the grid is embedded in
+        """
+        if columns < 1:
+            raise ValueError("a grid needs at least one column")
+        if not charts:
+            raise ValueError("a grid needs at least one chart")
+        self.charts = list(charts)
+        self.columns = columns
+        self.gap = gap
+        self.frame = frame
+        self.frame_id = frame_id
+        self.cell_width = max(chart.width for chart in self.charts)
+        self.cell_height = max(chart.height for chart in self.charts)
+        rows = -(-len(self.charts) // columns)
+        self.width = min(columns, len(self.charts)) * (self.cell_width + gap) - gap
+        self.height = rows * (self.cell_height + gap) - gap
+
+    @classmethod
+    def facet(
+            cls,
+            chart_type: type[VerticalChart] | str,
+            x_values: list | tuple,
+            datasets: list,
+            columns: int,
+            gap: number = 0,
+            y_names: list[str] | None = None,
+            y_min: Any = None,
+            y_max: Any = None,
+            sync_y: bool = True,
+            calls: Iterable[str | tuple | list] = (),
+            frame_id: str = "psc-frame",
+            **kwargs,
+    ) -> "ChartGrid":
+        """
+        grid of one vertical chart per dataset, sharing the x values
+        :param chart_type: vertical chart class or its name, e.g. "SimpleLineChart"
+        :param x_values: the x values shared by every dataset
+        :param datasets: the y values of each chart, each a list of series
+        :param columns: number of charts in a row
+        :param gap: space between the cells
+        :param y_names: optional names of the series of every dataset
+        :param y_min: optional minimum value of the y-axes
+        :param y_max: optional maximum value of the y-axes
+        :param sync_y: whether the charts share one y scale, spanning all datasets, and one frame of axes and legend
+        :param calls: calls to make on each chart, given as a name, (name, kwargs) or (name, args, kwargs)
+        :param frame_id: id of the shared frame, unique within the document the grid is embedded in
+        :param kwargs: any other arguments of the charts
+        """
+        datasets = [as_series_list(y_values) for y_values in datasets]
+        if not datasets:
+            raise ValueError("a grid needs at least one chart")
+        y_names = Chart.generate_series_names("Series", len(datasets[0]), y_names)
+        if not sync_y:
+            charts = [
+                ChartSpec(chart_type, dict(kwargs, x_values=x_values, y_values=y_values, y_names=y_names,
+                                           y_min=y_min, y_max=y_max), calls).build()
+                for y_values in datasets
+            ]
+            return cls(charts, columns, gap)
+        if y_min is None or y_max is None:
+            summary = summarize(SeriesColumns(column for y_values in datasets for column in y_values))
+            if summary.count == 0:
+                raise ValueError("No values to scale the y-axes to.")
+            y_min = summary.minimum if y_min is None else y_min
+            y_max = summary.maximum if y_max is None else y_max
+        template = ChartTemplate(chart_type, x_values, y_names, y_min, y_max, calls=calls, **kwargs)
+        charts = [template.stamp(y_values) for y_values in datasets]
+        return cls(charts, columns, gap, frame=template.chart, frame_id=frame_id)
+
+    def get_panel_position(self, index: int) -> tuple[number, number]:
+        row, column = divmod(index, self.columns)
+        return column * (self.cell_width + self.gap), row * (self.cell_height + self.gap)
+
+    def iter_render(
+            self,
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+    ) -> Iterator[str]:
+        """
+        render the grid as a sequence of svg fragments, one element at a time
+        :param styles: optional named styles to include in the style block
+        :param include_default: whether to include the default styles
+        :param intern_styles: whether to replace repeated inline styles with css classes shared by all panels
+        """
+        interner = StyleInterner() if intern_styles else None
+        yield Chart.svg_begin_template.format(height=self.height, width=self.width)
+        if styles is not None or include_default:
+            yield "<style>"
+            yield render_all_styles(styles, include_default)
+            yield "</style>"
+        if self.frame is not None:
+            yield "<defs>"
+            yield f'<g id="{self.frame_id}">'
+            yield from self.iter_render_frame(interner)
+            yield "</g>"
+            yield "</defs>"
+        yield from self.iter_render_panels(interner, self.frame_id)
+        yield from Chart.iter_render_end(interner)
+
+    def iter_render_frame(self, interner: StyleInterner | None = None) -> Iterator[str]:
+        """
+        render the axes and legend shared by the panels, if they share them
+        """
+        if self.frame is not None:
+            yield from iter_in_context(
+                self.frame.get_render_context(interner),
+                iter_element_list([self.frame.x_axis], [self.frame.y_axis], [self.frame.legend]),
+            )
+
+    def iter_render_panels(self, interner: StyleInterner | None = None, frame_id: str | None = None) -> Iterator[str]:
+        """
+        render the panels, referencing the shared frame by its id
+        """
+        for index, chart in enumerate(self.charts):
+            x, y = self.get_panel_position(index)
+            yield self.panel_template.format(x=x, y=y)
+            yield from iter_in_context(chart.get_render_context(interner), self.iter_panel_element_list(chart, frame_id))
+            yield "</g>"
+
+    def iter_panel_element_list(self, chart: Chart, frame_id: str | None) -> Iterator[str]:
+        if self.frame is None:
+            yield from chart.iter_element_list()
+            return
+        yield self.frame_template.format(frame_id=frame_id)
+        yield from iter_element_list([chart.series[s] for s in chart.series], chart.custom_elements)
+
+    def render(
+            self,
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+    ) -> str:
+        return "\n".join(self.iter_render(styles, include_default, intern_styles))
+
+    def save(
+            self,
+            file_path: str,
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+    ) -> None:
+        with open(file_path, "w+") as file:
+            file.write(self.render(styles, include_default, intern_styles))
+
+
+page_layouts = ("html", "svg")
+
+html_page_template = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+{styles}
+</style>
+</head>
+<body>
+{defs}<div class="psc-page">
+{body}
+</div>
+</body>
+</html>"""
+
+
+def iter_render_item(item: Chart | ChartGrid, interner: StyleInterner | None, frame_id: str | None) -> Iterator[str]:
+    """
+    render the elements of a chart or the panels of a grid, without the svg element and style block
+    """
+    if isinstance(item, ChartGrid):
+        yield from item.iter_render_panels(interner, frame_id)
+    else:
+        yield from iter_in_context(item.get_render_context(interner), item.iter_element_list())
+
+
+def render_frames(items: list[Chart | ChartGrid], interner: StyleInterner | None) -> tuple[list[str | None], list[str]]:
+    """
+    render the frames of the grids once per distinct frame, as the ids each grid references and the defs
+    """
+    frame_ids: dict[str, str] = {}
+    defs: list[str] = []
+    references: list[str | None] = []
+    for item in items:
+        if not isinstance(item, ChartGrid) or item.frame is None:
+            references.append(None)
+            continue
+        frame = "\n".join(item.iter_render_frame(interner))
+        if frame not in frame_ids:
+            frame_ids[frame] = f"{item.frame_id}-{len(frame_ids)}"
+            defs.extend([f'<g id="{frame_ids[frame]}">', frame, "</g>"])
+        references.append(frame_ids[frame])
+    return references, defs
+
+
+def render_page(
+        charts: list[Chart | ChartGrid],
+        layout: str = "html",
+        columns: int = 1,
+        gap: number = 0,
+        styles: named_styles | None = None,
+        include_default: bool = True,
+        intern_styles: bool = True,
+        title: str = "",
+) -> str:
+    """
+    render many charts and grids as one document, with one style block, styles interned across all charts
+    and the frames shared by the panels of grids rendered once
+    :param charts: charts and grids to render, laid out row by row
+    :param layout: "html" for a page of inline svgs or "svg" for a single svg
+    :param columns: number of charts in a row
+    :param gap: space between the charts, in pixels
+    :param styles: optional named styles to include in the style block
+    :param include_default: whether to include the default styles
+    :param intern_styles: whether to replace repeated inline styles with css classes shared by all charts
+    :param title: title of the html page
+    """
+    if layout not in page_layouts:
+        raise ValueError(f"unknown page layout {layout!r}, use one of {', '.join(page_layouts)}")
+    items = list(charts)
+    interner = StyleInterner() if intern_styles else None
+    frame_ids, defs = render_frames(items, interner)
+    if layout == "svg":
+        page = ChartGrid(items, columns, gap)
+        body = [Chart.svg_begin_template.format(height=page.height, width=page.width)]
+        if defs:
+            body.extend(["<defs>", *defs, "</defs>"])
+        for index, (item, frame_id) in enumerate(zip(items, frame_ids)):
+            x, y = page.get_panel_position(index)
+            body.append(page.panel_template.format(x=x, y=y))
+            body.extend(iter_render_item(item, interner, frame_id))
+            body.append("</g>")
+        # styles go last, as only then the interned ones are known
+        if styles is not None or include_default:
+            body.extend(["<style>", render_all_styles(styles, include_default), "</style>"])
+        body.extend(Chart.iter_render_end(interner))
+        return "\n".join(body)
+
+    # referenced across the document, so one hidden svg holds the frames of all grids
+    hidden_defs = "\n".join(
+        ['<svg width="0" height="0" style="position:absolute">', "<defs>", *defs, "</defs>", "</svg>", ""]
+    ) if defs else ""
+    body = []
+    for item, frame_id in zip(items, frame_ids):
+        body.append(Chart.svg_begin_template.format(height=item.height, width=item.width))
+        body.extend(iter_render_item(item, interner, frame_id))
+        body.append("</svg>")
+    page_styles = {
+        ".psc-page": {
+            "display": "grid",
+            "grid-template-columns": f"repeat({columns}, minmax(0, 1fr))",
+            "gap": f"{gap}px",
+        },
+        **(styles or {}),
+        **(interner.styles if interner is not None else {}),
+    }
+    return html_page_template.format(
+        title=html.escape(title),
+        styles=render_all_styles(page_styles, include_default),
+        defs=hidden_defs,
+        body="\n".join(body),
+    )
@@ -0,0 +1,133 @@
+"""
+Path data encoding.
+
+Paths are written with absolute commands by default. The relative encoding writes each
+step as an offset from the previous point, using h/v for axis-aligned steps, implicit
+command repetition and only the separators the path grammar needs, which makes long
+paths much shorter.
+
+Functions:
+    join_numbers(numbers): Join formatted numbers with minimal separators
+    relative_line_path(points, precision): Path data of a polyline in relative commands
+    relative_donut_path(...): Path data of a donut segment in relative commands
+"""
+from contextvars import ContextVar
+
+from .helpers import make_coordinate_formatter
+from .shapes import Point, PointColumns
+from .shared import number
+
+path_encodings = ("absolute", "relative")
+# relative steps between unrounded floats carry rounding noise (0.09999999999999964), so
+# without a coordinate precision positions are rounded to a millionth of a pixel
+default_relative_precision = 6
+
+# path encoding of the render in progress
+active_path_encoding: ContextVar[str] = ContextVar("active_path_encoding", default="absolute")
+
+
+def validate_path_encoding(encoding: str) -> str:
+    if encoding not in path_encodings:
+        raise ValueError(f"unknown path encoding {encoding!r}, use one of {', '.join(path_encodings)}")
+    return encoding
+
+
+def quantize(value: number, precision: int | None) -> number:
+    return value if precision is None else round(value, precision)
+
+
+def join_numbers(numbers: list[str]) -> str:
+    """
+    join formatted numbers, dropping leading zeros and any separator the next number's sign or dot makes redundant
+    """
+    joined: list[str] = []
+    previous = ""
+    for text in numbers:
+        if text.startswith("0."):
+            text = text[1:]
+        elif text.startswith("-0."):
+            text = "-" + text[2:]
+        if joined and not (text[0] == "-" or (text[0] == "." and "." in previous)):
+            joined.append(" ")
+        joined.append(text)
+        previous = text
+    return "".join(joined)
+
+
+def relative_line_path(points: list[Point] | PointColumns, precision: int | None = None) -> str:
+    """
+    path data of a polyline: an absolute move to the first point, then relative l/h/v steps
+    NOTE steps are taken between rounded positions, so rounding errors do not accumulate along the path;
+    points positioned as None (outside the visible range) break the path, which restarts with an
+    absolute move at the next positioned point.
+    """
+    precision = default_relative_precision if precision is None else precision
+    fmt = make_coordinate_formatter(precision)
+    positions = points.positions() if isinstance(points, PointColumns) else ((p.x, p.y) for p in points)
+    commands: list[str] = []
+    command = ""
+    arguments: list[str] = []
+    last_x = last_y = None
+    for point_x, point_y in positions:
+        if point_x is None or point_y is None:
+            last_x = last_y = None
+            continue
+        x, y = quantize(point_x, precision), quantize(point_y, precision)
+        if last_x is None or last_y is None:
+            if arguments:
+                commands.append(command + join_numbers(arguments))
+            commands.append("M" + join_numbers([fmt(x), fmt(y)]))
+            command, arguments = "", []
+            last_x, last_y = x, y
+            continue
+        dx, dy = quantize(x - last_x, precision), quantize(y - last_y, precision)
+        last_x, last_y = x, y
+        if dy == 0:
+            if dx == 0:
+                continue
+            step, values = "h", [dx]
+        elif dx == 0:
+            step, values = "v", [dy]
+        else:
+            step, values = "l", [dx, dy]
+        if step != command:
+            if arguments:
+                commands.append(command + join_numbers(arguments))
+            command, arguments = step, []
+        arguments.extend(fmt(value) for value in values)
+    if arguments:
+        commands.append(command + join_numbers(arguments))
+    return "".join(commands)
+
+
+def relative_donut_path(
+    outer_begin: tuple[number, number],
+    outer_end: tuple[number, number],
+    inner_begin: tuple[number, number],
+    inner_end: tuple[number, number],
+    radius_outer: number,
+    radius_inner: number,
+    large_arc_flag: int,
+    precision: int | None = None,
+) -> str:
+    """
+    path data of a donut segment: outer arc, line to the inner arc, inner arc back, close
+    """
+    precision = default_relative_precision if precision is None else precision
+    fmt = make_coordinate_formatter(precision)
+    corners = [
+        (quantize(x, precision), quantize(y, precision))
+        for x, y in (outer_begin, outer_end, inner_begin, inner_end)
+    ]
+    begin_x, begin_y = corners[0]
+    deltas = [
+        [fmt(quantize(x2 - x1, precision)), fmt(quantize(y2 - y1, precision))]
+        for (x1, y1), (x2, y2) in zip(corners, corners[1:])
+    ]
+    return (
+        "M" + join_numbers([fmt(begin_x), fmt(begin_y)])
+        + "a" + join_numbers([fmt(radius_outer), fmt(radius_outer), "0", str(large_arc_flag), "1", *deltas[0]])
+        + "l" + join_numbers(deltas[1])
+        + "a" + join_numbers([fmt(radius_inner), fmt(radius_inner), "0", str(large_arc_flag), "0", *deltas[2]])
+        + "Z"
+    )
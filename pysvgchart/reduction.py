@@ -0,0 +1,276 @@
+"""
+Data reduction for dense series.
+
+Dense series carry far more points than the plot area has pixels. These reducers
+pick the subset of points worth rendering, working on pixel positions so that the
+result depends on how the chart looks rather than on the units of the data.
+
+Line reducers:
+    lttb(x_positions, y_positions, threshold): Largest-Triangle-Three-Buckets downsampling
+    m4(x_positions, y_positions, threshold): first/last/min/max per pixel column decimation
+
+Each line reducer returns the (sorted) indices of the points to keep, so the caller
+can select the matching data values as well as the positions.
+
+Scatter reducers:
+    snap_to_grid(x_positions, y_positions, cell_size): first point of each grid cell
+    bin_positions(x_positions, y_positions, cell_size, bin_shape): point counts per rect/hex bin
+"""
+import math
+from collections.abc import Callable, Sequence
+
+from .shared import number
+
+
+# default point budget for a downsampled line, relative to the x-axis length in pixels
+default_points_per_pixel = 2
+# m4 keeps up to four points per pixel column
+m4_points_per_column = 4
+
+
+def lttb(
+    x_positions: Sequence[number],
+    y_positions: Sequence[number],
+    threshold: int,
+) -> list[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling: keep the first and last point and,
+    for each of threshold - 2 buckets in between, the point forming the largest
+    triangle with the previously kept point and the average of the next bucket
+    :param x_positions: x positions of the points, sorted
+    :param y_positions: y positions of the points
+    :param threshold: maximum number of points to keep
+    """
+    length = len(x_positions)
+    if threshold >= length:
+        return list(range(length))
+    if threshold < 3:
+        return [0, length - 1][:max(threshold, 0)]
+    indices = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    kept = 0
+    for bucket in range(threshold - 2):
+        # average of the next bucket is the third corner of the triangle
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(x_positions[next_start:next_end]) / next_count
+        avg_y = sum(y_positions[next_start:next_end]) / next_count
+        # the point of this bucket spanning the largest triangle is kept
+        kept_x, kept_y = x_positions[kept], y_positions[kept]
+        max_area = -1.0
+        for index in range(int(bucket * bucket_size) + 1, next_start):
+            area = abs(
+                (kept_x - avg_x) * (y_positions[index] - kept_y)
+                - (kept_x - x_positions[index]) * (avg_y - kept_y)
+            )
+            if area > max_area:
+                max_area = area
+                kept = index
+        indices.append(kept)
+    indices.append(length - 1)
+    return indices
+
+
+def m4(
+    x_positions: Sequence[number],
+    y_positions: Sequence[number],
+    threshold: int,
+) -> list[int]:
+    """
+    M4 decimation: keep the first, last, minimum and maximum point of each pixel column,
+    so a line rasterized at one pixel per column looks the same as the full line; columns
+    are whole pixels (floor of the x position), merged into bins of several pixels when
+    the threshold allows fewer than four points per pixel; a single pass over sorted x positions
+    :param x_positions: x positions of the points in pixels, sorted
+    :param y_positions: y positions of the points
+    :param threshold: maximum number of points to keep
+    """
+    length = len(x_positions)
+    columns = threshold // m4_points_per_column
+    if length <= threshold or columns < 1:
+        return list(range(length))
+    first_pixel = math.floor(x_positions[0])
+    pixels = math.floor(x_positions[-1]) - first_pixel + 1
+    pixels_per_column = -(-pixels // columns)
+    indices: list[int] = []
+    column = -1
+    first = last = low = high = 0
+    low_y = high_y = 0.0
+    for index, (x, y) in enumerate(zip(x_positions, y_positions)):
+        current = (math.floor(x) - first_pixel) // pixels_per_column
+        if current != column:
+            if column >= 0:
+                indices.extend(sorted({first, low, high, last}))
+            column = current
+            first = last = low = high = index
+            low_y = high_y = y
+            continue
+        last = index
+        if y < low_y:
+            low, low_y = index, y
+        elif y > high_y:
+            high, high_y = index, y
+    indices.extend(sorted({first, low, high, last}))
+    return indices
+
+
+line_reducers: dict[str, Callable[[Sequence[number], Sequence[number], int], list[int]]] = {
+    "lttb": lttb,
+    "m4": m4,
+}
+
+# default point budget per reducer, relative to the x-axis length in pixels
+line_reducer_points_per_pixel: dict[str, int] = {
+    "m4": m4_points_per_column,
+}
+
+
+def get_line_reducer(
+    reducer: str | Callable[[Sequence[number], Sequence[number], int], list[int]],
+) -> Callable[[Sequence[number], Sequence[number], int], list[int]]:
+    """
+    look up a line reducer by name, or pass a custom reducer through
+    """
+    if callable(reducer):
+        return reducer
+    if reducer not in line_reducers:
+        raise ValueError(f"unknown downsample mode {reducer!r}, use one of {', '.join(line_reducers)}")
+    return line_reducers[reducer]
+
+
+def default_reduction_threshold(
+    reducer: str | Callable[[Sequence[number], Sequence[number], int], list[int]],
+    axis_length: number,
+) -> int:
+    """
+    default point budget for a reducer on an axis of the given length
+    """
+    if reducer == "m4":
+        # a line spanning the axis touches one more pixel column than the axis is long
+        return m4_points_per_column * (math.ceil(axis_length) + 1)
+    points_per_pixel = (
+        default_points_per_pixel
+        if callable(reducer)
+        else line_reducer_points_per_pixel.get(reducer, default_points_per_pixel)
+    )
+    return int(points_per_pixel * axis_length)
+
+
+def reduce_positions(
+    reducer: Callable[[Sequence[number], Sequence[number], int], list[int]],
+    x_positions: Sequence[number | None],
+    y_positions: Sequence[number | None],
+    threshold: int,
+) -> list[int]:
+    """
+    indices of the points kept by a reducer, skipping points outside the visible range
+    """
+    valid = [
+        index
+        for index, (x, y) in enumerate(zip(x_positions, y_positions))
+        if x is not None and y is not None
+    ]
+    if len(valid) == len(x_positions):
+        return reducer(x_positions, y_positions, threshold)  # type: ignore[arg-type]
+    kept = reducer(
+        [x_positions[index] for index in valid],  # type: ignore[misc]
+        [y_positions[index] for index in valid],  # type: ignore[misc]
+        threshold,
+    )
+    return [valid[index] for index in kept]
+
+
+# default cell size in pixels per scatter reduction
+scatter_reduction_cell_sizes: dict[str, number] = {
+    "grid": 1,
+    "density": 10,
+}
+
+
+def snap_to_grid(
+    x_positions: Sequence[number | None],
+    y_positions: Sequence[number | None],
+    cell_size: number = 1,
+) -> list[int]:
+    """
+    indices of the first point in each grid cell, skipping points outside the visible range
+    :param x_positions: x positions of the points
+    :param y_positions: y positions of the points
+    :param cell_size: width and height of the grid cells
+    """
+    seen: set[tuple[int, int]] = set()
+    kept = []
+    for index, (x, y) in enumerate(zip(x_positions, y_positions)):
+        if x is None or y is None:
+            continue
+        cell = (round(x / cell_size), round(y / cell_size))
+        if cell not in seen:
+            seen.add(cell)
+            kept.append(index)
+    return kept
+
+
+def rect_bin(x: number, y: number, cell_size: number) -> tuple[number, number]:
+    """
+    centre of the square bin of a position
+    """
+    return (
+        (math.floor(x / cell_size) + 0.5) * cell_size,
+        (math.floor(y / cell_size) + 0.5) * cell_size,
+    )
+
+
+def hex_bin(x: number, y: number, cell_size: number) -> tuple[number, number]:
+    """
+    centre of the pointy-top hexagonal bin of a position, cell_size being the hexagon width
+    """
+    dx = cell_size
+    dy = cell_size * math.sqrt(3) / 2
+    py = y / dy
+    row = round(py)
+    px = x / dx - (row & 1) / 2
+    column = round(px)
+    py1 = py - row
+    if abs(py1) * 3 > 1:
+        # near a row boundary the neighbouring row's hexagon may be closer
+        px1 = px - column
+        column2 = column + (-1 if px < column else 1) / 2
+        row2 = row + (-1 if py < row else 1)
+        px2 = px - column2
+        py2 = py - row2
+        if (px1 * dx) ** 2 + (py1 * dy) ** 2 > (px2 * dx) ** 2 + (py2 * dy) ** 2:
+            column = column2 + (1 if row & 1 else -1) / 2  # type: ignore[assignment]
+            row = row2
+    return (column + (row & 1) / 2) * dx, row * dy
+
+
+density_binners: dict[str, Callable[[number, number, number], tuple[number, number]]] = {
+    "rect": rect_bin,
+    "hex": hex_bin,
+}
+
+
+def bin_positions(
+    x_positions: Sequence[number | None],
+    y_positions: Sequence[number | None],
+    cell_size: number,
+    bin_shape: str = "rect",
+) -> dict[tuple[number, number], int]:
+    """
+    number of points per bin, keyed by bin centre, skipping points outside the visible range
+    :param x_positions: x positions of the points
+    :param y_positions: y positions of the points
+    :param cell_size: width of the bins
+    :param bin_shape: "rect" or "hex"
+    """
+    if bin_shape not in density_binners:
+        raise ValueError(f"unknown bin shape {bin_shape!r}, use one of {', '.join(density_binners)}")
+    binner = density_binners[bin_shape]
+    counts: dict[tuple[number, number], int] = {}
+    for x, y in zip(x_positions, y_positions):
+        if x is None or y is None:
+            continue
+        centre = binner(x, y, cell_size)
+        counts[centre] = counts.get(centre, 0) + 1
+    return counts
@@ -20,12 +20,13 @@ Factory functions:
 
 The value_to_fraction() method is the key interface - converts a data value to
 a proportion (0.0 to 1.0) along the axis, which the Axis then converts to pixels.
+value_to_fractions() does the same for a whole sequence of values, vectorized when
+given a numpy array.
 """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date, timedelta
-from numbers import Real
 from typing import Any
 
 import math
@@ -35,12 +36,17 @@ from .helpers import (
     get_logarithmic_ticks,
     get_numeric_ticks,
 )
+from .instrumentation import SCALE, instrumented
 from .shared import (
     dates_sequence,
     datetimes_sequence,
     number,
     numbers_sequence,
+    is_array,
+    is_numeric_array,
+    np,
 )
+from .summary import DATE, NUMBER, DataSummary, SeriesColumns, summarize
 
 
 class Scale(ABC):
@@ -66,6 +72,18 @@ class Scale(ABC):
         """
         ...
 
+    def value_to_fractions(self, values) -> Any:
+        """
+        proportions of the scale for a sequence of values: a list, or a numpy array for array input
+        """
+        if is_array(values):
+            return np.fromiter(
+                (self.value_to_fraction(value) for value in values.tolist()),
+                dtype=float,
+                count=len(values),
+            )
+        return [self.value_to_fraction(value) for value in values]
+
 
 class MappedLinearScale(Scale):
     """
@@ -117,10 +135,21 @@ class MappedLinearScale(Scale):
         fraction = (self.map_value(value) - self.lo) / self.size  # type: ignore[operator]
         return fraction - self.shift if self.shift else fraction  # type: ignore[operator, return-value]
 
+    def value_to_fractions(self, values) -> Any:
+        if is_numeric_array(values) and isinstance(self.lo, number):
+            # a single affine transform over the whole array
+            fractions = (self.map_values(values) - self.lo) / self.size
+            return fractions - self.shift if self.shift else fractions
+        return super().value_to_fractions(values)
+
     @staticmethod
     @abstractmethod
     def map_value(value: date | datetime | number) -> date | datetime | number: ...
 
+    @staticmethod
+    @abstractmethod
+    def map_values(values: Any) -> Any: ...
+
 
 class LinearScale(MappedLinearScale):
     """
@@ -134,6 +163,13 @@ class LinearScale(MappedLinearScale):
         """
         return value
 
+    @staticmethod
+    def map_values(values: Any) -> Any:
+        """
+        numpy array unchanged in mapping
+        """
+        return values
+
 
 class LogarithmicScale(MappedLinearScale):
     """
@@ -152,10 +188,17 @@ class LogarithmicScale(MappedLinearScale):
     @staticmethod
     def map_value(value: number) -> number:  # type: ignore[override]
         """
-        values unchanged in mapping
+        values mapped to their log10
         """
         return math.log10(value)
 
+    @staticmethod
+    def map_values(values: Any) -> Any:
+        """
+        numpy array mapped to its log10
+        """
+        return np.log10(values)
+
 
 class MappingScale(Scale):
     """
@@ -179,7 +222,33 @@ class MappingScale(Scale):
     def value_to_fraction(self, value) -> float:
         return self.map.get(value, -1.0)
 
+    def value_to_fractions(self, values) -> Any:
+        if is_array(values) and len(values) > 0:
+            # look up each distinct value once, then scatter back over the array
+            uniques, inverse = np.unique(values, return_inverse=True)
+            return np.array([self.map.get(value, -1.0) for value in uniques.tolist()])[inverse]
+        return super().value_to_fractions(values)
 
+
+def validate_summary(
+    values: Any,
+    min_unique_values: int,
+    summary: DataSummary | None = None,
+) -> DataSummary:
+    """
+    summarize the values of a scale unless already done, requiring enough unique values
+    """
+    if summary is None and values is not None and isinstance(values, list | tuple | SeriesColumns):
+        summary = summarize(values, unique_limit=min_unique_values)
+    if summary is None or summary.unique_count < min_unique_values:
+        raise ValueError(
+            "Values must be non-empty with at least %d unique elements.",
+            min_unique_values,
+        )
+    return summary
+
+
+@instrumented(SCALE, count=lambda scale: len(scale.ticks))
 def make_categories_scale(
     values: list | tuple,
     max_ticks: int,
@@ -204,6 +273,7 @@ def make_categories_scale(
     return MappingScale(list(values))
 
 
+@instrumented(SCALE, count=lambda scale: len(scale.ticks))
 def make_logarithmic_scale(
     values: numbers_sequence,
     max_ticks: int,
@@ -212,29 +282,24 @@ def make_logarithmic_scale(
     include_zero: bool = False,
     shift: bool = False,
     min_unique_values: int = 2,
+    summary: DataSummary | None = None,
 ) -> Scale:
-    if (
-        values is None
-        or not isinstance(values, list | tuple)
-        or len(set(values)) < min_unique_values
-    ):
-        raise ValueError(
-            "Values must be non-empty with at least %d unique elements.",
-            min_unique_values,
-        )
-    if all(isinstance(value, Real) for value in values):
+    summary = validate_summary(values, min_unique_values, summary)
+    if summary.kind == NUMBER:
         ticks = get_logarithmic_ticks(
             values,
             max_ticks,
             min_value=min_value,
             max_value=max_value,
             include_zero=include_zero,
+            summary=summary,
         )
-        return LogarithmicScale(ticks, shift=min(values) if shift is True else shift)
+        return LogarithmicScale(ticks, shift=summary.minimum if shift is True else shift)
     # mixed value types or value type for which there's no ticks creator
     return MappingScale(list(values))
 
 
+@instrumented(SCALE, count=lambda scale: len(scale.ticks))
 def make_linear_scale(
     values: dates_sequence | datetimes_sequence | numbers_sequence,
     max_ticks: int,
@@ -243,6 +308,7 @@ def make_linear_scale(
     include_zero: bool = False,
     shift: bool = False,
     min_unique_values: int = 2,
+    summary: DataSummary | None = None,
 ) -> Scale:
     """
     make a scale for a series of values
@@ -254,42 +320,29 @@ def make_linear_scale(
     :param include_zero: whether to include zero on the scale
     :param shift: optional shift for the scale
     :param min_unique_values: minimum number of unique values required
+    :param summary: optional summary of the values, so they need not be scanned again
     """
-    if (
-        values is None
-        or not isinstance(values, list | tuple)
-        or len(set(values)) < min_unique_values
-    ):
-        raise ValueError(
-            "Values must be non-empty with at least %d unique elements.",
-            min_unique_values,
-        )
+    summary = validate_summary(values, min_unique_values, summary)
     # value types for which there is a ticks creator
     ticks: dates_sequence | datetimes_sequence | numbers_sequence
-    if all(isinstance(value, date) for value in values):
-        ticks = get_date_or_time_ticks(
-            values,  # type: ignore[arg-type]
-            max_ticks,
-            min_value=min_value,  # type: ignore[arg-type]
-            max_value=max_value,  # type: ignore[arg-type]
-        )
-        return LinearScale(ticks, shift=min(values) if shift is True else shift)
-    if all(isinstance(value, datetime) for value in values):
+    if summary.kind == DATE:
         ticks = get_date_or_time_ticks(
             values,  # type: ignore[arg-type]
             max_ticks,
             min_value=min_value,  # type: ignore[arg-type]
             max_value=max_value,  # type: ignore[arg-type]
+            summary=summary,
         )
-        return LinearScale(ticks, shift=min(values) if shift is True else shift)
-    if all(isinstance(value, Real) for value in values):
+        return LinearScale(ticks, shift=summary.minimum if shift is True else shift)
+    if summary.kind == NUMBER:
         ticks = get_numeric_ticks(
             values,  # type: ignore[arg-type]
             max_ticks,
             min_value=min_value,  # type: ignore[arg-type]
             max_value=max_value,  # type: ignore[arg-type]
             include_zero=include_zero,
+            summary=summary,
         )
-        return LinearScale(ticks, shift=min(values) if shift is True else shift)
+        return LinearScale(ticks, shift=summary.minimum if shift is True else shift)
     # mixed value types or value type for which there's no ticks creator
     return MappingScale(list(values))
@@ -9,27 +9,63 @@ Classes:
     BarSeries: Renders as vertical rectangles
     HorizontalBarSeries: Renders as horizontal rectangles
     ScatterSeries: Renders as point shapes (circles by default)
+    DensitySeries: Renders binned scatter points as shaded rect/hex cells
     DonutSegment: Renders as arc path for pie/donut charts
 
 Key pattern:
     - Series store both pixel positions (points) and original data values
     - pv_generator property yields (point, x_value, y_value) tuples for hover modifiers
     - get_element_list() returns SVG string fragments
+    - line and donut paths use relative commands when the chart's path_encoding is "relative"
     - custom_elements list allows adding hover markers and annotations
 """
 from typing import Callable
 import math
 
-from .helpers import collapse_element_list
-from .shapes import Circle, Element, Point, Shape
+from .helpers import active_coordinate_precision, collapse_element_list, get_coordinate_formatter
+from .paths import active_path_encoding, relative_donut_path, relative_line_path
+from .shapes import Circle, Element, Point, PointColumns, Rect, Shape, format_attributes
 from .shared import number, numbers_sequence, style_def
 
 
+class LazyAttribute:
+    """
+    attribute that may be set to a function making its value, called on first access and cached
+    an optional convert function is applied to values as they are stored
+    """
+
+    def __init__(self, convert: Callable | None = None) -> None:
+        self.convert = convert
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.private_name = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.private_name)
+        if callable(value):
+            value = value() if self.convert is None else self.convert(value())
+            setattr(instance, self.private_name, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        if self.convert is not None and not callable(value):
+            value = self.convert(value)
+        setattr(instance, self.private_name, value)
+
+
 class Series(Shape):
     """
     base class for series
+    series with points take them as a list or as a function making them on first access,
+    so that a chart that is never rendered never computes its geometry
+    points are stored as PointColumns: two array('d') columns instead of a list of Point objects
     """
 
+    __slots__ = ("custom_elements", "_position")
+    position = LazyAttribute()
+
     def __init__(
             self,
             x_position: number,
@@ -47,6 +83,9 @@ class Series(Shape):
     def add_custom_elements(self, custom_elements: list[Element]):
         self.custom_elements.extend(custom_elements)
 
+    def first_position(self) -> Point:
+        return Point(x=self.points[0].x, y=self.points[0].y)  # type: ignore[attr-defined]
+
     def get_element_list(self) -> list:
         return []
 
@@ -66,6 +105,8 @@ class DonutSegment(Series):
     )
 
     # fmt: on
+    __slots__ = ("start_theta", "end_theta", "centre_x", "centre_y", "radius_inner", "radius_outer")
+    relative_path_template = '<path d="{path}" {attributes}></path>'
 
     def __init__(
             self,
@@ -132,20 +173,37 @@ class DonutSegment(Series):
     def large_arc_flag(self):
         return 1 if (self.end_theta - self.start_theta) > 180 else 0
 
+    def get_relative_path(self) -> str:
+        return relative_donut_path(
+            outer_begin=(self.outer_begin_x, self.outer_begin_y),
+            outer_end=(self.outer_end_x, self.outer_end_y),
+            inner_begin=(self.inner_begin_x, self.inner_begin_y),
+            inner_end=(self.inner_end_x, self.inner_end_y),
+            radius_outer=self.radius_outer,
+            radius_inner=self.radius_inner,
+            large_arc_flag=self.large_arc_flag,
+            precision=active_coordinate_precision.get(),
+        )
+
     def get_element_list(self) -> list:
+        if active_path_encoding.get() == "relative":
+            return [
+                self.relative_path_template.format(path=self.get_relative_path(), attributes=self.attributes)
+            ] + collapse_element_list(self.custom_elements)
+        fmt = get_coordinate_formatter()
         return [
             self.path_template.format(
-                outer_begin_x=self.outer_begin_x,
-                outer_begin_y=self.outer_begin_y,
-                radius_inner=self.radius_inner,
-                radius_outer=self.radius_outer,
+                outer_begin_x=fmt(self.outer_begin_x),
+                outer_begin_y=fmt(self.outer_begin_y),
+                radius_inner=fmt(self.radius_inner),
+                radius_outer=fmt(self.radius_outer),
                 large_arc_flag=self.large_arc_flag,
-                outer_end_x=self.outer_end_x,
-                outer_end_y=self.outer_end_y,
-                inner_end_x=self.inner_end_x,
-                inner_end_y=self.inner_end_y,
-                inner_begin_x=self.inner_begin_x,
-                inner_begin_y=self.inner_begin_y,
+                outer_end_x=fmt(self.outer_end_x),
+                outer_end_y=fmt(self.outer_end_y),
+                inner_end_x=fmt(self.inner_end_x),
+                inner_end_y=fmt(self.inner_end_y),
+                inner_begin_x=fmt(self.inner_begin_x),
+                inner_begin_y=fmt(self.inner_begin_y),
                 attributes=self.attributes,
             )
         ] + collapse_element_list(self.custom_elements)
@@ -158,44 +216,57 @@ class LineSeries(Series):
 
     __default_styles__ = {"stroke-width": "2"}
     path_begin_template = '<path d="{path}" fill="none" {attributes}/>'
+    __slots__ = ("_points", "x_values", "y_values", "hover_data")
+    points = LazyAttribute(convert=PointColumns.from_points)
 
     def __init__(
             self,
-            points: list[Point],
+            points: list[Point] | Callable[[], list[Point]],
             x_values: numbers_sequence,
             y_values: numbers_sequence,
             styles: style_def | None = None,
             classes: list[str] | None = None,
+            hover_data: tuple[list[Point], numbers_sequence, numbers_sequence] | None = None,
     ):
-        super().__init__(
-            x_position=points[0].x,
-            y_position=points[0].y,
-            styles=styles,
-            classes=classes,
-        )
+        """
+        :param points: positions of the points, or a function making them on first access
+        :param hover_data: optional (points, x_values, y_values) for hover markers when the line is downsampled
+        """
+        super().__init__(x_position=0, y_position=0, styles=styles, classes=classes)
         self.points = points
+        self.position = self.first_position
         self.x_values = x_values
         self.y_values = y_values
+        self.hover_data = hover_data
 
     @property
     def pv_generator(self):
+        if self.hover_data is not None:
+            return zip(*self.hover_data)
         return zip(self.points, self.x_values, self.y_values)
 
     @property
     def path_length(self) -> number:
         return (
             sum(
-                math.sqrt((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2)
-                for p1, p2 in zip(self.points, self.points[1:])
+                math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+                for (x1, y1), (x2, y2) in zip(self.points.positions(), self.points[1:].positions())
             )
             if len(self.points) > 1
             else 0
         )
 
     def get_element_list(self) -> list:
-        path = " ".join(
-            [f"L {p.x} {p.y}" if i else f"M {p.x} {p.y}" for i, p in enumerate(self.points)]
-        )
+        if active_path_encoding.get() == "relative":
+            path = relative_line_path(self.points, active_coordinate_precision.get())
+        else:
+            fmt = get_coordinate_formatter()
+            path = " ".join(
+                [
+                    f"L {fmt(x)} {fmt(y)}" if i else f"M {fmt(x)} {fmt(y)}"
+                    for i, (x, y) in enumerate(self.points.positions())
+                ]
+            )
         return [
             self.path_begin_template.format(path=path, attributes=self.attributes)
         ] + collapse_element_list(self.custom_elements)
@@ -204,47 +275,72 @@ class LineSeries(Series):
 class BarSeries(Series):
     """
     series for bar charts
+    with single_path set, all bars are rendered as one path instead of a rect per bar
     """
 
     bar_template = '<rect x="{x}" y="{y}" width="{w}" height="{h}" {attributes}/>'
+    path_template = '<path d="{path}" {attributes}/>'
     __default_styles__ = {"stroke": "none"}
+    __slots__ = ("_points", "x_values", "y_values", "bar_width", "_bar_heights", "single_path")
+    points = LazyAttribute(convert=PointColumns.from_points)
+    bar_heights = LazyAttribute()
 
     def __init__(
             self,
-            points: list[Point],
+            points: list[Point] | Callable[[], list[Point]],
             x_values: numbers_sequence,
             y_values: numbers_sequence,
             bar_width: number,
-            bar_heights: numbers_sequence,
+            bar_heights: numbers_sequence | Callable[[], numbers_sequence],
             styles: style_def | None = None,
             classes: list[str] | None = None,
     ):
-        super().__init__(
-            x_position=points[0].x,
-            y_position=points[0].y,
-            styles=styles,
-            classes=classes,
-        )
+        """
+        :param points: positions of the bars, or a function making them on first access
+        :param bar_heights: heights of the bars, or a function making them on first access
+        """
+        super().__init__(x_position=0, y_position=0, styles=styles, classes=classes)
         self.points = points
+        self.position = self.first_position
         self.x_values = x_values
         self.y_values = y_values
         self.bar_width = bar_width
         self.bar_heights = bar_heights
+        self.single_path = False
 
     @property
     def pv_generator(self):
         return zip(self.points, self.x_values, self.y_values)
 
+    def get_bar_boxes(self):
+        """
+        (x, y, width, height) of each bar
+        """
+        return (
+            (x - self.bar_width / 2, y, self.bar_width, h)  # type: ignore[operator]
+            for (x, y), h in zip(self.points.positions(), self.bar_heights)
+        )
+
+    def get_bars_path(self) -> str:
+        """
+        all bars as one path of closed rectangles, skipping bars outside the visible range
+        """
+        fmt = get_coordinate_formatter()
+        path = "".join(
+            f"M{fmt(x)} {fmt(y)}h{fmt(w)}v{fmt(h)}h{fmt(-w)}Z"
+            for x, y, w, h in self.get_bar_boxes()
+            if y is not None and x is not None
+        )
+        return self.path_template.format(path=path, attributes=self.attributes)
+
     def get_element_list(self) -> list:
+        if self.single_path:
+            return [self.get_bars_path()] + collapse_element_list(self.custom_elements)
+        attributes = self.attributes
+        fmt = get_coordinate_formatter()
         bars = [
-            self.bar_template.format(
-                x=p.x - self.bar_width / 2,
-                y=p.y,
-                w=self.bar_width,
-                h=h,
-                attributes=self.attributes,
-            )
-            for p, h in zip(self.points, self.bar_heights)
+            self.bar_template.format(x=fmt(x), y=fmt(y), w=fmt(w), h=fmt(h), attributes=attributes)
+            for x, y, w, h in self.get_bar_boxes()
         ]
         return bars + collapse_element_list(self.custom_elements)
 
@@ -255,18 +351,13 @@ class HorizontalBarSeries(BarSeries):
     Positive values extend right, negative values extend left.
     """
 
-    def get_element_list(self) -> list:
-        bars = [
-            self.bar_template.format(
-                x=p.x - max(h, 0),
-                y=p.y - self.bar_width / 2,
-                w=abs(h),
-                h=self.bar_width,
-                attributes=self.attributes,
-            )
-            for p, h in zip(self.points, self.bar_heights)
-        ]
-        return bars + collapse_element_list(self.custom_elements)
+    __slots__ = ()
+
+    def get_bar_boxes(self):
+        return (
+            (x - max(h, 0), y - self.bar_width / 2, abs(h), self.bar_width)  # type: ignore[operator]
+            for (x, y), h in zip(self.points.positions(), self.bar_heights)
+        )
 
 
 def default_scatter_shape_template(
@@ -280,38 +371,150 @@ def default_scatter_shape_template(
 class ScatterSeries(Series):
     """
     scatter series given as a number of (x, y)-points
+    with single_path set, the markers are rendered as round dots of one path instead of a shape per point
     """
 
     __default_styles__: style_def = {}
     __default_shape_template__ = staticmethod(default_scatter_shape_template)
+    path_template = '<path d="{path}" {attributes}/>'
+    marker_radius = 3
+    __slots__ = ("_points", "x_values", "y_values", "shape_template", "single_path")
+    points = LazyAttribute(convert=PointColumns.from_points)
 
     def __init__(
             self,
-            points: list[Point],
+            points: list[Point] | Callable[[], list[Point]],
             x_values: numbers_sequence,
             y_values: numbers_sequence,
             shape_template: Callable[[number, number, style_def], Shape] | None = None,
             styles: style_def | None = None,
             classes: list[str] | None = None,
     ):
-        super().__init__(
-            x_position=points[0].x,
-            y_position=points[0].y,
-            styles=styles,
-            classes=classes,
-        )
+        """
+        :param points: positions of the points, or a function making them on first access
+        """
+        super().__init__(x_position=0, y_position=0, styles=styles, classes=classes)
         self.points = points
+        self.position = self.first_position
         self.x_values = x_values
         self.y_values = y_values
         self.shape_template = (
             self.__default_shape_template__ if shape_template is None else shape_template
         )
+        self.single_path = False
 
     @property
     def pv_generator(self):
         return zip(self.points, self.x_values, self.y_values)
 
+    def get_marker_path(self) -> str:
+        """
+        all markers as one path of zero-length segments, drawn as dots by round line caps
+        """
+        styles = {k: v for k, v in self.styles.items() if k not in ("fill", "stroke", "stroke-width")}
+        marker_styles = {
+            "stroke": self.styles.get("fill", "black"),
+            "stroke-width": str(2 * self.marker_radius),
+            "stroke-linecap": "round",
+            "fill": "none",
+            **styles,
+        }
+        fmt = get_coordinate_formatter()
+        path = "".join(
+            f"M{fmt(x)} {fmt(y)}h0" for x, y in self.points.positions() if x is not None and y is not None
+        )
+        return self.path_template.format(path=path, attributes=format_attributes(marker_styles, self.classes))
+
     def get_element_list(self) -> list:
+        if self.single_path:
+            return [self.get_marker_path()] + collapse_element_list(self.custom_elements)
         return collapse_element_list(
-            [self.shape_template(p.x, p.y, self.styles) for p in self.points]
+            [self.shape_template(x, y, self.styles) for x, y in self.points.positions()]
         ) + collapse_element_list(self.custom_elements)
+
+
+def default_density_shape_template(
+        x: number,
+        y: number,
+        styles: style_def,
+) -> Shape:
+    return Rect(x - 3, y - 3, width=6, height=6, styles=styles)
+
+
+class DensitySeries(Series):
+    """
+    scatter series aggregated into rectangular or hexagonal bins, shaded by point count
+    """
+
+    rect_template = '<rect x="{x}" y="{y}" width="{w}" height="{h}" fill-opacity="{opacity}" {attributes}/>'
+    hex_template = '<path d="{path}" fill-opacity="{opacity}" {attributes}/>'
+    __default_styles__: style_def = {"stroke": "none"}
+    __default_shape_template__ = staticmethod(default_density_shape_template)
+    __slots__ = ("cells", "cell_size", "bin_shape", "shape_template")
+    min_opacity = 0.1
+
+    def __init__(
+            self,
+            cells: list[tuple[Point, int]],
+            cell_size: number,
+            bin_shape: str = "rect",
+            styles: style_def | None = None,
+            classes: list[str] | None = None,
+    ):
+        """
+        :param cells: centre and number of points of each non-empty bin
+        :param cell_size: width of the bins
+        :param bin_shape: "rect" or "hex"
+        """
+        super().__init__(
+            x_position=cells[0][0].x if cells else 0,
+            y_position=cells[0][0].y if cells else 0,
+            styles=styles,
+            classes=classes,
+        )
+        self.cells = cells
+        self.cell_size = cell_size
+        self.bin_shape = bin_shape
+        self.shape_template = self.__default_shape_template__
+
+    def opacity(self, count: int, max_count: int) -> number:
+        return round(self.min_opacity + (1 - self.min_opacity) * count / max_count, 3)
+
+    def hex_path(self, centre: Point) -> str:
+        fmt = get_coordinate_formatter()
+        radius = self.cell_size / math.sqrt(3)
+        corners = [
+            (centre.x + radius * math.sin(k * math.pi / 3), centre.y - radius * math.cos(k * math.pi / 3))
+            for k in range(6)
+        ]
+        return "M " + " L ".join(f"{fmt(x)} {fmt(y)}" for x, y in corners) + " Z"
+
+    def get_element_list(self) -> list:
+        if not self.cells:
+            return collapse_element_list(self.custom_elements)
+        max_count = max(count for _, count in self.cells)
+        attributes = self.attributes
+        fmt = get_coordinate_formatter()
+        half = self.cell_size / 2
+        if self.bin_shape == "hex":
+            cells = [
+                self.hex_template.format(
+                    path=self.hex_path(p),
+                    opacity=self.opacity(count, max_count),
+                    attributes=attributes,
+                )
+                for p, count in self.cells
+            ]
+        else:
+            cells = [
+                self.rect_template.format(
+                    x=fmt(p.x - half),
+                    y=fmt(p.y - half),
+                    w=fmt(self.cell_size),
+                    h=fmt(self.cell_size),
+                    opacity=self.opacity(count, max_count),
+                    attributes=attributes,
+                )
+                for p, count in self.cells
+            ]
+        return cells + collapse_element_list(self.custom_elements)
@@ -6,6 +6,7 @@ render itself as SVG markup via get_element_list().
 
 Classes:
     Point: 2D coordinate dataclass (x, y)
+    PointColumns: Points stored as two array('d') columns, read as Points on the fly
     Element: Abstract base class with styles and CSS classes
     Shape: Abstract positioned element (has position: Point)
     Line: SVG <line> element
@@ -16,7 +17,11 @@ Classes:
 
 Common patterns:
     - All shapes have styles (dict of SVG attributes) and classes (CSS class names)
-    - attributes property formats styles/classes for SVG attribute string
+    - Points and shapes use __slots__, so the many of them in a chart stay small
+    - attributes property formats styles/classes for SVG attribute string, memoized
+      on their content so identical styles are serialized once
+    - Coordinates are written with the formatter of the render in progress, rounded to
+      the chart's coordinate_precision when one is set
     - Shapes can be added to charts via chart.add_custom_element(shape)
 
 Example:
@@ -24,14 +29,18 @@ Example:
     circle = Circle(x=200, y=100, radius=5, classes=['highlight'])
 """
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from html import escape as html_escape
 
-from .helpers import collapse_element_list
+from .helpers import collapse_element_list, get_coordinate_formatter
 from .shared import number, style_def
+from .styles import active_style_interner
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """
     point in 2D space
@@ -41,11 +50,98 @@ class Point:
     y: number
 
 
+def nan_to_none(value: float) -> float | None:
+    return None if value != value else value
+
+
+def position_column(positions: Iterable[number | None]) -> array:
+    """
+    positions as an array('d') column, None (outside the visible range) stored as nan
+    """
+    nan = float("nan")
+    return array("d", [nan if position is None else position for position in positions])
+
+
+class PointColumns(Sequence):
+    """
+    points stored as two array('d') columns of positions, None (outside the visible range) stored as nan
+    indexing and iterating make Point objects on the fly, positions() yields plain (x, y) tuples
+    """
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs: array, ys: array) -> None:
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def from_positions(cls, x_positions: Iterable, y_positions: Iterable) -> "PointColumns":
+        return cls(position_column(x_positions), position_column(y_positions))
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointColumns":
+        if isinstance(points, PointColumns):
+            return points
+        points = list(points)
+        return cls.from_positions([p.x for p in points], [p.y for p in points])
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointColumns(self.xs[index], self.ys[index])
+        return Point(x=nan_to_none(self.xs[index]), y=nan_to_none(self.ys[index]))  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[Point]:
+        for x, y in zip(self.xs, self.ys):
+            yield Point(x=nan_to_none(x), y=nan_to_none(y))  # type: ignore[arg-type]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} n={len(self)}>"
+
+    def positions(self) -> Iterator[tuple[number | None, number | None]]:
+        """
+        (x, y) of each point without making Point objects
+        """
+        return zip(map(nan_to_none, self.xs), map(nan_to_none, self.ys))
+
+
+@lru_cache(maxsize=4096)
+def format_attribute_items(
+    style_items: tuple[tuple[str, str], ...],
+    classes: tuple[str, ...],
+) -> str:
+    """
+    format style items and classes as an svg attribute string, memoized on their content
+    """
+    attributes = dict(style_items)
+    if len(classes) > 0:
+        attributes["class"] = " ".join(classes)
+    return " ".join([a + '="' + attributes[a] + '"' for a in attributes])
+
+
+def format_attributes(styles: style_def, classes: list[str]) -> str:
+    """
+    format styles and classes as an svg attribute string
+    NOTE keyed on content rather than identity, so shapes with equal styles share one
+    serialization and in-place changes to a styles dict are always picked up.
+    """
+    interner = active_style_interner.get()
+    if interner is not None:
+        styles, classes = interner.intern(styles, classes)
+    return format_attribute_items(tuple(styles.items()), tuple(classes))
+
+
 class Element(ABC):
     """
     abstract base class for all visual elements
     """
 
+    __slots__ = ("styles", "classes")
     __default_classes__: list[str] = []
     __default_styles__: style_def = {}
 
@@ -59,15 +155,7 @@ class Element(ABC):
 
     @property
     def attributes(self) -> str:
-        attributes = (
-            {
-                **self.styles,
-                "class": " ".join(self.classes),
-            }
-            if len(self.classes) > 0
-            else self.styles
-        )
-        return " ".join([a + '="' + attributes[a] + '"' for a in attributes])
+        return format_attributes(self.styles, self.classes)
 
     def add_classes(self, classes: list[str]) -> None:
         self.classes.extend(classes)
@@ -81,6 +169,8 @@ class Shape(Element):
     abstract base class for all shapes
     """
 
+    __slots__ = ("position",)
+
     def __init__(
         self,
         x: number,
@@ -100,6 +190,7 @@ class Line(Shape):
     straight line between two points
     """
 
+    __slots__ = ("end",)
     line_template = '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" {attributes}/>'
 
     def __init__(
@@ -133,12 +224,13 @@ class Line(Shape):
         return self.position
 
     def get_element_list(self) -> list:
+        fmt = get_coordinate_formatter()
         return [
             self.line_template.format(
-                x1=self.start.x,
-                y1=self.start.y,
-                x2=self.end.x,
-                y2=self.end.y,
+                x1=fmt(self.start.x),
+                y1=fmt(self.start.y),
+                x2=fmt(self.end.x),
+                y2=fmt(self.end.y),
                 attributes=self.attributes,
             ),
         ]
@@ -149,6 +241,7 @@ class Circle(Shape):
     circle around a center point
     """
 
+    __slots__ = ("radius",)
     circle_template = '<circle cx="{x}" cy="{y}" r="{r}" {attributes}/>'
 
     def __init__(
@@ -167,11 +260,12 @@ class Circle(Shape):
         return f"<{self.__class__.__name__} c={self.position} r={self.radius}>"
 
     def get_element_list(self) -> list[str]:
+        fmt = get_coordinate_formatter()
         return [
             self.circle_template.format(
-                x=self.position.x,
-                y=self.position.y,
-                r=self.radius,
+                x=fmt(self.position.x),
+                y=fmt(self.position.y),
+                r=fmt(self.radius),
                 attributes=self.attributes,
             ),
         ]
@@ -182,6 +276,7 @@ class Rect(Shape):
     rectangle at a position with dimensions
     """
 
+    __slots__ = ("width", "height")
     rect_template = '<rect x="{x}" y="{y}" width="{width}" height="{height}" {attributes}/>'
 
     def __init__(
@@ -211,12 +306,13 @@ class Rect(Shape):
         return f"<{self.__class__.__name__} pos={self.position} w={self.width} h={self.height}>"
 
     def get_element_list(self) -> list[str]:
+        fmt = get_coordinate_formatter()
         return [
             self.rect_template.format(
-                x=self.position.x,
-                y=self.position.y,
-                width=self.width,
-                height=self.height,
+                x=fmt(self.position.x),
+                y=fmt(self.position.y),
+                width=fmt(self.width),
+                height=fmt(self.height),
                 attributes=self.attributes,
             ),
         ]
@@ -227,6 +323,7 @@ class Text(Shape):
     text at a position
     """
 
+    __slots__ = ("content",)
     text_template = '<text x="{x}" y="{y}" {attributes}>{content}</text>'
 
     def __init__(self, x, y, content, styles=None, classes=None):
@@ -237,10 +334,11 @@ class Text(Shape):
         return f"<{self.__class__.__name__} pos={self.position} content={self.content} styles={self.styles}>"
 
     def get_element_list(self) -> list:
+        fmt = get_coordinate_formatter()
         return [
             self.text_template.format(
-                x=self.position.x,
-                y=self.position.y,
+                x=fmt(self.position.x),
+                y=fmt(self.position.y),
                 content=html_escape(str(self.content), quote=False),
                 attributes=self.attributes,
             ),
@@ -252,6 +350,7 @@ class Group(Element):
     a group of visual elements
     """
 
+    __slots__ = ("children",)
     group_template = "<g {attributes}>"
 
     def __init__(
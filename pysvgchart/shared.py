@@ -4,6 +4,10 @@ shared - definitions shared throughout the code
 
 from datetime import date, datetime
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional extra, pure python is used without it
+    np = None  # type: ignore[assignment]
 
 dates_sequence = list[date] | tuple[date, ...]
 datetimes_sequence = list[datetime] | tuple[datetime, ...]
@@ -13,3 +17,17 @@ numbers_sequence = list[number] | tuple[number, ...]
 
 style_def = dict[str, str]
 named_styles = dict[str, style_def]
+
+
+def is_array(values) -> bool:
+    """
+    whether values are a numpy array (always False without numpy)
+    """
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def is_numeric_array(values) -> bool:
+    """
+    whether values are a numpy array of (non-complex) numbers
+    """
+    return is_array(values) and values.dtype.kind in "biuf"
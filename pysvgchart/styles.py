@@ -1,6 +1,7 @@
 """
 styles - constants and functions for CSS styles
 """
+from contextvars import ContextVar
 
 from .shared import named_styles, style_def
 
@@ -47,3 +48,103 @@ def render_all_styles(
     return "\n".join(
         [f"{name} {render_style_dict(rendered_styles[name])}\n" for name in rendered_styles]  # type: ignore[operator]
     )[:-1]
+
+
+# svg presentation attributes that can be moved to a css rule unchanged
+css_style_properties = frozenset(
+    [
+        "alignment-baseline",
+        "color",
+        "display",
+        "dominant-baseline",
+        "fill",
+        "fill-opacity",
+        "fill-rule",
+        "font-family",
+        "font-size",
+        "font-style",
+        "font-weight",
+        "letter-spacing",
+        "opacity",
+        "paint-order",
+        "shape-rendering",
+        "stroke",
+        "stroke-dasharray",
+        "stroke-dashoffset",
+        "stroke-linecap",
+        "stroke-linejoin",
+        "stroke-miterlimit",
+        "stroke-opacity",
+        "stroke-width",
+        "text-anchor",
+        "text-decoration",
+        "text-rendering",
+        "visibility",
+        "word-spacing",
+    ]
+)
+# properties that need a unit in css where a bare number is fine as an attribute
+css_length_properties = frozenset(["font-size", "letter-spacing", "stroke-dashoffset", "stroke-width", "word-spacing"])
+
+
+def css_value(name: str, value: str) -> str:
+    """
+    attribute value as a css value, adding px to bare numbers for lengths
+    """
+    if name in css_length_properties:
+        try:
+            float(value)
+        except ValueError:
+            return value
+        return f"{value}px"
+    return value
+
+
+class StyleInterner:
+    """
+    collects the distinct styles of the elements being rendered, giving each a short class name
+    NOTE the rules are wrapped in :where() for zero specificity, so that custom styles still win
+    like they did over presentation attributes; only custom rules of zero specificity (e.g. *)
+    lose to them, being placed before them.
+    """
+
+    class_prefix = "psc-s"
+
+    def __init__(self) -> None:
+        self.styles: named_styles = {}
+        self.class_names: dict[tuple[tuple[str, str], ...], str] = {}
+        self.interned: dict[tuple[tuple[str, str], ...], tuple[style_def, str | None]] = {}
+
+    def intern(self, styles: style_def, classes: list[str]) -> tuple[style_def, list[str]]:
+        """
+        split styles into remaining inline attributes and classes including the interned style class
+        """
+        key = tuple(styles.items())
+        if key not in self.interned:
+            css = {name: css_value(name, value) for name, value in key if name in css_style_properties}
+            remaining = {name: value for name, value in key if name not in css_style_properties}
+            self.interned[key] = (remaining, self.get_class_name(css) if css else None)
+        remaining, class_name = self.interned[key]
+        return remaining, classes if class_name is None else [class_name, *classes]
+
+    def copy(self) -> "StyleInterner":
+        """
+        interner continuing from the styles interned so far, without adding to them
+        """
+        interner = self.__class__()
+        interner.styles = self.styles.copy()
+        interner.class_names = self.class_names.copy()
+        interner.interned = self.interned.copy()
+        return interner
+
+    def get_class_name(self, css: style_def) -> str:
+        css_key = tuple(css.items())
+        if css_key not in self.class_names:
+            class_name = f"{self.class_prefix}{len(self.class_names)}"
+            self.class_names[css_key] = class_name
+            self.styles[f":where(.{class_name})"] = css
+        return self.class_names[css_key]
+
+
+# the interner of the render in progress, if it interns styles
+active_style_interner: ContextVar[StyleInterner | None] = ContextVar("active_style_interner", default=None)
@@ -0,0 +1,167 @@
+"""
+Summary of the values on an axis.
+
+Building a scale needs to know the kind of the values (numbers, dates or anything
+else), their range, whether they are all integers and whether there are enough
+distinct values. DataSummary collects all of that up front so that scale and tick
+construction never scan the values again.
+
+Classes:
+    DataSummary: kind, count, range, integer-ness and distinct count of values
+    SeriesColumns: values of several series, summarized per series without concatenating them
+
+Functions:
+    summarize(values, unique_limit): Summarize a list, tuple, numpy array or SeriesColumns
+    summarize_columns(columns, unique_limit): Summarize several columns of values as one
+"""
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date
+from numbers import Real
+from typing import Any
+
+from .shared import is_array, is_numeric_array
+
+# kinds of values with a ticks creator; anything else is mapped as categories
+NUMBER = "number"
+DATE = "date"
+OTHER = "other"
+
+
+@dataclass(frozen=True)
+class DataSummary:
+    """
+    summary of a sequence of values
+    NOTE unique_count is only counted up to the unique_limit it was summarized with.
+    """
+
+    kind: str
+    count: int
+    minimum: Any = None
+    maximum: Any = None
+    all_int: bool = False
+    unique_count: int = 0
+
+    @property
+    def non_negative(self) -> bool:
+        return self.kind == NUMBER and self.count > 0 and self.minimum >= 0
+
+    @property
+    def non_positive(self) -> bool:
+        return self.kind == NUMBER and self.count > 0 and self.maximum <= 0
+
+
+class SeriesColumns:
+    """
+    the values of several series as one sequence, without copying them into one list
+    iterating yields the values of each series in turn, as native python values
+    """
+
+    def __init__(self, columns) -> None:
+        self.columns = list(columns)
+
+    def __len__(self) -> int:
+        return sum(len(column) for column in self.columns)
+
+    def __iter__(self) -> Iterator:
+        for column in self.columns:
+            yield from column.tolist() if is_array(column) else column
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} columns={len(self.columns)} values={len(self)}>"
+
+
+def value_kind(value_types: set[type]) -> str:
+    """
+    kind shared by all value types, dates including datetimes
+    """
+    if all(issubclass(value_type, date) for value_type in value_types):
+        return DATE
+    if all(issubclass(value_type, Real) for value_type in value_types):
+        return NUMBER
+    return OTHER
+
+
+def count_unique(values, unique_limit: int) -> int:
+    """
+    number of distinct values, stopping as soon as unique_limit is reached
+    """
+    seen: set = set()
+    for value in values:
+        seen.add(value)
+        if len(seen) >= unique_limit:
+            break
+    return len(seen)
+
+
+def ordered_unique_count(values, minimum: Any, maximum: Any, unique_limit: int) -> int:
+    """
+    number of distinct ordered values up to unique_limit, which the range answers for up to two
+    """
+    if minimum == maximum:
+        return min(1, unique_limit)
+    if unique_limit <= 2:
+        return unique_limit
+    return count_unique(values, unique_limit)
+
+
+def summarize(values, unique_limit: int = 2) -> DataSummary:
+    """
+    summarize values in a few C-level passes (value types, min, max) instead of a python loop per question
+    :param values: list, tuple or numpy array of values
+    :param unique_limit: number of distinct values after which counting stops
+    """
+    if isinstance(values, SeriesColumns):
+        return summarize_columns(values.columns, unique_limit)
+    count = len(values)
+    if count == 0:
+        return DataSummary(kind=OTHER, count=0)
+    if is_numeric_array(values):
+        minimum, maximum = values.min().item(), values.max().item()
+        return DataSummary(
+            kind=NUMBER,
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            all_int=values.dtype.kind in "biu",
+            unique_count=ordered_unique_count(values, minimum, maximum, unique_limit),
+        )
+    value_types = set(map(type, values))
+    kind = value_kind(value_types)
+    if kind == OTHER:
+        return DataSummary(kind=kind, count=count, unique_count=count_unique(values, unique_limit))
+    minimum, maximum = min(values), max(values)
+    return DataSummary(
+        kind=kind,
+        count=count,
+        minimum=minimum,
+        maximum=maximum,
+        all_int=all(issubclass(value_type, int) for value_type in value_types),
+        unique_count=ordered_unique_count(values, minimum, maximum, unique_limit),
+    )
+
+
+def summarize_columns(columns, unique_limit: int = 2) -> DataSummary:
+    """
+    summarize several columns of values as if they were one, combining the summaries of the columns
+    :param columns: lists, tuples or numpy arrays of values
+    :param unique_limit: number of distinct values after which counting stops
+    """
+    columns = [column for column in columns if len(column) > 0]
+    summaries = [summarize(column, unique_limit) for column in columns]
+    if not summaries:
+        return DataSummary(kind=OTHER, count=0)
+    count = sum(summary.count for summary in summaries)
+    kinds = {summary.kind for summary in summaries}
+    if len(kinds) > 1 or OTHER in kinds:
+        return DataSummary(kind=OTHER, count=count, unique_count=count_unique(SeriesColumns(columns), unique_limit))
+    minimum = min(summary.minimum for summary in summaries)
+    maximum = max(summary.maximum for summary in summaries)
+    return DataSummary(
+        kind=kinds.pop(),
+        count=count,
+        minimum=minimum,
+        maximum=maximum,
+        all_int=all(summary.all_int for summary in summaries),
+        unique_count=ordered_unique_count(SeriesColumns(columns), minimum, maximum, unique_limit),
+    )
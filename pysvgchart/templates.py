@@ -0,0 +1,165 @@
+"""
+Chart templates: one layout rendered for many datasets.
+
+Dashboards often render the same chart (same x values, y bounds, styles, legend and
+grids) for many entities. A template builds the axes, grids, legend and custom elements
+once, renders them to svg fragments, and then only builds and renders the series of
+each dataset, so rendering a dataset costs in proportion to the size of its series.
+
+Classes:
+    ChartTemplate: pre-rendered layout of a vertical chart, stamped with the series of each dataset
+
+Example:
+    template = psc.ChartTemplate(
+        psc.LineChart,
+        x_values=dates,
+        y_names=["Sales", "Costs"],
+        y_min=0,
+        y_max=1000,
+        calls=["add_legend", ("add_grids", {"minor_y_ticks": 4})],
+    )
+    for entity in entities:
+        svg = template.render([entity.sales, entity.costs])
+"""
+import copy
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .batch import get_chart_type, normalise_call
+from .charts import VerticalChart, as_series_list
+from .helpers import iter_element_list, iter_in_context
+from .shared import is_array, named_styles
+from .styles import StyleInterner
+from .summary import OTHER, summarize
+
+# calls that change the series, made again on the series of every dataset;
+# any other call is made once, on the template
+series_calls = frozenset({"set_palette", "set_single_path", "modify_series", "add_hover_modifier"})
+
+
+class ChartTemplate:
+    """
+    layout of a vertical chart (line, bar, scatter) rendered once, with the series of each dataset rendered into it
+    NOTE the y-axis is scaled to y_min and y_max, not to the values of a dataset, so values outside them
+    raise a ValueError unless the template clips them.
+    """
+
+    def __init__(
+            self,
+            chart_type: type[VerticalChart] | str,
+            x_values: list | tuple,
+            y_names: list[str] | tuple[str, ...],
+            y_min: Any,
+            y_max: Any,
+            calls: Iterable[str | tuple | list] = (),
+            styles: named_styles | None = None,
+            include_default: bool = True,
+            intern_styles: bool = False,
+            clip: bool = False,
+            **kwargs,
+    ) -> None:
+        """
+        :param chart_type: vertical chart class or its name, e.g. "LineChart"
+        :param x_values: the x values shared by every dataset
+        :param y_names: names of the series of every dataset
+        :param y_min: minimum value of the y-axis
+        :param y_max: maximum value of the y-axis
+        :param calls: calls to make on the chart, given as a name, (name, kwargs) or (name, args, kwargs)
+        :param styles: optional named styles to include in the style block
+        :param include_default: whether to include the default styles
+        :param intern_styles: whether to replace repeated inline styles with generated css classes
+        :param clip: whether to clip values outside y_min and y_max to them, instead of raising a ValueError
+        :param kwargs: any other arguments of the chart, except secondary y-axis ones
+        """
+        chart_type = get_chart_type(chart_type)
+        if not issubclass(chart_type, VerticalChart):
+            raise ValueError("chart templates support vertical charts only")
+        if y_min is None or y_max is None:
+            raise ValueError("chart templates need y_min and y_max to scale the y-axis")
+        if kwargs.get("sec_y_values") is not None:
+            raise ValueError("chart templates do not support a secondary y-axis")
+        self.x_values = x_values
+        self.y_names = list(y_names)
+        self.y_min = y_min
+        self.y_max = y_max
+        self.clip = clip
+        self.calls = [normalise_call(call) for call in calls]
+        # placeholder series spanning no more than the bounds, so the y-axis is scaled to them
+        self.chart = chart_type(
+            x_values=x_values,
+            y_values=[[y_min] * len(x_values) for _ in self.y_names],
+            y_names=self.y_names,
+            y_min=y_min,
+            y_max=y_max,
+            **kwargs,
+        )
+        for name, args, call_kwargs in self.calls:
+            getattr(self.chart, name)(*args, **call_kwargs)
+
+        self.interner = StyleInterner() if intern_styles else None
+        context = self.chart.get_render_context(self.interner)
+        self.begin = list(self.chart.iter_render_begin(styles, include_default))
+        self.begin.extend(iter_in_context(context, iter_element_list(
+            [self.chart.x_axis],
+            [self.chart.y_axis],
+            [self.chart.legend],
+        )))
+        self.end = list(iter_in_context(context, iter_element_list(self.chart.custom_elements)))
+
+    def stamp(self, y_values: list | tuple) -> VerticalChart:
+        """
+        the template's chart with the series of a dataset, sharing its axes, legend and custom elements
+        :param y_values: a list of values for each series of the template, each a list (or numpy array) itself
+        """
+        y_values = as_series_list(y_values)
+        if len(y_values) != len(self.y_names):
+            raise ValueError(f"expected values for {len(self.y_names)} series, got {len(y_values)}")
+        y_values = [self.within_bounds(name, values) for name, values in zip(self.y_names, y_values)]
+        chart = copy.copy(self.chart)
+        chart.series = chart.series_constructor(
+            self.x_values,
+            y_values,
+            chart.x_axis,
+            chart.y_axis,
+            self.y_names,
+            chart.bar_width,
+            chart.bar_gap,
+        )
+        for name, series in chart.series.items():
+            series.styles = self.chart.series[name].styles.copy()
+        for name, args, call_kwargs in self.calls:
+            if name in series_calls:
+                getattr(chart, name)(*args, **call_kwargs)
+        return chart
+
+    def within_bounds(self, name: str, values):
+        """
+        values of a series within y_min and y_max, which the y-axis is scaled to, clipped to them or rejected
+        """
+        summary = summarize(values)
+        if summary.kind == OTHER or (self.y_min <= summary.minimum and summary.maximum <= self.y_max):
+            return values
+        if not self.clip:
+            raise ValueError(
+                f"values of series {name!r} are outside the y bounds {self.y_min} to {self.y_max} of the template, "
+                f"pass clip=True to clip them"
+            )
+        if is_array(values):
+            return values.clip(self.y_min, self.y_max)
+        return [min(max(value, self.y_min), self.y_max) for value in values]
+
+    def iter_render(self, y_values: list | tuple) -> Iterator[str]:
+        """
+        render a dataset as a sequence of svg fragments, one element at a time
+        :param y_values: a list of values for each series of the template, each a list (or numpy array) itself
+        """
+        chart = self.stamp(y_values)
+        interner = None if self.interner is None else self.interner.copy()
+        context = chart.get_render_context(interner)
+        yield from self.begin
+        yield from iter_in_context(context, iter_element_list([chart.series[s] for s in chart.series]))
+        yield from self.end
+        yield from chart.iter_render_end(interner)
+
+    def render(self, y_values: list | tuple) -> str:
+        return "\n".join(self.iter_render(y_values))
@@ -14,6 +14,10 @@ requirements = [ ]
 
 test_requirements = ['pytest>=3', ]
 
+extras_requirements = {
+    'numpy': ['numpy'],
+}
+
 setup(
     author="Alex Rowley",
     author_email='',
@@ -31,7 +35,13 @@ setup(
         'Programming Language :: Python :: 3.13',
     ],
     description="Creates svg based charts in python",
+    entry_points={
+        'console_scripts': [
+            'pysvgchart=pysvgchart.cli:main',
+        ],
+    },
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     long_description=readme,
     include_package_data=True,
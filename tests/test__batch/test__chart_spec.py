@@ -0,0 +1,83 @@
+import pickle
+import unittest
+
+
+from pysvgchart.batch import ChartSpec
+from pysvgchart.charts import SimpleLineChart
+
+
+class TestChartSpec(unittest.TestCase):
+
+    def test_build_by_name(self):
+        # given
+        spec = ChartSpec("SimpleLineChart", {"x_values": [1, 2, 3], "y_values": [[10, 20, 15]]})
+        # when
+        actual = spec.build()
+        # then
+        self.assertIsInstance(actual, SimpleLineChart)
+
+    def test_calls(self):
+        # given
+        spec = ChartSpec(
+            SimpleLineChart,
+            {"x_values": [1, 2, 3], "y_values": [[10, 20, 15]], "y_names": ["Sales"]},
+            calls=["add_legend", ("add_x_grid", {"minor_ticks": 4}), ("add_y_grid", [2], {})],
+        )
+        expected = SimpleLineChart(x_values=[1, 2, 3], y_values=[[10, 20, 15]], y_names=["Sales"])
+        expected.add_x_grid(minor_ticks=4)
+        expected.add_y_grid(2)
+        # when
+        actual = spec.build()
+        # then
+        self.assertIsNotNone(actual.legend)
+        self.assertEqual(len(expected.x_axis.grid_lines), len(actual.x_axis.grid_lines))
+        self.assertEqual(len(expected.y_axis.grid_lines), len(actual.y_axis.grid_lines))
+
+    def test_render_matches_direct(self):
+        # given
+        spec = ChartSpec("SimpleLineChart", {"x_values": [1, 2, 3], "y_values": [[10, 20, 15]]}, calls=["add_legend"])
+        chart = SimpleLineChart(x_values=[1, 2, 3], y_values=[[10, 20, 15]])
+        chart.add_legend()
+        # when
+        actual = spec.render()
+        # then
+        self.assertEqual(chart.render(), actual)
+
+    def test_picklable(self):
+        # given
+        spec = ChartSpec(SimpleLineChart, {"x_values": [1, 2, 3], "y_values": [[10, 20, 15]]})
+        # when
+        actual = pickle.loads(pickle.dumps(spec))
+        # then
+        self.assertEqual(spec.render(), actual.render())
+
+    def test_from_dict(self):
+        # given
+        spec = {"chart": "SimpleLineChart", "kwargs": {"x_values": [1, 2], "y_values": [[1, 2]]}, "render": {"intern_styles": True}}
+        # when
+        actual = ChartSpec.from_dict(spec)
+        # then
+        self.assertEqual({"intern_styles": True}, actual.render_kwargs)
+
+    def test_unknown_chart(self):
+        # given
+        spec = ChartSpec("Chart", {})
+        # then
+        with self.assertRaises(ValueError):
+            spec.build()
+
+    def test_only_configuration_calls(self):
+        # given
+        specs = [
+            ChartSpec("SimpleLineChart", {"x_values": [1, 2], "y_values": [[1, 2]]}, calls=[call])
+            for call in ["save", ("write_to", ["out.svg"], {}), "__init__", ("render", {}), [["add_legend"], {}]]
+        ]
+        for spec in specs:
+            # then
+            with self.assertRaises(ValueError):
+                spec.build()
+
+    def test_unknown_keys(self):
+        # then
+        with self.assertRaises(ValueError):
+            ChartSpec.from_dict({"chart": "LineChart", "kwarg": {}})
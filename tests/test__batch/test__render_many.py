@@ -0,0 +1,72 @@
+import unittest
+
+
+from pysvgchart.batch import ChartSpec, parallel_map, render_many
+
+
+def make_specs(count):
+    return [
+        ChartSpec("SimpleLineChart", {"x_values": [1, 2, 3], "y_values": [[10, 20 + index, 15]]}, calls=["add_legend"])
+        for index in range(count)
+    ]
+
+
+class TestRenderMany(unittest.TestCase):
+
+    def test_in_process(self):
+        # given
+        specs = make_specs(3)
+        # when
+        actual = list(render_many(specs, workers=1))
+        # then
+        self.assertEqual([spec.render() for spec in specs], actual)
+
+    def test_ordered(self):
+        # given
+        specs = make_specs(7)
+        # when
+        actual = list(render_many(specs, workers=2, chunksize=2))
+        # then
+        self.assertEqual([spec.render() for spec in specs], actual)
+
+    def test_as_completed(self):
+        # given
+        specs = make_specs(7)
+        # when
+        actual = dict(render_many(specs, workers=2, chunksize=3, ordered=False))
+        # then
+        self.assertEqual({index: spec.render() for index, spec in enumerate(specs)}, actual)
+
+    def test_dict_specs(self):
+        # given
+        specs = [{"chart": "SimpleLineChart", "kwargs": {"x_values": [1, 2], "y_values": [[1, 2]]}}]
+        # when
+        actual = list(render_many(specs, workers=2))
+        # then
+        self.assertEqual([ChartSpec.from_dict(specs[0]).render()], actual)
+
+    def test_streams_items(self):
+        # given
+        pulled = []
+
+        def items():
+            for item in range(1000):
+                pulled.append(item)
+                yield -item
+
+        for ordered in (True, False):
+            pulled.clear()
+            # when
+            results = parallel_map(abs, items(), workers=2, chunksize=4, ordered=ordered)
+            first = next(results)
+            # then - the first result comes once a window of two chunks per worker (and its refill) is read
+            self.assertLessEqual(len(pulled), (2 * 2 + 1) * 4)
+            rest = [first, *results]
+            self.assertEqual(1000, len(pulled))
+            expect = list(range(1000)) if ordered else list(enumerate(range(1000)))
+            self.assertEqual(expect, rest if ordered else sorted(rest))
+
+    def test_invalid_workers(self):
+        # then
+        with self.assertRaises(ValueError):
+            render_many(make_specs(1), workers=0)
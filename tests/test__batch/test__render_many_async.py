@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+
+from pysvgchart import batch
+from pysvgchart.batch import ChartSpec, render_many_async
+
+
+def make_specs(count):
+    return [
+        ChartSpec("SimpleLineChart", {"x_values": [1, 2, 3], "y_values": [[10, 20 + index, 15]]})
+        for index in range(count)
+    ]
+
+
+class TestRenderManyAsync(unittest.TestCase):
+
+    def test_in_order(self):
+        # given
+        specs = make_specs(5)
+        # when
+        actual = asyncio.run(render_many_async(specs, concurrency=2))
+        # then
+        self.assertEqual([spec.render() for spec in specs], actual)
+
+    def test_bounded_concurrency(self):
+        # given
+        specs = make_specs(8)
+        running = []
+        peak = []
+        render_spec = batch.render_spec
+
+        def tracked(spec):
+            running.append(spec)
+            peak.append(len(running))
+            try:
+                return render_spec(spec)
+            finally:
+                running.remove(spec)
+
+        async def render():
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                return await render_many_async(specs, executor=executor, concurrency=2)
+
+        # when
+        with patch.object(batch, "render_spec", tracked):
+            asyncio.run(render())
+        # then
+        self.assertLessEqual(max(peak), 2)
+
+    def test_shared_semaphore(self):
+        # given
+        specs = make_specs(3)
+
+        async def render():
+            limit = asyncio.Semaphore(1)
+            return await asyncio.gather(render_many_async(specs, concurrency=limit), render_many_async(specs, concurrency=limit))
+
+        # when
+        first, second = asyncio.run(render())
+        # then
+        self.assertEqual(first, second)
+
+    def test_invalid_concurrency(self):
+        # then
+        with self.assertRaises(ValueError):
+            asyncio.run(render_many_async(make_specs(1), concurrency=0))
@@ -0,0 +1,45 @@
+import json
+import os
+import platform
+import unittest
+
+
+from pysvgchart.bench import MemoryResult, find_memory_regressions, make_memory_baseline, run_memory_benchmarks
+
+baseline_path = os.path.join(os.path.dirname(__file__), "memory_baselines.json")
+
+
+class TestMemoryBaselines(unittest.TestCase):
+
+    def test_find_regressions(self):
+        # given
+        baseline = make_memory_baseline([MemoryResult("LineChart", 10, "render", peak=1000, retained_blocks=5)])
+        results = [
+            MemoryResult("LineChart", 10, "render", peak=1150, retained_blocks=5),
+            MemoryResult("LineChart", 10, "hover", peak=10**9, retained_blocks=5),
+        ]
+        # when
+        actual = find_memory_regressions(results, baseline, threshold=0.1)
+        # then
+        self.assertEqual(1, len(actual))
+        self.assertTrue(actual[0].startswith("LineChart/10/render: peak 1,150 B"))
+
+    def test_within_threshold(self):
+        # given
+        baseline = make_memory_baseline([MemoryResult("LineChart", 10, "render", peak=1000, retained_blocks=5)])
+        # when
+        actual = find_memory_regressions([MemoryResult("LineChart", 10, "render", peak=1100, retained_blocks=9)], baseline, 0.1)
+        # then
+        self.assertEqual([], actual)
+
+    def test_peaks_within_baselines(self):
+        # given
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        if baseline["python"].split(".")[:2] != list(platform.python_version_tuple()[:2]):
+            self.skipTest(f"baselines were recorded with python {baseline['python']}")
+        # when
+        actual = find_memory_regressions(run_memory_benchmarks(), baseline)
+        # then
+        self.assertEqual([], actual, "peak memory regressed, or update the baselines with "
+                                     "python -m pysvgchart.bench --memory --baseline tests/test__bench/memory_baselines.json --update-baseline")
@@ -0,0 +1,35 @@
+import unittest
+
+
+from pysvgchart.bench import chart_makers, phases, run_benchmarks
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    def test_every_chart_type(self):
+        # when
+        actual = run_benchmarks(min_exponent=2, max_exponent=2)
+        # then
+        self.assertEqual(set(chart_makers), {result.chart for result in actual})
+        self.assertTrue(all(result.points == 100 for result in actual))
+        self.assertTrue(all(result.phase in phases for result in actual))
+
+    def test_render_size_recorded(self):
+        # when
+        actual = run_benchmarks(["SimpleLineChart"], min_exponent=2, max_exponent=2)
+        # then
+        sizes = {result.phase: result.bytes for result in actual}
+        self.assertEqual(list(phases), list(sizes))
+        self.assertGreater(sizes["render"], 0)
+        self.assertIsNone(sizes["construct"])
+
+    def test_unsupported_phases_skipped(self):
+        # when
+        actual = run_benchmarks(["HorizontalBarChart"], min_exponent=2, max_exponent=2)
+        # then
+        self.assertEqual(["construct", "add_legend", "render"], [result.phase for result in actual])
+
+    def test_unknown_chart(self):
+        # then
+        with self.assertRaises(ValueError):
+            run_benchmarks(["PieChart"])
@@ -15,6 +15,13 @@ def echo(*args, **kwargs):
     return None
 
 
+def with_positions(series):
+    """
+    echoed series kwargs with the point columns as a list of {"x", "y"} dicts
+    """
+    return dict(series, points=[{"x": x, "y": y} for x, y in series["points"].positions()])
+
+
 class TestBarSeriesConstructor(unittest.TestCase):
     """
     test the bar_series_constructor() function
@@ -54,9 +61,9 @@ class TestBarSeriesConstructor(unittest.TestCase):
         expect = []
         self.assertListEqual(expect, mock_point.mock_calls)
         expect = []
-        self.assertListEqual(expect, mock_bar_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_bar_series.mock_calls])
         expect = {}
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.BarSeries")
@@ -214,12 +221,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            call(x=10.0, y=10),
-            call(x=20.0, y=21),
-            call(x=30.0, y=32),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             call(
                 points=[
@@ -233,7 +235,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
                 bar_width=1,
             ),
         ]
-        self.assertListEqual(expect, mock_bar_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_bar_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -247,7 +249,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
                 bar_width=1,
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.BarSeries")
@@ -281,21 +283,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            # series "a"
-            call(x=8.0, y=10),
-            call(x=18.0, y=21),
-            call(x=28.0, y=32),
-            # series "b"
-            call(x=10.0, y=11),
-            call(x=20.0, y=22),
-            call(x=30.0, y=33),
-            # series "c"
-            call(x=12.0, y=13),
-            call(x=22.0, y=24),
-            call(x=32.0, y=35),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             # series "a"
             call(
@@ -334,7 +322,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
                 bar_width=1,
             ),
         ]
-        self.assertListEqual(expect, mock_bar_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_bar_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -370,7 +358,7 @@ class TestBarSeriesConstructor(unittest.TestCase):
                 bar_width=1,
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
 
 if __name__ == "__main__":
@@ -15,6 +15,13 @@ def echo(*args, **kwargs):
     return None
 
 
+def with_positions(series):
+    """
+    echoed series kwargs with the point columns as a list of {"x", "y"} dicts
+    """
+    return dict(series, points=[{"x": x, "y": y} for x, y in series["points"].positions()])
+
+
 class TestLineSeriesConstructor(unittest.TestCase):
     """
     test the line_series_constructor() function
@@ -52,9 +59,9 @@ class TestLineSeriesConstructor(unittest.TestCase):
         expect = []
         self.assertListEqual(expect, mock_point.mock_calls)
         expect = []
-        self.assertListEqual(expect, mock_line_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_line_series.mock_calls])
         expect = {}
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.LineSeries")
@@ -202,12 +209,7 @@ class TestLineSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            call(x=10, y=10),
-            call(x=20, y=21),
-            call(x=30, y=32),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             call(
                 points=[
@@ -219,7 +221,7 @@ class TestLineSeriesConstructor(unittest.TestCase):
                 y_values=[0, 1, 2],
             ),
         ]
-        self.assertListEqual(expect, mock_line_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_line_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -231,7 +233,7 @@ class TestLineSeriesConstructor(unittest.TestCase):
                 y_values=[0, 1, 2],
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.LineSeries")
@@ -263,21 +265,7 @@ class TestLineSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            # series "a"
-            call(x=10, y=10),
-            call(x=20, y=21),
-            call(x=30, y=32),
-            # series "b"
-            call(x=10, y=11),
-            call(x=20, y=22),
-            call(x=30, y=33),
-            # series "c"
-            call(x=10, y=13),
-            call(x=20, y=24),
-            call(x=30, y=35),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             # series "a"
             call(
@@ -310,7 +298,7 @@ class TestLineSeriesConstructor(unittest.TestCase):
                 y_values=[3, 4, 5],
             ),
         ]
-        self.assertListEqual(expect, mock_line_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_line_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -340,7 +328,67 @@ class TestLineSeriesConstructor(unittest.TestCase):
                 y_values=[3, 4, 5],
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
+
+    @patch("pysvgchart.charts.Point")
+    @patch("pysvgchart.charts.LineSeries")
+    def test_lazy(self, mock_line_series, mock_point):
+        mock_line_series.side_effect = echo
+        mock_point.side_effect = echo
+        # given
+        x_values = [1, 2, 3]
+        y_values = [[0, 1, 2]]
+        x_axis = MagicMock()
+        x_axis.get_positions.return_value = [10, 20, 30]
+        y_axis = MagicMock()
+        y_axis.get_positions.side_effect = lambda yyy: list(map(lambda v: v[0] + v[1], zip(yyy, [10, 20, 30])))
+        series_names = ["a"]
+        bar_width = 1
+        bar_gap = 1
+        # when
+        actual = line_series_constructor(
+            x_values,
+            y_values,
+            x_axis,
+            y_axis,
+            series_names,
+            bar_width,
+            bar_gap,
+            lazy=True,
+        )
+        # then
+        self.assertListEqual([], mock_point.mock_calls)
+        self.assertListEqual([], x_axis.get_positions.mock_calls)
+        self.assertListEqual([], y_axis.get_positions.mock_calls)
+        expect = [(10, 10), (20, 21), (30, 32)]
+        self.assertListEqual(expect, list(actual["a"]["points"]().positions()))
+        self.assertListEqual([], mock_point.mock_calls)
+
+    @patch("pysvgchart.charts.Point")
+    @patch("pysvgchart.charts.LineSeries")
+    def test_x_positions_shared(self, mock_line_series, mock_point):
+        mock_line_series.side_effect = echo
+        mock_point.side_effect = echo
+        # given
+        x_values = [1, 2, 3]
+        y_values = [[0, 1, 2], [1, 2, 3], [3, 4, 5]]
+        y_axis = MagicMock()
+        y_axis.get_positions.side_effect = lambda yyy: list(map(lambda v: v[0] + v[1], zip(yyy, [10, 20, 30])))
+        series_names = ["a", "b", "c"]
+        bar_width = 1
+        bar_gap = 1
+        for lazy in (False, True):
+            x_axis = MagicMock()
+            x_axis.get_positions.return_value = [10, 20, 30]
+            # when - called again for the series of another y-axis
+            actual = {
+                **line_series_constructor(x_values, y_values[:2], x_axis, y_axis, series_names[:2], bar_width, bar_gap, lazy=lazy),
+                **line_series_constructor(x_values, y_values[2:], x_axis, y_axis, series_names[2:], bar_width, bar_gap, lazy=lazy),
+            }
+            # then
+            columns = [actual[name]["points"]() if lazy else actual[name]["points"] for name in series_names]
+            self.assertTrue(all(c.xs is columns[0].xs for c in columns))
+            self.assertListEqual([call(x_values)], x_axis.get_positions.mock_calls)
 
 
 if __name__ == "__main__":
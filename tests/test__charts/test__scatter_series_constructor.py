@@ -15,6 +15,13 @@ def echo(*args, **kwargs):
     return None
 
 
+def with_positions(series):
+    """
+    echoed series kwargs with the point columns as a list of {"x", "y"} dicts
+    """
+    return dict(series, points=[{"x": x, "y": y} for x, y in series["points"].positions()])
+
+
 class TestScatterSeriesConstructor(unittest.TestCase):
     """
     test the scatter_series_constructor() function
@@ -52,9 +59,9 @@ class TestScatterSeriesConstructor(unittest.TestCase):
         expect = []
         self.assertListEqual(expect, mock_point.mock_calls)
         expect = []
-        self.assertListEqual(expect, mock_scatter_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_scatter_series.mock_calls])
         expect = {}
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.ScatterSeries")
@@ -202,12 +209,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            call(x=10, y=10),
-            call(x=20, y=21),
-            call(x=30, y=32),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             call(
                 points=[
@@ -219,7 +221,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
                 y_values=[0, 1, 2],
             ),
         ]
-        self.assertListEqual(expect, mock_scatter_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_scatter_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -231,7 +233,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
                 y_values=[0, 1, 2],
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
     @patch("pysvgchart.charts.Point")
     @patch("pysvgchart.charts.ScatterSeries")
@@ -263,21 +265,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
             bar_gap,
         )
         # then
-        expect = [
-            # series "a"
-            call(x=10, y=10),
-            call(x=20, y=21),
-            call(x=30, y=32),
-            # series "b"
-            call(x=10, y=11),
-            call(x=20, y=22),
-            call(x=30, y=33),
-            # series "c"
-            call(x=10, y=13),
-            call(x=20, y=24),
-            call(x=30, y=35),
-        ]
-        self.assertListEqual(expect, mock_point.mock_calls)
+        self.assertListEqual([], mock_point.mock_calls)
         expect = [
             # series "a"
             call(
@@ -310,7 +298,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
                 y_values=[3, 4, 5],
             ),
         ]
-        self.assertListEqual(expect, mock_scatter_series.mock_calls)
+        self.assertListEqual(expect, [call(**with_positions(c.kwargs)) for c in mock_scatter_series.mock_calls])
         expect = {
             "a": dict(
                 points=[
@@ -340,7 +328,7 @@ class TestScatterSeriesConstructor(unittest.TestCase):
                 y_values=[3, 4, 5],
             ),
         }
-        self.assertDictEqual(expect, actual)
+        self.assertDictEqual(expect, {name: with_positions(series) for name, series in actual.items()})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+
+from pysvgchart.cli import main
+
+
+def line_spec(name, length=3):
+    return {"name": name, "chart": "SimpleLineChart", "kwargs": {"x_values": [1, 2, 3], "y_values": [list(range(length))]}}
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.specs = os.path.join(self.directory.name, "specs.jsonl")
+        self.output = os.path.join(self.directory.name, "out")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, specs, *args):
+        with open(self.specs, "w") as file:
+            file.writelines(json.dumps(spec) + "\n" for spec in specs)
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            code = main([self.specs, "--output-dir", self.output, *args])
+        return code, stderr.getvalue()
+
+    def test_renders_files(self):
+        # when
+        code, report = self.run_main([line_spec("a"), line_spec("b")], "--workers", "2")
+        # then
+        self.assertEqual(0, code)
+        self.assertEqual(["a.svg", "b.svg"], sorted(os.listdir(self.output)))
+        with open(os.path.join(self.output, "a.svg")) as file:
+            self.assertTrue(file.read().startswith("<svg "))
+        self.assertIn("rendered 2 of 2 charts", report)
+        self.assertIn("per chart: mean", report)
+
+    def test_gzip(self):
+        # when
+        code, _ = self.run_main([line_spec("a")], "--workers", "1", "--gzip")
+        # then
+        self.assertEqual(0, code)
+        with gzip.open(os.path.join(self.output, "a.svg.gz"), "rt") as file:
+            self.assertTrue(file.read().endswith("</svg>"))
+
+    def test_failures_reported(self):
+        # given
+        timings = os.path.join(self.directory.name, "timings.csv")
+        # when
+        code, report = self.run_main([line_spec("a"), line_spec("bad", length=2)], "--workers", "1", "--timings", timings)
+        # then
+        self.assertEqual(1, code)
+        self.assertIn("bad: ValueError", report)
+        with open(timings, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(["a", "bad"], [row["name"] for row in rows])
+        self.assertEqual("", rows[0]["error"])
+        self.assertNotEqual("", rows[1]["error"])
+
+    def test_no_partial_files(self):
+        # given - styles that fail once the svg element has been written
+        bad = dict(line_spec("bad"), render={"styles": "not styles"})
+        # when
+        code, report = self.run_main([line_spec("a"), bad], "--workers", "1")
+        # then
+        self.assertEqual(1, code)
+        self.assertIn("bad: TypeError", report)
+        self.assertEqual(["a.svg"], os.listdir(self.output))
+
+    def test_names_stay_in_output_dir(self):
+        for name in ["../escape", os.path.join(self.directory.name, "absolute"), "sub/dir", "..", ""]:
+            # when
+            code, report = self.run_main([line_spec(name)], "--workers", "1")
+            # then
+            self.assertEqual(2, code, name)
+            self.assertIn("invalid chart name", report)
+        self.assertEqual(["specs.jsonl"], os.listdir(self.directory.name))
+
+    def test_duplicate_names(self):
+        # when
+        code, report = self.run_main([line_spec("a"), line_spec("b"), line_spec("a")], "--workers", "1")
+        # then
+        self.assertEqual(2, code)
+        self.assertIn("duplicate chart name 'a'", report)
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_spec_not_object(self):
+        # when
+        code, report = self.run_main([line_spec("a"), [1, 2]])
+        # then
+        self.assertEqual(2, code)
+        self.assertIn("cannot read specs", report)
+        self.assertIn("chart spec must be a JSON object", report)
+
+    def test_unreadable_specs(self):
+        # when
+        with redirect_stderr(StringIO()):
+            code = main([os.path.join(self.directory.name, "missing.jsonl")])
+        # then
+        self.assertEqual(2, code)
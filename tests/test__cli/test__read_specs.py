@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+
+from pysvgchart.batch import ChartSpec
+from pysvgchart.cli import read_specs
+
+
+class TestReadSpecs(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_jsonl(self):
+        # given
+        spec = {"name": "sales", "chart": "LineChart", "kwargs": {"x_values": [1, 2]}, "calls": ["add_legend"]}
+        path = self.write("specs.jsonl", json.dumps(spec) + "\n\n" + json.dumps({"chart": "DonutChart"}) + "\n")
+        # when
+        actual = list(read_specs([path]))
+        # then
+        self.assertEqual(
+            [
+                ("sales", ChartSpec("LineChart", {"x_values": [1, 2]}, ["add_legend"])),
+                (None, ChartSpec("DonutChart")),
+            ],
+            actual,
+        )
+
+    def test_csv(self):
+        # given
+        path = self.write(
+            "specs.csv",
+            'name,chart,values,labels,calls,start_angle\n'
+            'donut,DonutChart,"[1, 2]","[""a"", ""b""]",,\n'
+            '7,DonutChart,[3],,"[""add_legend""]",90\n',
+        )
+        # when
+        actual = list(read_specs([path]))
+        # then
+        self.assertEqual(
+            [
+                ("donut", ChartSpec("DonutChart", {"values": [1, 2], "labels": ["a", "b"]})),
+                ("7", ChartSpec("DonutChart", {"values": [3], "start_angle": 90}, ["add_legend"])),
+            ],
+            actual,
+        )
+
+    def test_format_override(self):
+        # given
+        path = self.write("specs.txt", "name,chart\nx,DonutChart\n")
+        # when
+        actual = list(read_specs([path], spec_format="csv"))
+        # then
+        self.assertEqual([("x", ChartSpec("DonutChart"))], actual)
+
+    def test_jsonl_spec_not_object(self):
+        # given
+        path = self.write("specs.jsonl", json.dumps({"chart": "DonutChart"}) + "\n[1, 2]\n")
+        # then
+        with self.assertRaisesRegex(ValueError, r"specs.jsonl:2: chart spec must be a JSON object, not list"):
+            list(read_specs([path]))
+
+    def test_unknown_keys_not_strings(self):
+        # then
+        with self.assertRaisesRegex(ValueError, "unknown chart spec keys 'kwarg', 1"):
+            ChartSpec.from_dict({"chart": "DonutChart", 1: None, "kwarg": {}})
@@ -0,0 +1,56 @@
+import unittest
+
+
+from pysvgchart.helpers import make_coordinate_formatter
+
+
+class TestMakeCoordinateFormatter(unittest.TestCase):
+
+    def test_full_precision(self):
+        # given
+        fmt = make_coordinate_formatter(None)
+        # when
+        actual = [fmt(v) for v in [1, 1.5, 123.45678901234567]]
+        # then
+        expect = ["1", "1.5", "123.45678901234567"]
+        self.assertListEqual(expect, actual)
+
+    def test_rounding(self):
+        # given
+        fmt = make_coordinate_formatter(2)
+        # when
+        actual = [fmt(v) for v in [123.45678901234567, 1.999, 0.1]]
+        # then
+        expect = ["123.46", "2", "0.1"]
+        self.assertListEqual(expect, actual)
+
+    def test_trailing_zeros_stripped(self):
+        # given
+        fmt = make_coordinate_formatter(1)
+        # when
+        actual = [fmt(v) for v in [100.0, 10, 0.04, -0.04, 250.25]]
+        # then
+        expect = ["100", "10", "0", "0", "250.2"]
+        self.assertListEqual(expect, actual)
+
+    def test_zero_precision(self):
+        # given
+        fmt = make_coordinate_formatter(0)
+        # when
+        actual = [fmt(v) for v in [100.0, 10.6, -0.4]]
+        # then
+        expect = ["100", "11", "0"]
+        self.assertListEqual(expect, actual)
+
+    def test_none_like_full_precision(self):
+        # given
+        fmt = make_coordinate_formatter(1)
+        # when
+        actual = fmt(None)
+        # then
+        expect = make_coordinate_formatter(None)(None)
+        self.assertEqual(expect, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+
+from pysvgchart.instrumentation import InstrumentationEvent, active_hooks, instrument, instrumented
+
+
+@instrumented("phase", count=len)
+def make_items(count):
+    return list(range(count))
+
+
+class TestInstrument(unittest.TestCase):
+
+    def test_no_hooks(self):
+        # when
+        actual = make_items(3)
+        # then
+        self.assertEqual([0, 1, 2], actual)
+        self.assertEqual((), active_hooks.get())
+
+    def test_collects_events(self):
+        # when
+        with instrument() as actual:
+            make_items(3)
+        # then
+        self.assertEqual(1, len(actual))
+        self.assertEqual(("phase", "make_items", 3), (actual[0].phase, actual[0].name, actual[0].elements))
+        self.assertGreaterEqual(actual[0].seconds, 0)
+
+    def test_hook_called(self):
+        # given
+        received = []
+        # when
+        with instrument(received.append) as events:
+            make_items(2)
+        # then
+        self.assertEqual(events, received)
+        self.assertIsInstance(received[0], InstrumentationEvent)
+
+    def test_nested(self):
+        # when
+        with instrument() as outer:
+            make_items(1)
+            with instrument() as inner:
+                make_items(2)
+        make_items(3)
+        # then
+        self.assertEqual([1, 2], [event.elements for event in outer])
+        self.assertEqual([2], [event.elements for event in inner])
+        self.assertEqual((), active_hooks.get())
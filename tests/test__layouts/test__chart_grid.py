@@ -0,0 +1,63 @@
+import unittest
+
+
+from pysvgchart.charts import SimpleLineChart
+from pysvgchart.layouts import ChartGrid
+
+
+def make_chart(y_values, **kwargs):
+    return SimpleLineChart(x_values=[1, 2, 3], y_values=[y_values], width=200, height=100, **kwargs)
+
+
+class TestChartGrid(unittest.TestCase):
+
+    def test_size(self):
+        # given
+        charts = [make_chart([1, 2, 3]) for _ in range(5)]
+        # when
+        actual = ChartGrid(charts, columns=2, gap=10)
+        # then
+        self.assertEqual((410, 320), (actual.width, actual.height))
+
+    def test_panel_positions(self):
+        # given
+        grid = ChartGrid([make_chart([1, 2, 3]) for _ in range(3)], columns=2, gap=10)
+        # when
+        actual = [grid.get_panel_position(index) for index in range(3)]
+        # then
+        self.assertEqual([(0, 0), (210, 0), (0, 110)], actual)
+
+    def test_one_style_block(self):
+        # given
+        grid = ChartGrid([make_chart([1, 2, 3]), make_chart([3, 2, 1])], columns=2)
+        # when
+        actual = grid.render()
+        # then
+        self.assertEqual(1, actual.count("<style>"))
+        self.assertEqual(1, actual.count("<svg "))
+        self.assertIn('<g transform="translate(200,0)">', actual)
+
+    def test_facet_synced(self):
+        # given
+        datasets = [[[1, 2, 3]], [[10, 20, 30]]]
+        # when
+        actual = ChartGrid.facet(SimpleLineChart, x_values=[1, 2, 3], datasets=datasets, columns=2)
+        # then
+        self.assertIs(actual.frame.y_axis, actual.charts[0].y_axis)
+        self.assertIs(actual.charts[0].y_axis, actual.charts[1].y_axis)
+        self.assertEqual(30, actual.frame.y_axis.scale.ticks[-1])
+        self.assertEqual(2, actual.render().count('<use href="#psc-frame"/>'))
+
+    def test_facet_unsynced(self):
+        # given
+        datasets = [[[1, 2, 3]], [[10, 20, 30]]]
+        # when
+        actual = ChartGrid.facet(SimpleLineChart, x_values=[1, 2, 3], datasets=datasets, columns=2, sync_y=False)
+        # then
+        self.assertIsNone(actual.frame)
+        self.assertNotEqual(actual.charts[0].y_axis.scale.ticks, actual.charts[1].y_axis.scale.ticks)
+
+    def test_no_charts(self):
+        # then
+        with self.assertRaises(ValueError):
+            ChartGrid([], columns=2)
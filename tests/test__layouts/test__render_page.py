@@ -0,0 +1,63 @@
+import unittest
+
+
+from pysvgchart.charts import DonutChart, SimpleLineChart
+from pysvgchart.layouts import ChartGrid, render_page
+
+
+def make_chart(y_values):
+    chart = SimpleLineChart(x_values=[1, 2, 3], y_values=[y_values], y_names=["a"])
+    chart.add_legend()
+    return chart
+
+
+class TestRenderPage(unittest.TestCase):
+
+    def test_html_one_stylesheet(self):
+        # given
+        charts = [make_chart([1, 2, 3]), make_chart([3, 2, 1]), DonutChart([1, 2, 3])]
+        # when
+        actual = render_page(charts, columns=2, gap=10, title="Report & more")
+        # then
+        self.assertTrue(actual.startswith("<!DOCTYPE html>"))
+        self.assertEqual(1, actual.count("<style>"))
+        self.assertEqual(1, actual.count(".psc-hover-group .psc-hover-data"))
+        self.assertEqual(3, actual.count("<svg "))
+        self.assertIn("<title>Report &amp; more</title>", actual)
+        self.assertIn("repeat(2, minmax(0, 1fr))", actual)
+
+    def test_styles_interned_across_charts(self):
+        # given
+        charts = [make_chart([1, 2, 3]), make_chart([3, 2, 1])]
+        # when
+        actual = render_page(charts)
+        # then
+        self.assertNotIn('stroke="green"', actual)
+        self.assertEqual(1, actual.count("stroke: green;"))
+
+    def test_svg(self):
+        # given
+        charts = [make_chart([1, 2, 3]), make_chart([3, 2, 1])]
+        # when
+        actual = render_page(charts, layout="svg", columns=2, gap=20)
+        # then
+        self.assertTrue(actual.startswith('<svg viewBox="0 0 1620 600"'))
+        self.assertEqual(2, actual.count("<style>"))
+        self.assertIn('<g transform="translate(820,0)">', actual)
+
+    def test_frames_deduplicated(self):
+        # given
+        grid = ChartGrid.facet(SimpleLineChart, x_values=[1, 2, 3], datasets=[[[1, 2, 3]], [[3, 2, 1]]], columns=2)
+        other = ChartGrid.facet(SimpleLineChart, x_values=[1, 2, 3], datasets=[[[1, 2, 30]]], columns=1)
+        # when
+        actual = render_page([grid, grid, other])
+        # then
+        self.assertEqual(1, actual.count('<g id="psc-frame-0">'))
+        self.assertEqual(1, actual.count('<g id="psc-frame-1">'))
+        self.assertEqual(4, actual.count('<use href="#psc-frame-0"/>'))
+        self.assertEqual(1, actual.count('<use href="#psc-frame-1"/>'))
+
+    def test_unknown_layout(self):
+        # then
+        with self.assertRaises(ValueError):
+            render_page([make_chart([1, 2, 3])], layout="pdf")
@@ -0,0 +1,101 @@
+import unittest
+
+
+import pysvgchart as psc
+from pysvgchart.paths import join_numbers, relative_donut_path, relative_line_path
+from pysvgchart.shapes import Point
+
+
+class TestJoinNumbers(unittest.TestCase):
+
+    def test_minimal_separators(self):
+        # given
+        numbers = ["10", "-5", "0.5", "0.25", "-0.5", "3"]
+        # when
+        actual = join_numbers(numbers)
+        # then
+        expect = "10-5 .5.25-.5 3"
+        self.assertEqual(expect, actual)
+
+
+class TestRelativeLinePath(unittest.TestCase):
+
+    def test_steps(self):
+        # given
+        points = [Point(100, 200), Point(110, 195), Point(120, 190), Point(130, 190), Point(130, 180), Point(130, 180)]
+        # when
+        actual = relative_line_path(points)
+        # then
+        expect = "M100 200l10-5 10-5h10v-10"
+        self.assertEqual(expect, actual)
+
+    def test_single_point(self):
+        # given
+        points = [Point(100, 200)]
+        # when
+        actual = relative_line_path(points)
+        # then
+        self.assertEqual("M100 200", actual)
+
+    def test_rounding_does_not_accumulate(self):
+        # given
+        points = [Point(x * 0.34, 0) for x in range(100)] + [Point(99 * 0.34, 1)]
+        # when
+        actual = relative_line_path(points, precision=1)
+        # then
+        steps = [float(step) for step in actual.split("h")[1].split("v")[0].replace(".", " .").split()]
+        self.assertAlmostEqual(33.7, sum(steps))
+        self.assertTrue(actual.endswith("v1"))
+
+    def test_float_noise_removed(self):
+        # given
+        points = [Point(x / 10, 0) for x in range(4)]
+        # when
+        actual = relative_line_path(points)
+        # then
+        self.assertEqual("M0 0h.1.1.1", actual)
+
+    def test_unpositioned_points_break_path(self):
+        # given
+        points = [Point(None, 200), Point(10, 200), Point(20, 190), Point(30, None), Point(40, 180), Point(50, 180)]
+        # when
+        actual = relative_line_path(points)
+        # then
+        self.assertEqual("M10 200l10-10M40 180h10", actual)
+
+    def test_shifted_chart(self):
+        # given
+        chart = psc.SimpleLineChart(
+            x_values=list(range(10)),
+            y_values=[[x * 1.5 for x in range(10)]],
+            x_shift=2,
+            path_encoding="relative",
+        )
+        # when
+        actual = chart.render()
+        # then
+        self.assertIn('<path d="M100 414.285714l66.666667-42.857143', actual)
+
+
+class TestRelativeDonutPath(unittest.TestCase):
+
+    def test_segment(self):
+        # given
+        kwargs = dict(
+            outer_begin=(200, 100),
+            outer_end=(100, 200),
+            inner_begin=(150, 200),
+            inner_end=(200, 150),
+            radius_outer=100,
+            radius_inner=50,
+            large_arc_flag=0,
+        )
+        # when
+        actual = relative_donut_path(**kwargs)
+        # then
+        expect = "M200 100a100 100 0 0 1-100 100l50 0a50 50 0 0 0 50-50Z"
+        self.assertEqual(expect, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+
+from pysvgchart.reduction import lttb, reduce_positions
+
+
+class TestLttb(unittest.TestCase):
+    """
+    test the lttb() function
+    """
+
+    def test_threshold_above_length(self):
+        # given
+        x_positions = [0, 1, 2]
+        y_positions = [5, 6, 7]
+        # when
+        actual = lttb(x_positions, y_positions, 10)
+        # then
+        expect = [0, 1, 2]
+        self.assertListEqual(expect, actual)
+
+    def test_threshold_two(self):
+        # given
+        x_positions = [0, 1, 2, 3]
+        y_positions = [5, 6, 7, 8]
+        # when
+        actual = lttb(x_positions, y_positions, 2)
+        # then
+        expect = [0, 3]
+        self.assertListEqual(expect, actual)
+
+    def test_keeps_peak(self):
+        # given
+        x_positions = list(range(9))
+        y_positions = [0, 0, 0, 0, 10, 0, 0, 0, 0]
+        # when
+        actual = lttb(x_positions, y_positions, 3)
+        # then
+        expect = [0, 4, 8]
+        self.assertListEqual(expect, actual)
+
+    def test_threshold_respected(self):
+        # given
+        x_positions = list(range(1000))
+        y_positions = [(x * 7919) % 101 for x in x_positions]
+        # when
+        actual = lttb(x_positions, y_positions, 50)
+        # then
+        self.assertEqual(50, len(actual))
+        self.assertEqual(0, actual[0])
+        self.assertEqual(999, actual[-1])
+        self.assertListEqual(sorted(set(actual)), actual)
+
+
+class TestReducePositions(unittest.TestCase):
+    """
+    test the reduce_positions() function
+    """
+
+    def test_skips_missing_positions(self):
+        # given
+        x_positions = [0, 1, None, 3, 4]
+        y_positions = [0, 1, 2, None, 4]
+        # when
+        actual = reduce_positions(lttb, x_positions, y_positions, 10)
+        # then
+        expect = [0, 1, 4]
+        self.assertListEqual(expect, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import math
+import random
+import unittest
+
+
+from pysvgchart.reduction import m4
+
+
+def rasterize(x_positions, y_positions):
+    """
+    lowest and highest y a polyline covers in each pixel column
+    """
+    covered = {}
+    for x0, y0, x1, y1 in zip(x_positions, y_positions, x_positions[1:], y_positions[1:]):
+        for pixel in range(math.floor(x0), math.floor(x1) + 1):
+            # the ends of the segment within the pixel, where it crosses the pixel edges
+            ys = [
+                y0 + (y1 - y0) * (x - x0) / (x1 - x0) if x0 < x < x1 else y
+                for x, y in ((max(pixel, x0), y0), (min(pixel + 1, x1), y1))
+            ]
+            low, high = covered.get(pixel, (math.inf, -math.inf))
+            covered[pixel] = (min(low, *ys), max(high, *ys))
+    return covered
+
+
+class TestM4(unittest.TestCase):
+    """
+    test the m4() function
+    """
+
+    def test_threshold_above_length(self):
+        # given
+        x_positions = [0, 1, 2]
+        y_positions = [5, 6, 7]
+        # when
+        actual = m4(x_positions, y_positions, 8)
+        # then
+        expect = [0, 1, 2]
+        self.assertListEqual(expect, actual)
+
+    def test_first_last_min_max_per_column(self):
+        # given - two columns of six points each
+        x_positions = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.0, 1.1, 1.2, 1.3, 1.4, 1.5]
+        y_positions = [3, 9, 1, 4, 5, 2, 7, 7, 0, 8, 7, 7]
+        # when
+        actual = m4(x_positions, y_positions, 8)
+        # then
+        expect = [0, 1, 2, 5, 6, 8, 9, 11]
+        self.assertListEqual(expect, actual)
+
+    def test_bounded_by_columns(self):
+        # given
+        x_positions = [x / 100 for x in range(10000)]
+        y_positions = [(x * 7919) % 101 for x in range(10000)]
+        # when
+        actual = m4(x_positions, y_positions, 400)
+        # then
+        self.assertLessEqual(len(actual), 400)
+        self.assertEqual(0, actual[0])
+        self.assertEqual(9999, actual[-1])
+        self.assertListEqual(sorted(set(actual)), actual)
+        self.assertIn(y_positions.index(100), actual)
+
+    def test_no_x_range(self):
+        # given
+        x_positions = [1] * 10
+        y_positions = list(range(10))
+        # when
+        actual = m4(x_positions, y_positions, 4)
+        # then
+        expect = [0, 9]
+        self.assertListEqual(expect, actual)
+
+    def test_pixel_columns(self):
+        # given - points off the pixel grid, so columns counted from the first point would straddle pixels
+        x_positions = [0.5 + x * 0.037 for x in range(1000)]
+        y_positions = [(x * 7919) % 101 for x in range(1000)]
+        # when
+        actual = m4(x_positions, y_positions, 4 * 38)
+        # then - each pixel keeps its own first, last, lowest and highest point
+        for pixel in range(38):
+            column = [index for index, x in enumerate(x_positions) if math.floor(x) == pixel]
+            expect = {column[0], column[-1], min(column, key=y_positions.__getitem__), max(column, key=y_positions.__getitem__)}
+            self.assertTrue(expect <= set(actual), pixel)
+
+    def test_rasterized_like_full_series(self):
+        # given
+        rng = random.Random(3)
+        x_positions = sorted(100.25 + rng.random() * 700 for _ in range(20000))
+        y_positions = [rng.gauss(300, 50) for _ in x_positions]
+        # when
+        kept = m4(x_positions, y_positions, 4 * 701)
+        # then
+        self.assertLess(len(kept), len(x_positions) / 5)
+        self.assertDictEqual(
+            rasterize(x_positions, y_positions),
+            rasterize([x_positions[index] for index in kept], [y_positions[index] for index in kept]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
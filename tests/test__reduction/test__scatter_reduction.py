@@ -0,0 +1,67 @@
+import math
+import unittest
+
+
+from pysvgchart.reduction import bin_positions, hex_bin, snap_to_grid
+
+
+class TestSnapToGrid(unittest.TestCase):
+    """
+    test the snap_to_grid() function
+    """
+
+    def test_drops_duplicates(self):
+        # given
+        x_positions = [1.0, 1.2, 3.0, 0.9, None]
+        y_positions = [1.0, 0.8, 3.0, 1.1, 2.0]
+        # when
+        actual = snap_to_grid(x_positions, y_positions)
+        # then
+        expect = [0, 2]
+        self.assertListEqual(expect, actual)
+
+    def test_cell_size(self):
+        # given
+        x_positions = [0, 4, 6, 14]
+        y_positions = [0, 0, 0, 0]
+        # when
+        actual = snap_to_grid(x_positions, y_positions, cell_size=10)
+        # then
+        expect = [0, 2]
+        self.assertListEqual(expect, actual)
+
+
+class TestBinPositions(unittest.TestCase):
+    """
+    test the bin_positions() function
+    """
+
+    def test_rect(self):
+        # given
+        x_positions = [1, 2, 11, 12, None]
+        y_positions = [1, 9, 1, 25, 1]
+        # when
+        actual = bin_positions(x_positions, y_positions, 10)
+        # then
+        expect = {(5.0, 5.0): 2, (15.0, 5.0): 1, (15.0, 25.0): 1}
+        self.assertDictEqual(expect, actual)
+
+    def test_hex_nearest_centre(self):
+        # given
+        cell_size = 10
+        row_height = cell_size * math.sqrt(3) / 2
+        # when
+        actual = [hex_bin(x, y, cell_size) for x, y in [(0.5, 0.5), (9.6, 0.2), (4.8, row_height - 0.3)]]
+        # then
+        expect = [(0.0, 0.0), (10.0, 0.0), (5.0, row_height)]
+        for e, a in zip(expect, actual):
+            self.assertAlmostEqual(e[0], a[0])
+            self.assertAlmostEqual(e[1], a[1])
+
+    def test_unknown_shape(self):
+        with self.assertRaises(ValueError):
+            bin_positions([1], [1], 10, "triangle")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 
 
 from pysvgchart.scales import LinearScale, LogarithmicScale, MappingScale
+from pysvgchart.shared import np
 
 
 class TestLinearScale(unittest.TestCase):
@@ -188,5 +189,63 @@ class TestMappingScale(unittest.TestCase):
             self.assertEqual(expect, actual.value_to_fraction(value), msg=f"failed for {value=} {index=}")
 
 
+class TestValueToFractions(unittest.TestCase):
+    """
+    test the value_to_fractions() method of the scales
+    """
+
+    def test__linear_list(self):
+        # given
+        scale = LinearScale([0, 10])
+        # when
+        actual = scale.value_to_fractions([0, 2.5, 10, 20])
+        # then
+        expect = [0.0, 0.25, 1.0, 2.0]
+        self.assertListEqual(expect, actual)
+
+    def test__mapping_list(self):
+        # given
+        scale = MappingScale(["a", "b"])
+        # when
+        actual = scale.value_to_fractions(["b", "a", "c"])
+        # then
+        expect = [0.75, 0.25, -1.0]
+        self.assertListEqual(expect, actual)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test__linear_array(self):
+        # given
+        scale = LinearScale([0, 10], shift=5)
+        values = np.array([5, 7.5, 10])
+        # when
+        actual = scale.value_to_fractions(values)
+        # then
+        expect = [scale.value_to_fraction(value) for value in values.tolist()]
+        self.assertListEqual(expect, actual.tolist())
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test__logarithmic_array(self):
+        # given
+        scale = LogarithmicScale([1, 10, 100])
+        values = np.array([1, 10, 100, 1000])
+        # when
+        actual = scale.value_to_fractions(values)
+        # then
+        expect = [0.0, 0.5, 1.0, 1.5]
+        for e, a in zip(expect, actual.tolist()):
+            self.assertAlmostEqual(e, a)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test__mapping_array(self):
+        # given
+        scale = MappingScale(["a", "b"])
+        values = np.array(["b", "a", "c", "b"])
+        # when
+        actual = scale.value_to_fractions(values)
+        # then
+        expect = [0.75, 0.25, -1.0, 0.75]
+        self.assertListEqual(expect, actual.tolist())
+
+
 if __name__ == "__main__":
     unittest.main()
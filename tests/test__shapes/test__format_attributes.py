@@ -0,0 +1,55 @@
+import unittest
+
+
+from pysvgchart.shapes import Circle, Line, format_attribute_items, format_attributes
+
+
+class TestFormatAttributes(unittest.TestCase):
+    """
+    test the format_attributes() function and the Element.attributes property
+    """
+
+    def test_styles_only(self):
+        # given
+        styles = {"stroke": "red", "stroke-width": "2"}
+        # when
+        actual = format_attributes(styles, [])
+        # then
+        expect = 'stroke="red" stroke-width="2"'
+        self.assertEqual(expect, actual)
+
+    def test_styles_and_classes(self):
+        # given
+        styles = {"stroke": "red"}
+        classes = ["foo", "bar"]
+        # when
+        actual = format_attributes(styles, classes)
+        # then
+        expect = 'stroke="red" class="foo bar"'
+        self.assertEqual(expect, actual)
+
+    def test_shared_styles_serialized_once(self):
+        # given
+        styles = {"stroke": "#123456", "stroke-width": "0.123"}
+        lines = [Line(x, 0, width=0, height=10, styles=styles) for x in range(10)]
+        format_attribute_items.cache_clear()
+        # when
+        actual = {line.attributes for line in lines}
+        # then
+        self.assertSetEqual({'stroke="#123456" stroke-width="0.123"'}, actual)
+        self.assertEqual(1, format_attribute_items.cache_info().misses)
+
+    def test_in_place_changes(self):
+        # given
+        circle = Circle(0, 0, radius=1, styles={"fill": "red"})
+        self.assertEqual('fill="red"', circle.attributes)
+        # when
+        circle.styles["fill"] = "blue"
+        circle.add_classes(["foo"])
+        # then
+        expect = 'fill="blue" class="foo"'
+        self.assertEqual(expect, circle.attributes)
+
+
+if __name__ == "__main__":
+    unittest.main()
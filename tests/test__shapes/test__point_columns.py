@@ -0,0 +1,63 @@
+import unittest
+
+
+from pysvgchart.series import LineSeries
+from pysvgchart.shapes import Point, PointColumns, Text
+
+
+class TestPointColumns(unittest.TestCase):
+    """
+    test the PointColumns class
+    """
+
+    def test_from_positions(self):
+        # given
+        x_positions = [10, 20, None]
+        y_positions = [1.5, None, 3]
+        # when
+        actual = PointColumns.from_positions(x_positions, y_positions)
+        # then
+        self.assertEqual(3, len(actual))
+        self.assertEqual(Point(20, None), actual[1])
+        self.assertListEqual([(10, 1.5), (20, None), (None, 3)], list(actual.positions()))
+
+    def test_from_points(self):
+        # given
+        points = [Point(1, 2), Point(3, 4)]
+        # when
+        actual = PointColumns.from_points(points)
+        # then
+        self.assertListEqual(points, list(actual))
+        self.assertEqual(points, actual)
+        self.assertIs(actual, PointColumns.from_points(actual))
+
+    def test_slice(self):
+        # given
+        columns = PointColumns.from_positions([1, 2, 3], [4, 5, 6])
+        # when
+        actual = columns[1:]
+        # then
+        self.assertIsInstance(actual, PointColumns)
+        self.assertListEqual([Point(2, 5), Point(3, 6)], list(actual))
+
+    def test_series_store_columns(self):
+        # given
+        points = [Point(1, 2), Point(3, 4)]
+        # when
+        series = LineSeries(points=points, x_values=[1, 2], y_values=[3, 4])
+        # then
+        self.assertIsInstance(series.points, PointColumns)
+        self.assertEqual(points, series.points)
+        self.assertEqual(Point(1, 2), series.position)
+
+    def test_slots(self):
+        # given
+        series = LineSeries(points=[Point(1, 2)], x_values=[1], y_values=[2])
+        # when
+        # then
+        for instance in (Point(1, 2), Text(1, 2, "a"), series):
+            self.assertFalse(hasattr(instance, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+
+from pysvgchart.shapes import Line, format_attributes
+from pysvgchart.styles import StyleInterner, active_style_interner
+
+
+class TestStyleInterner(unittest.TestCase):
+    """
+    test the StyleInterner class
+    """
+
+    def test_same_styles_same_class(self):
+        # given
+        interner = StyleInterner()
+        # when
+        first = interner.intern({"stroke": "red"}, [])
+        second = interner.intern({"stroke": "red"}, ["foo"])
+        third = interner.intern({"stroke": "blue"}, [])
+        # then
+        self.assertEqual(({}, ["psc-s0"]), first)
+        self.assertEqual(({}, ["psc-s0", "foo"]), second)
+        self.assertEqual(({}, ["psc-s1"]), third)
+        self.assertDictEqual({":where(.psc-s0)": {"stroke": "red"}, ":where(.psc-s1)": {"stroke": "blue"}}, interner.styles)
+
+    def test_non_css_attributes_stay_inline(self):
+        # given
+        interner = StyleInterner()
+        styles = {"stroke": "red", "transform": "rotate(-90 10 10)"}
+        # when
+        actual = interner.intern(styles, [])
+        # then
+        self.assertEqual(({"transform": "rotate(-90 10 10)"}, ["psc-s0"]), actual)
+
+    def test_nothing_to_intern(self):
+        # given
+        interner = StyleInterner()
+        # when
+        actual = interner.intern({"transform": "rotate(-90 10 10)"}, ["foo"])
+        # then
+        self.assertEqual(({"transform": "rotate(-90 10 10)"}, ["foo"]), actual)
+        self.assertDictEqual({}, interner.styles)
+
+    def test_lengths_get_units(self):
+        # given
+        interner = StyleInterner()
+        # when
+        interner.intern({"stroke-width": "2", "font-size": "1em", "fill-opacity": "0.5"}, [])
+        # then
+        expect = {":where(.psc-s0)": {"stroke-width": "2px", "font-size": "1em", "fill-opacity": "0.5"}}
+        self.assertDictEqual(expect, interner.styles)
+
+    def test_active_interner(self):
+        # given
+        line = Line(0, 0, width=0, height=10, styles={"stroke": "red"})
+        interner = StyleInterner()
+        # when
+        token = active_style_interner.set(interner)
+        try:
+            interned = line.attributes
+            formatted = format_attributes({"stroke": "red"}, ["foo"])
+        finally:
+            active_style_interner.reset(token)
+        # then
+        self.assertEqual('class="psc-s0"', interned)
+        self.assertEqual('class="psc-s0 foo"', formatted)
+        self.assertEqual('stroke="red"', line.attributes)
+
+
+if __name__ == "__main__":
+    unittest.main()
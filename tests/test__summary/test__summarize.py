@@ -0,0 +1,80 @@
+import datetime as dt
+import unittest
+
+
+from pysvgchart.summary import DATE, NUMBER, OTHER, summarize
+
+
+class TestSummarize(unittest.TestCase):
+
+    def test_integers(self):
+        # given
+        values = [3, 1, 4, 1, 5]
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(NUMBER, actual.kind)
+        self.assertEqual(5, actual.count)
+        self.assertEqual((1, 5), (actual.minimum, actual.maximum))
+        self.assertTrue(actual.all_int)
+        self.assertEqual(2, actual.unique_count)
+        self.assertTrue(actual.non_negative)
+        self.assertFalse(actual.non_positive)
+
+    def test_mixed_numbers(self):
+        # given
+        values = [-3, -1.5, 0]
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(NUMBER, actual.kind)
+        self.assertFalse(actual.all_int)
+        self.assertTrue(actual.non_positive)
+
+    def test_dates_and_datetimes(self):
+        # given
+        values = [dt.date(2024, 1, 1), dt.date(2024, 2, 1)]
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(DATE, actual.kind)
+        self.assertEqual(dt.date(2024, 2, 1), actual.maximum)
+
+    def test_other(self):
+        # given
+        values = ["a", 1, "b", "c"]
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(OTHER, actual.kind)
+        self.assertIsNone(actual.minimum)
+        self.assertEqual(2, actual.unique_count)
+
+    def test_unique_limit(self):
+        # given
+        values = [1, 1, 2, 2, 3, 3]
+        # when
+        actual = [summarize(values, unique_limit=limit).unique_count for limit in (2, 3, 10)]
+        # then
+        self.assertListEqual([2, 3, 3], actual)
+
+    def test_single_value(self):
+        # given
+        values = [7, 7, 7]
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(1, actual.unique_count)
+
+    def test_empty(self):
+        # given
+        values = []
+        # when
+        actual = summarize(values)
+        # then
+        self.assertEqual(0, actual.count)
+        self.assertEqual(0, actual.unique_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
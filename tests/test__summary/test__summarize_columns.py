@@ -0,0 +1,61 @@
+import datetime as dt
+import unittest
+
+
+from pysvgchart.summary import DATE, NUMBER, OTHER, SeriesColumns, summarize, summarize_columns
+
+
+class TestSummarizeColumns(unittest.TestCase):
+
+    def test_numbers(self):
+        # given
+        columns = [[3, 1, 4], [1.5, -9, 2]]
+        # when
+        actual = summarize_columns(columns)
+        # then
+        self.assertEqual(NUMBER, actual.kind)
+        self.assertEqual(6, actual.count)
+        self.assertEqual((-9, 4), (actual.minimum, actual.maximum))
+        self.assertFalse(actual.all_int)
+        self.assertEqual(2, actual.unique_count)
+
+    def test_empty_columns_skipped(self):
+        # given
+        columns = [[], [dt.date(2024, 1, 1), dt.date(2024, 3, 1)], []]
+        # when
+        actual = summarize_columns(columns)
+        # then
+        self.assertEqual(DATE, actual.kind)
+        self.assertEqual(2, actual.count)
+
+    def test_mixed_kinds(self):
+        # given
+        columns = [[1, 2], ["a", "b"]]
+        # when
+        actual = summarize_columns(columns, unique_limit=3)
+        # then
+        self.assertEqual(OTHER, actual.kind)
+        self.assertEqual(3, actual.unique_count)
+
+    def test_unique_across_columns(self):
+        # given
+        columns = [[5, 5], [5]]
+        # when
+        actual = summarize_columns(columns)
+        # then
+        self.assertEqual(1, actual.unique_count)
+
+    def test_series_columns(self):
+        # given
+        columns = SeriesColumns([[3, 1], (4, 1, 5)])
+        # when
+        actual = summarize(columns)
+        # then
+        self.assertEqual(5, len(columns))
+        self.assertListEqual([3, 1, 4, 1, 5], list(columns))
+        self.assertEqual((1, 5), (actual.minimum, actual.maximum))
+        self.assertTrue(actual.all_int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+
+from pysvgchart.charts import BarChart, HorizontalBarChart, LineChart
+from pysvgchart.templates import ChartTemplate
+
+
+def make_chart(chart_type, y_values, **kwargs):
+    chart = chart_type(x_values=[1, 2, 3, 4], y_values=y_values, y_names=["a", "b"], y_min=0, y_max=10, **kwargs)
+    chart.add_legend()
+    chart.add_grids(minor_y_ticks=2)
+    return chart
+
+
+class TestChartTemplate(unittest.TestCase):
+
+    def test_render_matches_chart(self):
+        # given
+        y_values = [[1, 5, 3, 10], [0, 2, 7, 4]]
+        for chart_type in (LineChart, BarChart):
+            template = ChartTemplate(
+                chart_type,
+                x_values=[1, 2, 3, 4],
+                y_names=["a", "b"],
+                y_min=0,
+                y_max=10,
+                calls=["add_legend", ("add_grids", {"minor_y_ticks": 2})],
+            )
+            # when
+            actual = template.render(y_values)
+            # then
+            self.assertEqual(make_chart(chart_type, y_values).render(), actual)
+
+    def test_series_calls_repeated(self):
+        # given
+        template = ChartTemplate(
+            "LineChart",
+            x_values=[1, 2, 3, 4],
+            y_names=["a", "b"],
+            y_min=0,
+            y_max=10,
+            calls=[("set_palette", [["red", "blue"]], {})],
+        )
+        # when
+        actual = template.stamp([[1, 2, 3, 4], [4, 3, 2, 1]])
+        # then
+        self.assertEqual("blue", actual.series["b"].styles["stroke"])
+        self.assertIsNot(template.chart.series["b"].styles, actual.series["b"].styles)
+
+    def test_template_unchanged(self):
+        # given
+        template = ChartTemplate("LineChart", x_values=[1, 2, 3, 4], y_names=["a"], y_min=0, y_max=10)
+        first = template.render([[1, 2, 3, 4]])
+        # when
+        template.render([[9, 9, 9, 9]])
+        # then
+        self.assertEqual(first, template.render([[1, 2, 3, 4]]))
+
+    def test_wrong_number_of_series(self):
+        # given
+        template = ChartTemplate("LineChart", x_values=[1, 2, 3, 4], y_names=["a", "b"], y_min=0, y_max=10)
+        # then
+        with self.assertRaises(ValueError):
+            template.render([[1, 2, 3, 4]])
+
+    def test_values_outside_bounds(self):
+        # given
+        template = ChartTemplate("LineChart", x_values=[1, 2, 3], y_names=["a", "b"], y_min=0, y_max=10)
+        # then
+        with self.assertRaisesRegex(ValueError, "'b'"):
+            template.render([[1, 5, 3], [1, 5, 30]])
+        with self.assertRaisesRegex(ValueError, "'a'"):
+            template.stamp([[-1, 5, 3], [1, 5, 3]])
+
+    def test_clip_to_bounds(self):
+        # given
+        for chart_type in (LineChart, BarChart):
+            template = ChartTemplate(chart_type, x_values=[1, 2, 3], y_names=["a"], y_min=0, y_max=10, clip=True)
+            # when
+            actual = template.render([[-5, 5, 30]])
+            # then
+            self.assertNotIn("None", actual)
+            self.assertEqual(template.render([[0, 5, 10]]), actual)
+
+    def test_needs_bounds(self):
+        # then
+        with self.assertRaises(ValueError):
+            ChartTemplate("LineChart", x_values=[1, 2], y_names=["a"], y_min=0, y_max=None)
+
+    def test_vertical_charts_only(self):
+        # then
+        with self.assertRaises(ValueError):
+            ChartTemplate(HorizontalBarChart, x_values=[1, 2], y_names=["a"], y_min=0, y_max=1)
@@ -578,3 +578,525 @@ def test_multi_series_still_works():
     svg = chart.render()
     assert '<svg' in svg
     assert len(chart.series) == 2
+
+
+# --- Streaming render tests ---
+
+def test_iter_render_matches_render():
+    """iter_render yields the same document as render, fragment by fragment."""
+    chart = psc.SimpleLineChart(
+        x_values=[1, 2, 3],
+        y_values=[[10, 20, 30], [15, 25, 35]],
+        y_names=['A', 'B'],
+    )
+    chart.add_legend()
+    fragments = list(chart.iter_render())
+    assert fragments[0].startswith('<svg')
+    assert fragments[-1] == '</svg>'
+    assert '\n'.join(fragments) == chart.render()
+
+
+def test_write_to_matches_render():
+    """write_to streams the same document as render to a file-like object."""
+    import io
+    chart = psc.DonutChart([11.3, 20, 30, 40])
+    chart.add_legend()
+    buffer = io.StringIO()
+    chart.write_to(buffer, include_default=False)
+    assert buffer.getvalue() == chart.render(include_default=False)
+
+
+# --- NumPy ingestion tests ---
+
+def test_numpy_arrays_render_like_lists():
+    """numpy arrays for x_values/y_values give the same chart as python lists."""
+    import pytest
+    np = pytest.importorskip("numpy")
+    x_values = np.arange(20)
+    y_values = np.vstack([np.arange(20) ** 2, np.arange(20) * 3.5])
+    from_arrays = psc.SimpleLineChart(x_values=x_values, y_values=y_values, y_names=['A', 'B'])
+    from_lists = psc.SimpleLineChart(x_values=x_values.tolist(), y_values=y_values.tolist(), y_names=['A', 'B'])
+    assert from_arrays.render() == from_lists.render()
+
+
+def test_numpy_arrays_for_categories():
+    """numpy arrays work for categorical axes of bar charts."""
+    import pytest
+    np = pytest.importorskip("numpy")
+    categories = np.array(['A', 'B', 'C'])
+    values = np.array([10, 20, 30])
+    from_arrays = psc.BarChart(x_values=categories, y_values=values, y_names=['Score'])
+    from_lists = psc.BarChart(x_values=categories.tolist(), y_values=values.tolist(), y_names=['Score'])
+    assert from_arrays.render() == from_lists.render()
+
+
+# --- Downsampling tests ---
+
+def dense_line_values(n=5000):
+    x_values = list(range(n))
+    y_values = [math.sin(x / 100) * 1000 + (x % 13) for x in x_values]
+    return x_values, y_values
+
+
+def test_line_chart_lttb_downsample():
+    """downsample='lttb' reduces each series to the point budget, keeping the end points."""
+    x_values, y_values = dense_line_values()
+    chart = psc.LineChart(x_values=x_values, y_values=[y_values], sec_y_values=[y_values], downsample='lttb', downsample_points=100)
+    for series in chart.series.values():
+        assert len(series.points) == 100
+        assert series.x_values[0] == 0 and series.x_values[-1] == len(x_values) - 1
+    assert chart.render().count(' L ') < 250
+
+
+def test_line_chart_lttb_default_budget():
+    """the default point budget is a multiple of the x-axis length."""
+    x_values, y_values = dense_line_values()
+    chart = psc.LineChart(x_values=x_values, y_values=[y_values], downsample='lttb')
+    assert len(chart.series['Series 1'].points) == 2 * chart.x_axis.length
+
+
+def test_line_chart_downsample_keep_full_hover():
+    """hover markers can still use every point of a downsampled series."""
+    x_values, y_values = dense_line_values(500)
+    reduced = psc.LineChart(x_values=x_values, y_values=[y_values], downsample='lttb', downsample_points=50)
+    full = psc.LineChart(x_values=x_values, y_values=[y_values], downsample='lttb', downsample_points=50, downsample_keep_full=True)
+    for chart in (reduced, full):
+        chart.add_hover_modifier(lambda position, **kwargs: [], radius=3)
+    assert len(reduced.series['Series 1'].custom_elements) == 50
+    assert len(full.series['Series 1'].custom_elements) == 500
+
+
+def test_line_chart_downsample_builds_kept_points_only():
+    """without keep_full, only the kept points of a downsampled series are made."""
+    from unittest.mock import patch
+    from pysvgchart import charts
+    x_values, y_values = dense_line_values(5000)
+    for keep_full, expected in ((False, 50), (True, 5000)):
+        with patch.object(charts, 'Point', wraps=charts.Point) as point:
+            psc.LineChart(x_values=x_values, y_values=[y_values], downsample='lttb', downsample_points=50,
+                          downsample_keep_full=keep_full)
+        assert point.call_count == expected
+
+
+def test_line_chart_unknown_downsample():
+    import pytest
+    x_values, y_values = dense_line_values(10)
+    with pytest.raises(ValueError):
+        psc.LineChart(x_values=x_values, y_values=[y_values], downsample='nope')
+
+
+def test_line_chart_m4_downsample():
+    """downsample='m4' keeps at most four points per pixel column the axis touches, on secondary axes too."""
+    x_values, y_values = dense_line_values(20000)
+    chart = psc.SimpleLineChart(x_values=x_values, y_values=[y_values], sec_y_values=[y_values], downsample='m4')
+    for series in chart.series.values():
+        assert len(series.points) <= 4 * (chart.x_axis.length + 1)
+        assert max(series.y_values) == max(y_values)
+        assert min(series.y_values) == min(y_values)
+
+
+def test_downsample_rejected_by_bar_and_scatter_charts():
+    """only line charts downsample, other charts reject the keywords naming their type."""
+    import pytest
+    x_values, y_values = dense_line_values(10)
+    for chart_type, downsample in ((psc.BarChart, 'lttb'), (psc.NormalisedBarChart, 'lttb'), (psc.ScatterChart, 'm4')):
+        with pytest.raises(ValueError, match=chart_type.__name__):
+            chart_type(x_values=x_values, y_values=[y_values], downsample=downsample)
+    with pytest.raises(ValueError, match='ScatterChart'):
+        psc.ScatterChart(x_values=x_values, y_values=[y_values], downsample_points=4)
+
+
+# --- Scatter reduction tests ---
+
+def dense_scatter_values(n=5000):
+    rng = random.Random(7)
+    x_values = [rng.random() for _ in range(n)]
+    y_values = [x * 0.5 + rng.random() * 0.5 for x in x_values]
+    return x_values, y_values
+
+
+def test_scatter_chart_grid_reduction():
+    """reduction='grid' keeps at most one point per grid cell."""
+    x_values, y_values = dense_scatter_values()
+    chart = psc.ScatterChart(x_values=x_values, y_values=[y_values], reduction='grid', cell_size=5)
+    points = chart.series['Series 1'].points
+    assert len(points) < len(x_values)
+    assert len({(p.x, p.y) for p in points}) == len(points)
+    chart.add_legend()
+    assert chart.render().count('<circle') == len(points) + 1
+
+
+def test_scatter_chart_density_reduction():
+    """reduction='density' renders one shaded cell per non-empty bin."""
+    x_values, y_values = dense_scatter_values()
+    for bin_shape, tag in (('rect', '<rect'), ('hex', '<path')):
+        chart = psc.ScatterChart(x_values=x_values, y_values=[y_values], reduction='density', bin_shape=bin_shape)
+        chart.add_legend()
+        svg = chart.render()
+        cells = chart.series['Series 1'].cells
+        assert sum(count for _, count in cells) == len(x_values)
+        assert svg.count('fill-opacity="1.0"') >= 1
+        assert svg.count(tag) >= len(cells)
+
+
+def test_scatter_chart_single_path():
+    """single_path renders all markers of a series as one path carrying the styles once."""
+    x_values, y_values = dense_scatter_values(200)
+    chart = psc.ScatterChart(x_values=x_values, y_values=[y_values, y_values], y_names=['A', 'B'], single_path=True)
+    chart.add_legend()
+    chart.add_hover_modifier(lambda position, **kwargs: [], radius=3)
+    svg = chart.render()
+    paths = chart.series['A'].get_element_list()[0]
+    assert paths.count('h0') == 200
+    assert 'stroke="green"' in paths and 'stroke-linecap="round"' in paths
+    assert svg.count('<path') == 2
+    assert svg.count('<circle') == 2 + 2 * 200  # legend markers and hover circles
+
+
+# --- Single path bar tests ---
+
+def test_bar_chart_single_path():
+    """single_path renders each bar series as one path with one closed rectangle per bar."""
+    values = [[10, 20, 30, 40], [30, 10, 10, 20]]
+    names = ['Apples', 'Bananas', 'Cherries', 'Durians']
+    for chart_type in (psc.BarChart, psc.NormalisedBarChart):
+        chart = chart_type(x_values=names, y_values=values, y_names=['Monday', 'Tuesday'], single_path=True)
+        chart.add_legend()
+        chart.add_hover_modifier(lambda position, **kwargs: [], radius=3)
+        svg = chart.render()
+        assert svg.count('<path') == 2
+        assert svg.count('Z') == 8
+        assert svg.count('<rect') == 2  # legend only
+        assert svg.count('class="psc-hover-group"') == 8
+
+
+def test_horizontal_bar_chart_single_path():
+    """single_path bars cover the same boxes as the rect bars."""
+    import re
+    values = [[-20, 30, -10, 40]]
+    categories = ['A', 'B', 'C', 'D']
+    rects = psc.HorizontalBarChart(x_values=values, y_values=categories, x_zero=True).render()
+    path = psc.HorizontalBarChart(x_values=values, y_values=categories, x_zero=True, single_path=True).render()
+    boxes = [tuple(map(float, box)) for box in re.findall(r'<rect x="([^"]+)" y="([^"]+)" width="([^"]+)" height="([^"]+)"', rects)]
+    path_boxes = [tuple(map(float, box)) for box in re.findall(r'M([^ ]+) ([^h]+)h([^v]+)v([^h]+)h[^Z]+Z', path)]
+    assert boxes == path_boxes
+
+
+# --- Style interning tests ---
+
+def test_intern_styles():
+    """intern_styles moves repeated inline styles to generated classes without changing other renders."""
+    chart = psc.LineChart(
+        x_values=list(range(10)),
+        y_values=[[x * x for x in range(10)], list(range(10))],
+        y_names=['Squares', 'Linear'],
+    )
+    chart.add_legend()
+    plain = chart.render()
+    interned = chart.render(intern_styles=True)
+    assert len(interned) < len(plain)
+    assert 'stroke="' not in interned
+    assert 'class="psc-s0"' in interned
+    assert interned.rindex('<style>') > interned.index('class="psc-s0"')
+    assert ':where(.psc-s0) {' in interned
+    assert chart.render() == plain
+    assert chart.render(intern_styles=True) == interned
+
+
+def test_intern_styles_yield_to_custom_styles():
+    """a custom class rule still wins over an interned style, as it did over the presentation attribute."""
+    import re
+    chart = psc.SimpleLineChart(x_values=[1, 2, 3], y_values=[[1, 2, 3]])
+    chart.add_hover_modifier(
+        lambda position, **kwargs: [
+            psc.Text(x=position.x, y=position.y, content='hover', classes=['psc-hover-data'], styles={'fill': 'red'})
+        ],
+        radius=5,
+    )
+    svg = chart.render(styles={'.psc-hover-data': {'fill': 'blue'}}, intern_styles=True)
+    classes = re.search(r'<text[^>]*class="([^"]*psc-hover-data[^"]*)"', svg).group(1).split()
+    # the cascade among the rules of single classes of the element: highest specificity, then latest, wins
+    fills = [
+        (0 if selector.startswith(':where(') else 1, position, fill)
+        for position, (selector, fill) in enumerate(re.findall(r'^(\S+) \{\s*fill: (\w+);', svg, re.MULTILINE))
+        if selector.removeprefix(':where(').strip('.)') in classes
+    ]
+    assert len(fills) == 2
+    assert max(fills)[2] == 'blue'
+
+
+# --- Coordinate precision tests ---
+
+def test_coordinate_precision():
+    """coordinate_precision rounds every coordinate and shrinks the output."""
+    import re
+    x_values = [x / 7 for x in range(50)]
+    y_values = [[x * x / 3 for x in x_values]]
+    full = psc.LineChart(x_values=x_values, y_values=y_values).render()
+    chart = psc.LineChart(x_values=x_values, y_values=y_values, coordinate_precision=1)
+    chart.add_legend()
+    rounded = chart.render()
+    assert len(rounded) < len(full)
+    numbers = re.findall(r'(?:x|y|x1|y1|x2|y2|width|height)="(-?[\d.]+)"', rounded)
+    numbers += re.findall(r'-?\d+\.\d+', re.search(r'<path d="([^"]+)"', rounded).group(1))
+    assert numbers
+    assert all(len(n.partition('.')[2]) <= 1 and not n.endswith('.0') for n in numbers)
+    chart.coordinate_precision = None
+    assert '.' in re.search(r'<path d="([^"]+)"', chart.render()).group(1)
+
+
+def test_coordinate_precision_with_shifted_out_points():
+    """points shifted out of the visible range render as they do without a precision."""
+    x_values = list(range(10))
+    y_values = [[x * 1.5 for x in x_values]]
+    plain = psc.SimpleLineChart(x_values=x_values, y_values=y_values, x_shift=2).render()
+    rounded = psc.SimpleLineChart(x_values=x_values, y_values=y_values, x_shift=2, coordinate_precision=1).render()
+    assert plain.count('None') == rounded.count('None') > 0
+
+
+def test_coordinate_precision_donut():
+    """coordinate_precision also applies to donut segments."""
+    import re
+    chart = psc.DonutChart([11.3, 20, 30, 40], coordinate_precision=0)
+    paths = re.findall(r'<path d="([^"]+)"', chart.render())
+    assert len(paths) == 4
+    assert all('.' not in path for path in paths)
+
+
+# --- Relative path encoding tests ---
+
+def decode_relative_line_path(path):
+    """absolute points of a path of M followed by relative l/h/v commands."""
+    import re
+    points = []
+    x = y = 0.0
+    for command, arguments in re.findall(r'([MlhvZ])([^MlhvZ]*)', path):
+        values = [float(v) for v in re.findall(r'-?(?:\d+\.?\d*|\.\d+)', arguments)]
+        if command == 'M':
+            x, y = values
+            points.append((x, y))
+        elif command == 'l':
+            for dx, dy in zip(values[::2], values[1::2]):
+                x, y = x + dx, y + dy
+                points.append((x, y))
+        elif command == 'h':
+            for dx in values:
+                x += dx
+                points.append((x, y))
+        elif command == 'v':
+            for dy in values:
+                y += dy
+                points.append((x, y))
+    return points
+
+
+def test_relative_path_encoding():
+    """relative path encoding draws the same line in fewer bytes."""
+    import re
+    x_values = list(range(200))
+    y_values = [[(x * 37) % 101 for x in x_values]]
+    absolute = psc.LineChart(x_values=x_values, y_values=y_values, coordinate_precision=2).render()
+    relative = psc.LineChart(x_values=x_values, y_values=y_values, coordinate_precision=2, path_encoding='relative').render()
+    assert len(relative) < len(absolute)
+    absolute_points = [tuple(map(float, p)) for p in re.findall(r'[ML] ([^ ]+) ([^ "]+)', re.search(r'<path d="([^"]+)"', absolute).group(1))]
+    relative_points = decode_relative_line_path(re.search(r'<path d="([^"]+)"', relative).group(1))
+    assert len(relative_points) == len(absolute_points)
+    assert all(abs(a - b) < 1e-6 for p, q in zip(absolute_points, relative_points) for a, b in zip(p, q))
+
+
+def test_relative_path_encoding_donut():
+    """donut segments use relative arcs when the path encoding is relative."""
+    import re
+    chart = psc.DonutChart([11.3, 20, 30, 40], path_encoding='relative')
+    paths = re.findall(r'<path d="([^"]+)"', chart.render())
+    assert len(paths) == 4
+    assert all(path.startswith('M') and 'a' in path and 'A' not in path for path in paths)
+
+
+def test_unknown_path_encoding():
+    """an unknown path encoding is rejected."""
+    import pytest
+    with pytest.raises(ValueError):
+        psc.DonutChart([1, 2], path_encoding='compressed')
+
+
+# --- Series columns tests ---
+
+def test_y_axis_from_series_columns():
+    """the y-axis is scaled from the series as they are, without concatenating them."""
+    from pysvgchart.summary import SeriesColumns
+    y_values = [[1, 5, 3], [-2, 4, 8]]
+    chart = psc.LineChart(x_values=[1, 2, 3], y_values=y_values, sec_y_values=[[0.5, 0.25, 0.75]])
+    assert isinstance(chart.y_axis.data_points, SeriesColumns)
+    assert chart.y_axis.data_points.columns[1] is y_values[1]
+    flat = psc.LineChart(x_values=list(range(6)), y_values=[[1, 5, 3, -2, 4, 8]])
+    assert chart.y_axis.scale.ticks == flat.y_axis.scale.ticks
+    assert chart.sec_y_axis.scale.ticks[0] == 0
+
+
+def test_y_axis_from_numpy_columns():
+    """numpy series are summarized in place, with the same ticks as lists."""
+    import pytest
+    np = pytest.importorskip('numpy')
+    y_values = np.array([[1, 5, 3], [-2, 4, 8]])
+    chart = psc.LineChart(x_values=[1, 2, 3], y_values=y_values)
+    assert chart.y_axis.scale.ticks == psc.LineChart(x_values=[1, 2, 3], y_values=y_values.tolist()).y_axis.scale.ticks
+
+
+# --- Lazy series tests ---
+
+def test_x_positions_once_per_chart():
+    """the x values are positioned once per chart, shared by primary and secondary series, eager or lazy."""
+    from unittest.mock import patch
+    x_values = list(range(20))
+    y_values = [[x * x for x in x_values], [x * 3 for x in x_values]]
+    get_positions = psc.charts.XAxis.get_positions
+    for chart_type in (psc.LineChart, psc.BarChart, psc.ScatterChart):
+        for lazy in (False, True):
+            with patch.object(psc.charts.XAxis, 'get_positions', autospec=True, side_effect=get_positions) as spy:
+                chart = chart_type(x_values=x_values, y_values=y_values, sec_y_values=y_values, lazy=lazy)
+                chart.render()
+            assert [c for c in spy.call_args_list if c.args[1] is x_values] == [((chart.x_axis, x_values),)]
+
+
+def test_lazy_series():
+    """lazy series compute their positions on first use and render the same as eager ones."""
+    x_values = list(range(20))
+    y_values = [[x * x for x in x_values], [x * 3 for x in x_values]]
+    for chart_type in (psc.LineChart, psc.BarChart, psc.ScatterChart):
+        eager = chart_type(x_values=x_values, y_values=y_values)
+        lazy = chart_type(x_values=x_values, y_values=y_values, lazy=True)
+        series = lazy.series['Series 1']
+        assert callable(series._points)
+        assert series.position == eager.series['Series 1'].position
+        assert not callable(series._points)
+        assert lazy.render() == eager.render()
+
+
+def test_lazy_series_hover():
+    """hover modifiers of lazy series see the computed positions."""
+    def hover(position, **kwargs):
+        return [psc.Text(position.x, position.y, 'x')]
+
+    eager = psc.LineChart(x_values=[1, 2, 3], y_values=[[4, 5, 6]])
+    lazy = psc.LineChart(x_values=[1, 2, 3], y_values=[[4, 5, 6]], lazy=True)
+    for chart in (eager, lazy):
+        chart.add_hover_modifier(hover, radius=3)
+    assert lazy.render() == eager.render()
+    assert lazy.render().count('class="psc-hover-group"') == 3
+
+
+# --- Async render tests ---
+
+def test_render_async():
+    """charts render off the event loop with the same output, in threads or processes."""
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    chart = psc.SimpleLineChart(x_values=[1, 2, 3], y_values=[[10, 20, 15]], y_names=['Sales'])
+    chart.add_legend()
+
+    async def render_both():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return await chart.render_async(intern_styles=True), await chart.render_async(executor=executor)
+
+    in_thread, in_process = asyncio.run(render_both())
+    assert in_thread == chart.render(intern_styles=True)
+    assert in_process == chart.render()
+
+
+def test_charts_with_options_pickle():
+    """charts built with log scales, laziness, downsampling or reduction round-trip through pickle for process executors."""
+    import pickle
+    x_values, y_values = dense_line_values(2000)
+    positive = [abs(y) + 1 for y in y_values]
+    charts = [
+        psc.SimpleLineChart(x_values=[x + 1 for x in x_values], y_values=[positive], x_log=True, y_log=True),
+        psc.LineChart(x_values=x_values, y_values=[y_values], lazy=True),
+        psc.LineChart(x_values=x_values, y_values=[y_values], downsample='m4', downsample_keep_full=True),
+        psc.BarChart(x_values=x_values[:20], y_values=[y_values[:20]], lazy=True, single_path=True),
+        psc.ScatterChart(x_values=x_values, y_values=[y_values], reduction='density', bin_shape='hex'),
+    ]
+    for chart in charts:
+        assert pickle.loads(pickle.dumps(chart)).render() == chart.render()
+
+
+# --- Chart template tests ---
+
+def test_chart_template():
+    """a template renders each dataset as the equivalent chart would, including interned styles."""
+    x_values = list(range(10))
+    datasets = [[[x * k for x in x_values], [90 - x * k for x in x_values]] for k in (1, 5, 9)]
+    template = psc.ChartTemplate(
+        psc.LineChart,
+        x_values=x_values,
+        y_names=['Up', 'Down'],
+        y_min=0,
+        y_max=90,
+        calls=['add_legend', ('add_grids', {'minor_y_ticks': 4})],
+        intern_styles=True,
+    )
+    for y_values in datasets:
+        chart = psc.LineChart(x_values=x_values, y_values=y_values, y_names=['Up', 'Down'], y_min=0, y_max=90)
+        chart.add_legend()
+        chart.add_grids(minor_y_ticks=4)
+        assert template.render(y_values) == chart.render(intern_styles=True)
+
+
+# --- Small multiples tests ---
+
+def test_small_multiples():
+    """faceted panels share one style block, one scale and one frame of axes."""
+    x_values = list(range(30))
+    datasets = [[[random.randint(0, 100) for _ in x_values]] for _ in range(16)]
+    grid = psc.ChartGrid.facet(
+        psc.SimpleLineChart,
+        x_values=x_values,
+        datasets=datasets,
+        columns=4,
+        gap=10,
+        width=200,
+        height=100,
+        left_margin=30,
+        right_margin=10,
+        y_margin=15,
+        y_max_ticks=3,
+    )
+    svg = grid.render(intern_styles=True)
+    write_out(svg, 'small_multiples.svg')
+    assert svg.count('<style>') == 2
+    assert svg.count('<use href="#psc-frame"/>') == 16
+    separate = ''.join(chart.render() for chart in grid.charts)
+    assert len(svg) < len(separate) / 2
+
+
+# --- Instrumentation tests ---
+
+def test_instrumentation():
+    """each phase and rendered component is reported, and rendering is unchanged."""
+    x_values = list(range(50))
+    y_values = [[x % 7 for x in x_values], [x % 5 for x in x_values]]
+    with psc.instrument() as events:
+        chart = psc.LineChart(x_values=x_values, y_values=y_values, y_names=['a', 'b'])
+        chart.add_legend()
+        chart.add_hover_modifier(lambda position, **kwargs: [], radius=2)
+        svg = chart.render()
+    assert svg == chart.render()
+    phases = [(event.phase, event.name) for event in events]
+    assert phases == [
+        ('scale', 'make_linear_scale'),
+        ('scale', 'make_linear_scale'),
+        ('series', 'line_series_constructor'),
+        ('hover', 'add_hover_modifier'),
+        ('render', 'x_axis'),
+        ('render', 'y_axis'),
+        ('render', 'legend'),
+        ('render', 'series a'),
+        ('render', 'series b'),
+        ('render', 'custom_elements'),
+        ('render', 'join'),
+    ]
+    components = [event for event in events if event.phase == 'render' and event.name != 'join']
+    join = events[-1]
+    assert join.bytes == len(svg.encode())
+    assert sum(event.elements for event in components) < join.elements
+    assert events[2].elements == 2